@@ -6,32 +6,68 @@ Este arquivo define configurações para evitar o erro -1003 (IP banned)
 e usar a API de forma eficiente.
 """
 
+import random
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from types import MappingProxyType
+
 # Configurações de Rate Limiting
-RATE_LIMIT_CONFIG = {
-    'max_requests_per_minute': 1000,  # Margem de segurança (limite real é 1200)
-    'max_requests_per_second': 18,    # Margem de segurança (limite real é 20)
-    'ban_cooldown_seconds': 60,       # Tempo para aguardar após detectar rate limit
-    'request_delay_seconds': 0.1,     # Delay mínimo entre requisições
-}
+@dataclass(frozen=True, slots=True)
+class RateLimitCfg:
+    max_requests_per_minute: int = 1000   # Margem de segurança (limite real é 1200)
+    max_requests_per_second: int = 18     # Margem de segurança (limite real é 20)
+    ban_cooldown_seconds: int = 300       # Espera mínima após ban de IP (418/-1003)
+    request_delay_seconds: float = 0.1    # Delay mínimo entre requisições
+    aimd_increase: float = 0.5            # Aumento da taxa (req/s) por resposta OK
+    aimd_decrease: float = 0.5            # Fator de redução da taxa em 429/418
+    backoff_base_seconds: float = 1.0     # Espera base do backoff exponencial
+    backoff_max_seconds: float = 600      # Espera máxima do backoff
+    weight_limit_per_minute: int = 2400   # Limite de peso por minuto (X-MBX-USED-WEIGHT-1M)
+    weight_pause_ratio: float = 0.9       # Fração do peso que pausa até a próxima janela
 
 # Configurações de WebSocket
-WEBSOCKET_CONFIG = {
-    'auto_restart': True,             # Reinicia automaticamente em caso de erro
-    'reconnect_delay': 5,             # Segundos para aguardar antes de reconectar
-    'max_reconnect_attempts': 3,      # Máximo de tentativas de reconexão
-    'heartbeat_interval': 30,         # Intervalo de heartbeat em segundos
-}
+@dataclass(frozen=True, slots=True)
+class WebSocketCfg:
+    auto_restart: bool = True             # Reinicia automaticamente em caso de erro
+    reconnect_delay: int = 5              # Segundos para aguardar antes de reconectar
+    reconnect_max_delay: int = 30         # Teto do backoff de reconexão
+    max_reconnect_attempts: int = 3       # Máximo de tentativas de reconexão
+    heartbeat_interval: int = 30          # Intervalo de heartbeat em segundos
+
+# Instâncias únicas para acesso por atributo nos caminhos críticos
+RATE_LIMIT = RateLimitCfg()
+WEBSOCKET = WebSocketCfg()
+
+# Versões em dicionário mantidas por compatibilidade (get_config)
+RATE_LIMIT_CONFIG = asdict(RATE_LIMIT)
+WEBSOCKET_CONFIG = asdict(WEBSOCKET)
+
+def compute_reconnect_delay(attempt: int) -> float:
+    """
+    Calcula a espera antes de reconectar o WebSocket.
+    
+    Backoff exponencial limitado com jitter de ±25%, para que várias
+    instâncias não reconectem todas no mesmo instante.
+    
+    Args:
+        attempt: Número da tentativa (0 para a primeira)
+        
+    Returns:
+        Segundos de espera
+    """
+    delay = min(WEBSOCKET.reconnect_max_delay, WEBSOCKET.reconnect_delay * (2 ** attempt))
+    return delay * random.uniform(0.75, 1.25)
 
 # Configurações de Cache/Dados
 DATA_CONFIG = {
     'max_data_age_hours': 24,         # Idade máxima dos dados em cache
     'cleanup_interval_minutes': 60,   # Intervalo para limpeza automática
-    'max_symbols_per_stream': 100,    # Máximo de símbolos por stream
+    'max_symbols_per_stream': 200,    # Streams por conexão combinada (limite dos futuros)
     'buffer_size': 1000,              # Tamanho do buffer de dados
 }
 
 # Símbolos recomendados para trading
-RECOMMENDED_SYMBOLS = [
+RECOMMENDED_SYMBOLS_ORDERED = (
     'BTCUSDT',   # Bitcoin
     'ETHUSDT',   # Ethereum
     'BNBUSDT',   # Binance Coin
@@ -42,17 +78,19 @@ RECOMMENDED_SYMBOLS = [
     'AVAXUSDT',  # Avalanche
     'MATICUSDT', # Polygon
     'LINKUSDT',  # Chainlink
-]
+)
+RECOMMENDED_SYMBOLS = frozenset(RECOMMENDED_SYMBOLS_ORDERED)  # Validação O(1)
 
 # Intervalos recomendados
-RECOMMENDED_INTERVALS = [
+RECOMMENDED_INTERVALS_ORDERED = (
     '1m',   # 1 minuto
     '5m',   # 5 minutos
     '15m',  # 15 minutos
     '1h',   # 1 hora
     '4h',   # 4 horas
     '1d',   # 1 dia
-]
+)
+RECOMMENDED_INTERVALS = frozenset(RECOMMENDED_INTERVALS_ORDERED)  # Validação O(1)
 
 # Configurações de logging
 LOGGING_CONFIG = {
@@ -99,10 +137,24 @@ MONITORING_CONFIG = {
 }
 
 # Função para obter configuração específica
+# Mapa somente leitura de seções, montado uma única vez na importação
+_CONFIGS = MappingProxyType({
+    'rate_limit': RATE_LIMIT_CONFIG,
+    'websocket': WEBSOCKET_CONFIG,
+    'data': DATA_CONFIG,
+    'logging': LOGGING_CONFIG,
+    'security': SECURITY_CONFIG,
+    'data_types': DATA_TYPES_CONFIG,
+    'monitoring': MONITORING_CONFIG,
+})
+
+@lru_cache(maxsize=None)
 def get_config(section: str, key: str = None):
     """
     Obtém configuração específica.
     
+    As seções são constantes de módulo, então o resultado é memoizado.
+    
     Args:
         section: Seção da configuração
         key: Chave específica (opcional)
@@ -110,20 +162,9 @@ def get_config(section: str, key: str = None):
     Returns:
         Valor da configuração ou seção completa
     """
-    configs = {
-        'rate_limit': RATE_LIMIT_CONFIG,
-        'websocket': WEBSOCKET_CONFIG,
-        'data': DATA_CONFIG,
-        'logging': LOGGING_CONFIG,
-        'security': SECURITY_CONFIG,
-        'data_types': DATA_TYPES_CONFIG,
-        'monitoring': MONITORING_CONFIG,
-    }
-    
-    if section not in configs:
-        return None
+    section_config = _CONFIGS.get(section)
     
-    if key is None:
-        return configs[section]
+    if key is None or section_config is None:
+        return section_config
     
-    return configs[section].get(key)
+    return section_config.get(key)
@@ -6,13 +6,17 @@ Arquivo central de configurações do sistema de trading.
 """
 
 import os
+import atexit
 import logging
-from typing import Dict, List
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import Queue
+from typing import Dict, List, Tuple
 
-# Configurações da API Binance
+from config.binance_safe_config import get_config
+
+# Configurações da API Binance (credenciais via get_binance_credentials)
 BINANCE_CONFIG = {
-    'KEY': os.environ.get('BINANCE_KEY', 'IiPTCvu1AAziLvdusHHkCus5NCpwU0mQ0vMcZnRLwZeFNCA3ODdEIgHYLrDsPYij'),
-    'SECRET': os.environ.get('BINANCE_SECRET', 'sUdrgJMQ15FceuPSLjc5NkKY951iWTUvBJmOGUgmhPln05f3jHHEBfnKPuRLnEbe'),
     'BASE_URL': 'https://fapi.binance.com',
     'TESTNET': False
 }
@@ -73,20 +77,79 @@ DATA_CONFIG = {
     'max_cache_size': 1000000000  # 1GB máximo de cache
 }
 
+_log_listener = None
+
 def setup_logging():
-    """Configura o sistema de logging."""
+    """
+    Configura o sistema de logging uma única vez por processo.
+    
+    O root logger recebe apenas um QueueHandler; a escrita em arquivo e no
+    console acontece em uma thread do QueueListener, fora do caminho das
+    requisições. Chamadas repetidas (ex.: a cada rerun do Streamlit) não
+    recriam os handlers.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    formatter = logging.Formatter(LOGGING_CONFIG['format'])
+    handlers = [
+        # Arquivo com rotação por tamanho (limites em binance_safe_config)
+        RotatingFileHandler(
+            LOGGING_CONFIG['filename'],
+            maxBytes=get_config('logging', 'max_file_size'),
+            backupCount=get_config('logging', 'backup_count')
+        ),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = Queue(-1)
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    # A mensagem é formatada de fato pelos handlers do listener
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # force=True substitui handlers criados por basicConfig em outros módulos
     logging.basicConfig(
         level=LOGGING_CONFIG['level'],
-        format=LOGGING_CONFIG['format'],
-        handlers=[
-            logging.FileHandler(LOGGING_CONFIG['filename']),
-            logging.StreamHandler()
-        ]
+        handlers=[queue_handler],
+        force=True
     )
 
+@lru_cache(maxsize=1)
+def get_binance_credentials() -> Tuple[str, str]:
+    """
+    Obtém as credenciais da API Binance uma única vez.
+    
+    Lê as variáveis de ambiente BINANCE_KEY/BINANCE_SECRET e, na falta delas,
+    o arquivo api_config.py gerado pelo setup.py. Nenhuma chave fica no código.
+    
+    Returns:
+        Tupla (KEY, SECRET); strings vazias se não configuradas
+    """
+    key = os.environ.get('BINANCE_KEY')
+    secret = os.environ.get('BINANCE_SECRET')
+    
+    if not key or not secret:
+        try:
+            from api_config import BINANCE_KEY, BINANCE_SECRET
+            key = key or BINANCE_KEY
+            secret = secret or BINANCE_SECRET
+        except ImportError:
+            pass
+    
+    return key or '', secret or ''
+
 def validate_api_config() -> bool:
     """Valida se as configurações da API estão corretas."""
+    key, secret = get_binance_credentials()
     return (
-        BINANCE_CONFIG['KEY'] != 'COLOQUE_SUA_BINANCE_API_KEY_AQUI' and
-        BINANCE_CONFIG['SECRET'] != 'COLOQUE_SUA_BINANCE_API_SECRET_AQUI'
+        bool(key and secret) and
+        key != 'COLOQUE_SUA_BINANCE_API_KEY_AQUI' and
+        secret != 'COLOQUE_SUA_BINANCE_API_SECRET_AQUI'
     )
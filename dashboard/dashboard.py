@@ -6,36 +6,99 @@ Interface web para visualização e análise de dados de trading.
 """
 
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import logging
+import hashlib
+import html
+import pickle
+import struct
 import time
 from datetime import datetime
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from collections import namedtuple
 import sys
 import os
-import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Adiciona o diretório src ao path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.data.data_manager import get_data_manager
 from src.indicators.renko import gerar_renko
-from src.indicators.stoch_rsi import stochrsi
+from src.indicators.stoch_rsi import stochrsi, stochrsi_panel
 from src.data.trading_pairs import get_pairs_manager
+from src.api.rate_limit import TokenBucket, TokenBucketLimiter
+from src.utils.timeframe_utils import candle_open_time, get_timeframe_minutes
 from config.settings import DASHBOARD_CONFIG, setup_logging
 
+# Cache em disco da matriz (opcional): sobrevive a reinícios do servidor
+try:
+    from diskcache import Cache as DiskCache
+except ImportError:
+    DiskCache = None
+
 # Configurar logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Pares por modo, calculados uma única vez na importação
+try:
+    from trading_pairs import TRADING_PAIRS as _ALL_PAIRS
+    ALL_TRADING_PAIRS = tuple(_ALL_PAIRS)
+except ImportError:
+    ALL_TRADING_PAIRS = ()
+
+TEST_MODE_PAIRS = ('BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'SOLUSDT', 'ADAUSDT')
+
+# Usa os primeiros 20 pares para o modo padrão
+DEFAULT_MODE_PAIRS = ALL_TRADING_PAIRS[:20] or (
+    'BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'SOLUSDT', 'XRPUSDT',
+    'ADAUSDT', 'DOGEUSDT', 'AVAXUSDT', 'TRXUSDT', 'LINKUSDT',
+    'DOTUSDT', 'MATICUSDT', 'LTCUSDT', 'SHIBUSDT', 'UNIUSDT',
+    'ATOMUSDT', 'ETCUSDT', 'XLMUSDT', 'BCHUSDT', 'FILUSDT'
+)
+
+_PAIRS_BY_MODE = {
+    "all_pairs": ALL_TRADING_PAIRS,
+    "test_mode": TEST_MODE_PAIRS,
+    "default": DEFAULT_MODE_PAIRS,
+}
+
+# Opções de auto-refresh (rótulo -> segundos), com buscas reversas pré-calculadas
+# (somente leitura: compartilhadas entre sessões)
+REFRESH_OPTIONS = MappingProxyType(dict(DASHBOARD_CONFIG['auto_refresh_options']))
+_REFRESH_LABELS = tuple(REFRESH_OPTIONS)
+_REFRESH_VALUE_TO_LABEL = MappingProxyType({value: label for label, value in REFRESH_OPTIONS.items()})
+# Rótulo padrão já validado contra as opções disponíveis
+_DEFAULT_REFRESH_LABEL = _REFRESH_VALUE_TO_LABEL.get(
+    DASHBOARD_CONFIG['auto_refresh_interval'],
+    '2 horas' if '2 horas' in REFRESH_OPTIONS else _REFRESH_LABELS[0]
+)
+
+# Modo vindo da linha de comando: argv não muda durante o processo
+_ARGV_MODE = next(
+    (
+        mode
+        for arg in sys.argv[1:]
+        for flag, mode in (("--all-pairs", "all_pairs"), ("--test-mode", "test_mode"))
+        if arg == flag
+    ),
+    None
+)
+
 def get_dashboard_mode():
     """Detecta o modo do dashboard baseado nos argumentos."""
-    # Verifica argumentos da linha de comando
-    if len(sys.argv) > 1:
-        for arg in sys.argv[1:]:
-            if arg == "--all-pairs":
-                return "all_pairs"
-            elif arg == "--test-mode":
-                return "test_mode"
+    # Argumentos da linha de comando têm prioridade
+    if _ARGV_MODE:
+        return _ARGV_MODE
     
     # Verifica query parameters do Streamlit
     query_params = st.query_params
@@ -47,56 +110,792 @@ def get_dashboard_mode():
     return "default"
 
 def get_trading_pairs_for_mode(mode):
-    """Retorna os pares de trading baseado no modo."""
-    if mode == "all_pairs":
-        try:
-            from trading_pairs import TRADING_PAIRS
-            return TRADING_PAIRS
-        except ImportError:
-            st.error("❌ Arquivo trading_pairs.py não encontrado!")
-            return []
+    """Retorna os pares de trading baseado no modo (tupla pré-calculada)."""
+    if mode == "all_pairs" and not ALL_TRADING_PAIRS:
+        st.error("❌ Arquivo trading_pairs.py não encontrado!")
     
-    elif mode == "test_mode":
-        return ['BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'SOLUSDT', 'ADAUSDT']
+    return _PAIRS_BY_MODE.get(mode, DEFAULT_MODE_PAIRS)
+
+@st.cache_resource
+def get_shared_data_manager():
+    """
+    Retorna o DataManager compartilhado por todas as sessões.
     
-    else:  # default
-        try:
-            from trading_pairs import TRADING_PAIRS
-            # Usa os primeiros 20 pares para o modo padrão
-            return TRADING_PAIRS[:20]
-        except ImportError:
-            return [
-                'BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'SOLUSDT', 'XRPUSDT',
-                'ADAUSDT', 'DOGEUSDT', 'AVAXUSDT', 'TRXUSDT', 'LINKUSDT',
-                'DOTUSDT', 'MATICUSDT', 'LTCUSDT', 'SHIBUSDT', 'UNIUSDT',
-                'ATOMUSDT', 'ETCUSDT', 'XLMUSDT', 'BCHUSDT', 'FILUSDT'
-            ]
+    O cache_resource cria a instância uma única vez por processo, com lock,
+    mesmo quando várias sessões iniciam ao mesmo tempo.
+    """
+    return get_data_manager()
+
+@st.cache_resource
+def get_shared_pairs_manager():
+    """Retorna o TradingPairsManager compartilhado por todas as sessões."""
+    return get_pairs_manager()
+
+# Diretório, limite e validade do cache em disco
+DISK_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '.st_cache')
+DISK_CACHE_SIZE_LIMIT = 2 ** 30  # 1GB
+DISK_CACHE_TTL = 3600  # 1 hora
+
+def pack_cache_entry(obj):
+    """
+    Serializa um objeto para o cache em disco com pickle protocolo 5.
+    
+    Os arrays numpy (blocos dos DataFrames) saem como buffers fora de banda e
+    são concatenados sem cópias intermediárias. O resultado é um único bytes,
+    que o diskcache grava direto, sem um segundo pickle.
+    
+    Args:
+        obj: Objeto a serializar
+        
+    Returns:
+        Bytes no formato: quantidade de partes, tamanhos, cabeçalho, buffers
+    """
+    buffers = []
+    header = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    parts = [header, *(buffer.raw() for buffer in buffers)]
+    # raw() expõe cada buffer como bytes contíguos, então len() é o tamanho em bytes
+    sizes = struct.pack(f'<I{len(parts)}Q', len(parts), *map(len, parts))
+    return b''.join([sizes, *parts])
+
+def unpack_cache_entry(blob):
+    """
+    Reconstrói um objeto gravado por pack_cache_entry.
+    
+    Os buffers são fatias do próprio blob, então os arrays são recriados sem
+    copiar os dados (e ficam somente leitura).
+    
+    Args:
+        blob: Bytes gerados por pack_cache_entry
+        
+    Returns:
+        Objeto original
+    """
+    view = memoryview(blob)
+    (count,) = struct.unpack_from('<I', view)
+    sizes = struct.unpack_from(f'<{count}Q', view, 4)
+    
+    parts = []
+    offset = 4 + 8 * count
+    for size in sizes:
+        parts.append(view[offset:offset + size])
+        offset += size
+    
+    return pickle.loads(parts[0], buffers=parts[1:])
+
+@st.cache_resource
+def get_disk_cache():
+    """
+    Retorna o cache em disco compartilhado por todas as sessões.
+    
+    Returns:
+        Instância de diskcache.Cache, ou None se diskcache não estiver
+        instalado ou o diretório não puder ser aberto
+    """
+    if DiskCache is None:
+        return None
+    
+    try:
+        return DiskCache(DISK_CACHE_DIR, size_limit=DISK_CACHE_SIZE_LIMIT)
+    except Exception as e:
+        logger.warning(f"Cache em disco indisponível: {e}")
+        return None
+
+def read_only_frame(data):
+    """
+    Copia os candles para um array somente leitura.
+    
+    Escritas no lugar (loc/iloc/at) sobre o resultado levantam ValueError em
+    vez de alterar silenciosamente o objeto compartilhado pelo cache.
+    
+    Args:
+        data: DataFrame OHLCV (colunas numéricas)
+        
+    Returns:
+        DataFrame com o mesmo índice e colunas sobre um array imutável
+    """
+    values = data.to_numpy(dtype=np.float64, copy=True)
+    values.flags.writeable = False
+    return pd.DataFrame(values, index=data.index, columns=data.columns, copy=False)
+
+def load_symbol_data(symbol, interval, brick_size, pacer=None):
+    """
+    Busca dados OHLCV de um par/intervalo direto do DataManager, sem cache.
+    
+    Args:
+        symbol: Par de trading
+        interval: Intervalo de tempo
+        brick_size: Tamanho do tijolo Renko
+        pacer: Limitador de ritmo da coleta (opcional)
+        
+    Returns:
+        DataFrame OHLCV somente leitura
+        
+    Raises:
+        ValueError: Se nenhum dado foi obtido (a falha não entra no cache)
+    """
+    if pacer is not None:
+        pacer.acquire()
+    
+    data = get_shared_data_manager().get_symbol_data(
+        symbol,
+        interval,
+        brick_size=brick_size,
+        extend_to_current=True  # Sempre busca dados até o momento atual
+    )
+    
+    # get_symbol_data devolve DataFrame vazio em caso de erro
+    if data is None or data.empty:
+        raise ValueError(f"Nenhum dado obtido para {symbol} {interval}")
+    
+    return read_only_frame(data)
+
+@st.cache_resource(ttl=86400, max_entries=2000, show_spinner=False)
+def fetch_symbol_data(symbol, interval, brick_size, candle_open, _pacer=None):
+    """
+    Busca dados OHLCV de um par/intervalo com cache do Streamlit.
+    
+    A abertura do candle atual faz parte da chave: quando um novo candle
+    fecha a chave muda e os dados são buscados de novo; até lá, reruns e
+    mudanças de configuração reutilizam o resultado.
+    
+    Com cache_resource o mesmo DataFrame é devolvido a cada acerto, sem a
+    cópia (pickle) do cache_data. Os valores são somente leitura e
+    fetch_pair_interval entrega uma cópia rasa a cada chamador. Buscas sem
+    dados levantam ValueError e por isso não são guardadas.
+    
+    Args:
+        symbol: Par de trading
+        interval: Intervalo de tempo
+        brick_size: Tamanho do tijolo Renko
+        candle_open: Epoch de abertura do candle atual (chave de invalidação)
+        _pacer: Limitador de ritmo da coleta (fora da chave do cache)
+        
+    Returns:
+        DataFrame OHLCV somente leitura
+    """
+    # Só consome token quando o cache do Streamlit não tem o dado
+    return load_symbol_data(symbol, interval, brick_size, pacer=_pacer)
+
+class RateLimitHandler(logging.Handler):
+    """Handler que guarda as mensagens de rate limiting em uma lista."""
+    
+    def __init__(self, messages):
+        super().__init__()
+        self.messages = messages
+    
+    def emit(self, record):
+        message = record.getMessage()
+        if "Rate limit" in message:
+            self.messages.append(message)
+
+@contextmanager
+def capture_rate_limit_warnings():
+    """
+    Captura os avisos de rate limiting do cliente Binance durante o bloco.
+    
+    O handler é removido mesmo se a coleta lançar exceção, então não se
+    acumulam handlers no logger entre atualizações.
+    
+    Yields:
+        Lista com as mensagens capturadas
+    """
+    messages = []
+    handler = RateLimitHandler(messages)
+    binance_logger = logging.getLogger('src.api.binance_client')
+    binance_logger.addHandler(handler)
+    try:
+        yield messages
+    finally:
+        binance_logger.removeHandler(handler)
+
+def frame_digest(df):
+    """
+    Gera uma impressão digital curta do conteúdo de um DataFrame OHLCV.
+    
+    Usa blake2b sobre os bytes do índice e dos valores, bem mais barato que o
+    hash genérico do Streamlit para DataFrames.
+    
+    Args:
+        df: DataFrame OHLCV
+        
+    Returns:
+        Digest hexadecimal de 16 bytes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(df.index.to_numpy()).tobytes())
+    digest.update(np.ascontiguousarray(df.to_numpy()).tobytes())
+    return digest.hexdigest()
+
+def renko_cell_params(brick_size, use_renko_always, use_atr, atr_period):
+    """
+    Resolve uma vez, para toda a matriz, quais parâmetros afetam o Renko.
+    
+    Parâmetros que não influenciam o caminho escolhido viram None e saem da
+    chave de compute_renko_cell: no modo ATR, mudar o brick size fixo não
+    invalida as células, e vice-versa. Otimizações por célula que dependam
+    do modo devem ser resolvidas aqui.
+    
+    Args:
+        brick_size: Tamanho do tijolo Renko
+        use_renko_always: Sempre usar Renko
+        use_atr: Usar ATR para brick size dinâmico
+        atr_period: Período do ATR
+        
+    Returns:
+        Tupla (brick_size, use_renko_always, use_atr, atr_period) normalizada
+    """
+    if not use_renko_always:
+        # Modo misto: candles crus no 1m e Renko com ATR padrão nos demais
+        return None, False, None, None
+    if use_atr:
+        return None, True, True, atr_period
+    return brick_size, True, False, None
+
+@st.cache_data(ttl=3600, max_entries=10000, show_spinner=False)
+def compute_renko_cell(data_hash, symbol, tf, brick_size, use_renko_always, use_atr, atr_period, _df):
+    """
+    Gera a série Renko de um par/timeframe com cache do Streamlit.
+    
+    A chave é o digest dos dados mais os parâmetros do Renko: num refresh em
+    que só alguns candles fecharam, apenas essas células são recalculadas.
+    
+    Args:
+        data_hash: Digest do DataFrame (frame_digest), chave do cache
+        symbol: Par de trading
+        tf: Timeframe
+        brick_size: Tamanho do tijolo Renko
+        use_renko_always: Sempre usar Renko
+        use_atr: Usar ATR para brick size dinâmico
+        atr_period: Período do ATR
+        _df: DataFrame OHLCV (fora da chave do cache)
+        
+    Returns:
+        Tupla (fechamentos, última data) ou None se o Renko ficou vazio
+    """
+    # Fallback para dados originais apenas para timeframes muito baixos
+    if not use_renko_always and tf == "1m":
+        closes = _df['close']
+        dates = _df.index.to_numpy()
+    else:
+        if not use_renko_always:
+            renko_df = gerar_renko(_df, brick_size)
+        elif use_atr:
+            # ATR dinâmico
+            renko_df = gerar_renko(_df, brick_size=None, symbol=symbol, use_atr=True, atr_period=atr_period)
+        else:
+            # Brick size fixo
+            renko_df = gerar_renko(_df, brick_size=brick_size, symbol=symbol, use_atr=False)
+        
+        if renko_df.empty:
+            return None
+        closes = renko_df['close']
+        # O Renko já devolve a data como datetime64; só a última é convertida
+        dates = renko_df['date'].to_numpy()
+    
+    last_date = pd.Timestamp(dates[-1]) if len(dates) > 0 else None
+    return closes.reset_index(drop=True).astype(float), last_date
+
+def renko_price_in_band(closes, price):
+    """
+    Indica se um preço ainda não formaria um tijolo novo na série Renko.
+    
+    Segue a regra de _renko_walk: continuar a tendência do último tijolo
+    exige um tijolo e reverter exige dois. O tamanho do tijolo vem da
+    distância entre os dois últimos fechamentos (um brick na continuação,
+    dois na reversão, que pula um nível). Só é um detector válido com brick
+    fixo: com ATR cada candle novo muda o tamanho do tijolo e toda a série.
+    
+    Args:
+        closes: Série com os fechamentos dos tijolos
+        price: Preço atual
+        
+    Returns:
+        True se o preço fica dentro da faixa sem tijolo novo
+    """
+    if len(closes) < 2:
+        return False
+    
+    last = closes.iat[-1]
+    previous = closes.iat[-2]
+    uptrend = last > previous
+    # O primeiro tijolo é sempre de alta
+    previous_uptrend = previous > closes.iat[-3] if len(closes) > 2 else True
+    brick = abs(last - previous) / (1 if uptrend == previous_uptrend else 2)
+    if brick == 0:
+        return False
+    
+    moved = (price - last) / brick
+    if uptrend:
+        return -2 < moved < 1
+    return -1 < moved < 2
+
+@st.cache_data(ttl=300, max_entries=200, show_spinner=False)
+def compute_renko_frame(data_hash, brick_size, _df):
+    """
+    Gera o Renko de um par/timeframe para a análise detalhada, com cache.
+    
+    Cada aba é recalculada a cada rerun do Streamlit; com o cache, o kernel
+    Renko roda uma vez por conjunto de dados e brick size.
+    
+    Args:
+        data_hash: Digest do DataFrame (frame_digest), chave do cache
+        brick_size: Tamanho do tijolo Renko
+        _df: DataFrame OHLCV (fora da chave do cache)
+        
+    Returns:
+        DataFrame Renko (vazio se a geração falhar)
+    """
+    return gerar_renko(_df, brick_size)
+
+@st.cache_data(ttl=300, max_entries=200, show_spinner=False)
+def compute_renko_stoch(data_hash, symbol, brick_size, use_atr, atr_period, _df):
+    """
+    Gera o Renko completo e o StochRSI de um par/timeframe para os gráficos.
+    
+    Trocar de aba ou mexer em um widget não refaz os cálculos enquanto os
+    dados (digest) e os parâmetros não mudarem.
+    
+    Args:
+        data_hash: Digest do DataFrame (frame_digest), chave do cache
+        symbol: Par de trading
+        brick_size: Tamanho do tijolo Renko (ignorado com ATR)
+        use_atr: Usar ATR para brick size dinâmico
+        atr_period: Período do ATR
+        _df: DataFrame OHLCV (fora da chave do cache)
+        
+    Returns:
+        Tupla (DataFrame Renko, DataFrame StochRSI); ambos vazios se o Renko falhar
+    """
+    renko_df = gerar_renko(
+        _df,
+        brick_size=brick_size if not use_atr else None,
+        symbol=symbol,
+        use_atr=use_atr,
+        atr_period=atr_period
+    )
+    
+    if renko_df.empty or 'close' not in renko_df.columns:
+        return renko_df, pd.DataFrame()
+    
+    return renko_df, stochrsi(renko_df['close'])
+
+# Nomes das colunas OHLC de um DataFrame (maiúsculas no cliente, minúsculas no Renko)
+OHLCColumns = namedtuple('OHLCColumns', ['open', 'high', 'low', 'close'])
+
+def ohlc_columns(df):
+    """
+    Resolve uma única vez os nomes das colunas OHLC de um DataFrame.
+    
+    Args:
+        df: DataFrame com colunas Open/High/Low/Close ou open/high/low/close
+        
+    Returns:
+        OHLCColumns com os nomes encontrados, ou None se faltar alguma coluna
+    """
+    columns = df.columns
+    names = OHLCColumns(*(
+        name.capitalize() if name.capitalize() in columns else name
+        for name in OHLCColumns._fields
+    ))
+    return names if all(name in columns for name in names) else None
+
+# Janela dos gráficos de teste: últimos candles e últimos tijolos
+CHART_MAX_CANDLES = 200
+CHART_MAX_BRICKS = 100
+
+@st.cache_resource(show_spinner=False)
+def stoch_figure_template():
+    """
+    Monta uma vez o layout do gráfico Renko + StochRSI dos testes.
+    
+    Subplots, linhas de referência e eixos passam pela validação do plotly só
+    aqui; cada aba copia o modelo com go.Figure(...) e acrescenta os traces.
+    O objeto é compartilhado e não deve ser alterado diretamente.
+    
+    Returns:
+        Figura plotly com os dois subplots, sem traces
+    """
+    figure = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Preço Renko', 'StochRSI'),
+        vertical_spacing=0.25,  # Aumentado significativamente
+        row_heights=[0.6, 0.4],  # Mais espaço para o StochRSI
+        specs=[[{"secondary_y": False}], [{"secondary_y": False}]]
+    )
+    
+    # Linhas de referência no StochRSI
+    figure.add_hline(y=80, line_dash="dash", line_color="red", row=2, col=1)
+    figure.add_hline(y=20, line_dash="dash", line_color="green", row=2, col=1)
+    figure.add_hline(y=50, line_dash="dot", line_color="gray", row=2, col=1)
+    
+    figure.update_layout(
+        height=750,  # Aumentado para dar mais espaço
+        showlegend=True,
+        margin=dict(l=40, r=40, t=80, b=60)  # Margens maiores
+    )
+    
+    # Configurações específicas para cada subplot
+    figure.update_yaxes(title_text="Preço (USD)", row=1, col=1)
+    figure.update_yaxes(title_text="StochRSI (%)", row=2, col=1, range=[0, 100])
+    figure.update_xaxes(title_text="", row=1, col=1, showticklabels=False)
+    figure.update_xaxes(title_text="Tempo", row=2, col=1)
+    
+    # Remove grid excessivo
+    figure.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
+    figure.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
+    
+    # Ajusta os títulos dos subplots para não ocupar tanto espaço
+    figure.update_annotations(font_size=12)
+    
+    return figure
+
+# Sinais por código (u1), na ordem: 0 bullish, 1 bearish, 2 oversold, 3 overbought
+SIGNAL_LABELS = ("⬆️ Bullish", "⬇️ Bearish", "🟢 Oversold", "🔴 Overbought")
+SIGNAL_CODES = MappingProxyType({label: code for code, label in enumerate(SIGNAL_LABELS)})
+SIGNAL_OVERSOLD = 2
+SIGNAL_OVERBOUGHT = 3
+SIGNAL_MISSING = 255
+
+# Célula da matriz compacta (estrutura de arrays): %K, %D, código do sinal, pontos.
+# %K/%D ficam quantizados em centésimos (a matriz já os arredonda a 2 casas),
+# com K_MISSING nas células ausentes
+STOCH_CELL_DTYPE = np.dtype([('k', 'u2'), ('d', 'u2'), ('signal', 'u1'), ('npts', 'i4')])
+K_SCALE = 100
+K_MISSING = 0xFFFF
+
+def signal_codes(k_values, d_values):
+    """
+    Classifica os sinais por código a partir dos valores K e D (vetorizado).
+    
+    Args:
+        k_values: Array com os valores de %K
+        d_values: Array com os valores de %D
+        
+    Returns:
+        Array uint8 com um código de SIGNAL_LABELS por par de valores
+    """
+    return np.select(
+        [
+            (k_values < 20) & (d_values < 20),
+            (k_values > 80) & (d_values > 80),
+            k_values > d_values
+        ],
+        [SIGNAL_OVERSOLD, SIGNAL_OVERBOUGHT, SIGNAL_CODES["⬆️ Bullish"]],
+        default=SIGNAL_CODES["⬇️ Bearish"]
+    ).astype(np.uint8)
+
+def build_stoch_cells(matriz_stoch):
+    """
+    Monta a matriz compacta (pares x timeframes) usada pelos filtros.
+    
+    Cada célula ocupa 9 bytes em um array estruturado, em vez de um dict por
+    par/timeframe. É calculada uma vez por carga de dados; cada mudança de
+    filtro apenas seleciona colunas e compara, sem percorrer os dicionários.
+    
+    Args:
+        matriz_stoch: Matriz StochRSI completa
+        
+    Returns:
+        Tupla (índice timeframe -> coluna, array STOCH_CELL_DTYPE com
+        k/d K_MISSING e sinal SIGNAL_MISSING nas células ausentes, mais uma
+        última coluna vazia para timeframes sem dados)
+    """
+    timeframes = {}
+    for intervals_data in matriz_stoch.values():
+        for tf in intervals_data:
+            timeframes.setdefault(tf, len(timeframes))
+    
+    cells = np.zeros((len(matriz_stoch), len(timeframes) + 1), dtype=STOCH_CELL_DTYPE)
+    cells['k'] = K_MISSING
+    cells['d'] = K_MISSING
+    cells['signal'] = SIGNAL_MISSING
+    
+    for row, intervals_data in enumerate(matriz_stoch.values()):
+        for tf, tf_data in intervals_data.items():
+            if tf_data is None:
+                continue
+            cells[row, timeframes[tf]] = (
+                round(tf_data['StochRSI_%K'] * K_SCALE),
+                round(tf_data['StochRSI_%D'] * K_SCALE),
+                SIGNAL_CODES.get(tf_data['Signal'], SIGNAL_MISSING),
+                tf_data['Data_Points']
+            )
+    
+    return timeframes, cells
+
+# CSS das células da tabela simples
+_OVERSOLD_STYLE = "background-color: #90EE90; color: black; font-weight: bold;"
+_OVERBOUGHT_STYLE = "background-color: #FFB6C1; color: black; font-weight: bold;"
+_MISSING_STYLE = "background-color: #f0f0f0; color: #666;"
+
+@st.cache_data(max_entries=50, show_spinner=False)
+def build_stoch_table(k_rows, intervals):
+    """
+    Monta a tabela simples de %K e o CSS de cada célula.
+    
+    Reruns que só mudam controles da interface reaproveitam a tabela pronta
+    em vez de refazer a formatação e a coloração célula a célula.
+    
+    Args:
+        k_rows: Tupla de (par, tupla de %K por intervalo, None se ausente)
+        intervals: Tupla de intervalos (colunas)
+        
+    Returns:
+        Tupla (DataFrame da tabela, DataFrame de CSS com o mesmo formato)
+    """
+    # Uma coluna (array object pré-alocado) por intervalo, sem inferência de tipos
+    n_rows = len(k_rows)
+    pares = np.empty(n_rows, dtype=object)
+    values = {interval: np.empty(n_rows, dtype=object) for interval in intervals}
+    styles = {interval: np.full(n_rows, "", dtype=object) for interval in intervals}
+    
+    for row, (symbol, k_values) in enumerate(k_rows):
+        pares[row] = symbol  # Primeira coluna é o par
+        
+        # Adiciona valores para cada timeframe
+        for interval, k_value in zip(intervals, k_values):
+            if k_value is None:
+                values[interval][row] = "N/A"
+                styles[interval][row] = _MISSING_STYLE
+            # Determina cor baseada no valor
+            elif k_value < 20:
+                values[interval][row] = f"🟢 {k_value:.1f}"  # Oversold
+                styles[interval][row] = _OVERSOLD_STYLE
+            elif k_value > 80:
+                values[interval][row] = f"🔴 {k_value:.1f}"  # Overbought
+                styles[interval][row] = _OVERBOUGHT_STYLE
+            else:
+                values[interval][row] = f"{k_value:.1f}"  # Normal
+    
+    table = pd.DataFrame({"Par": pares, **values})
+    cell_styles = pd.DataFrame({"Par": np.full(n_rows, "", dtype=object), **styles})
+    return table, cell_styles
+
+# Acima deste número de linhas a tabela simples é emitida como HTML pronto
+HTML_TABLE_MIN_ROWS = 30
+
+_STOCH_TABLE_CSS = """
+<style>
+.stoch-table-wrap { max-height: 600px; overflow-y: auto; }
+.stoch-table { width: 100%; border-collapse: collapse; font-size: 0.9rem; }
+.stoch-table th { position: sticky; top: 0; background: #fafafa; text-align: left; }
+.stoch-table th, .stoch-table td { padding: 0.25rem 0.5rem; border-bottom: 1px solid #e6e6e6; }
+</style>
+"""
+
+@st.cache_data(max_entries=50, show_spinner=False)
+def build_stoch_table_html(k_rows, intervals):
+    """
+    Monta a tabela simples como HTML com o estilo inline de cada célula.
+    
+    Para tabelas grandes, evita serializar o Styler célula a célula a cada
+    rerun: o HTML é montado uma vez por conteúdo e enviado como está.
+    
+    Args:
+        k_rows: Tupla de (par, tupla de %K por intervalo, None se ausente)
+        intervals: Tupla de intervalos (colunas)
+        
+    Returns:
+        String HTML da tabela (com o CSS)
+    """
+    table, cell_styles = build_stoch_table(k_rows, intervals)
+    
+    header = "".join(f"<th>{html.escape(str(column))}</th>" for column in table.columns)
+    body = "".join(
+        "<tr>" + "".join(
+            f'<td style="{style}">{html.escape(value)}</td>' if style else f"<td>{html.escape(value)}</td>"
+            for value, style in zip(values, styles)
+        ) + "</tr>"
+        for values, styles in zip(table.itertuples(index=False), cell_styles.itertuples(index=False))
+    )
+    
+    return (
+        f'{_STOCH_TABLE_CSS}<div class="stoch-table-wrap"><table class="stoch-table">'
+        f"<thead><tr>{header}</tr></thead><tbody>{body}</tbody></table></div>"
+    )
+
+def stoch_filter_mask(k_matrix, stoch_filter):
+    """
+    Calcula de forma vetorizada quais pares passam nos filtros de %K.
+    
+    Os filtros "acima", "abaixo" e "intervalo" dependem só do menor e do maior
+    %K de cada par, então a matriz é reduzida uma vez a mínimo/máximo por
+    linha e esses filtros viram comparações de vetores. Apenas o filtro de
+    extremos (v <= mínimo OU v >= máximo) precisa olhar célula a célula, e só
+    é avaliado quando ativo. Valores ausentes (K_MISSING) reprovam o par.
+    
+    Args:
+        k_matrix: Matriz uint16 (pares x timeframes de filtro) com o %K
+            quantizado (STOCH_CELL_DTYPE); os limites são escalados por K_SCALE
+        stoch_filter: Dicionário de filtros da sidebar
+        
+    Returns:
+        Array booleano com um valor por par
+    """
+    def threshold(enabled_key, value_key, disabled):
+        value = stoch_filter.get(value_key)
+        return value if stoch_filter.get(enabled_key) and value is not None else disabled
+    
+    # Filtros desativados viram limites infinitos
+    lower = max(threshold('enable_above', 'value_above', -np.inf), threshold('enable_intervalo', 'intervalo_min', -np.inf))
+    upper = min(threshold('enable_below', 'value_below', np.inf), threshold('enable_intervalo', 'intervalo_max', np.inf))
+    
+    passed = (
+        (k_matrix != K_MISSING).all(axis=1) &
+        (k_matrix.min(axis=1) >= lower * K_SCALE) &
+        (k_matrix.max(axis=1) <= upper * K_SCALE)
+    )
+    
+    extremos_min = threshold('enable_extremos', 'extremos_min', None)
+    extremos_max = threshold('enable_extremos', 'extremos_max', None)
+    if extremos_min is not None and extremos_max is not None and passed.any():
+        passed &= ((k_matrix <= extremos_min * K_SCALE) | (k_matrix >= extremos_max * K_SCALE)).all(axis=1)
+    
+    return passed
+
+# Intervalo (segundos) em que o servidor verifica se o auto-refresh venceu
+_REFRESH_CHECK_SECONDS = 10.0
+
+# Contador regressivo executado no navegador (sem reruns no servidor a cada segundo)
+_COUNTDOWN_HTML = """
+<div id="countdown" style="font-family: 'Source Sans Pro', sans-serif; font-size: 0.95rem;
+     color: #004280; background: rgba(28, 131, 225, 0.1); padding: 0.75rem 1rem; border-radius: 0.5rem;">
+</div>
+<script>
+const deadline = Date.now() + {remaining_ms};
+const showHours = {show_hours};
+const pad = (value) => String(value).padStart(2, "0");
+function tick() {{
+    const left = Math.max(0, Math.floor((deadline - Date.now()) / 1000));
+    const hours = Math.floor(left / 3600);
+    const minutes = Math.floor((left % 3600) / 60);
+    const text = (showHours ? pad(hours) + ":" + pad(minutes) : pad(Math.floor(left / 60))) + ":" + pad(left % 60);
+    document.getElementById("countdown").textContent = "🕐 Próxima atualização em: " + text;
+}}
+tick();
+setInterval(tick, 1000);
+</script>
+"""
+
+def render_countdown_display(time_remaining, refresh_interval):
+    """
+    Exibe o contador regressivo do auto-refresh no navegador.
+    
+    O JavaScript atualiza o texto a cada segundo no cliente; o servidor só
+    redesenha o componente quando a sidebar é reexecutada.
+    
+    Args:
+        time_remaining: Segundos até a próxima atualização
+        refresh_interval: Intervalo entre atualizações em segundos
+    """
+    components.html(
+        _COUNTDOWN_HTML.format(
+            remaining_ms=int(max(time_remaining, 0)) * 1000,
+            show_hours="true" if refresh_interval >= 3600 else "false"
+        ),
+        height=56
+    )
+
+@st.fragment(run_every=_REFRESH_CHECK_SECONDS)
+def render_refresh_countdown(refresh_interval):
+    """
+    Verifica periodicamente se o intervalo do auto-refresh expirou.
+    
+    Executa como fragmento sem elementos visuais (o contador roda no
+    navegador): a cada _REFRESH_CHECK_SECONDS compara o prazo e, quando ele
+    expira, pede o refresh forçado (pending_force_refresh, consumido por
+    run) e dispara um único rerun completo do app.
+    
+    Args:
+        refresh_interval: Intervalo entre atualizações em segundos
+    """
+    ss = st.session_state
+    
+    now = time.monotonic()
+    if ss.next_refresh_deadline - now > 0:
+        return
+    
+    # Hora de atualizar: o rerun abaixo já roda com o refresh forçado
+    ss.next_refresh_deadline = now + refresh_interval
+    ss.pending_force_refresh = True
+    ss.auto_refresh_due = True
+    # Único rerun completo por intervalo
+    st.rerun(scope="app")
+
+@dataclass(slots=True)
+class SessionDataCache:
+    """
+    Dados em cache de uma sessão, guardados como um único objeto.
+    
+    Fica em st.session_state uma vez por sessão; o restante do código acessa
+    os campos como atributos comuns, sem passar pelo SessionState a cada uso.
+    """
+    cached_data: dict = field(default_factory=dict)
+    cached_matriz_stoch: dict = field(default_factory=dict)
+    data_timestamp: float = None
+    last_config_fp: tuple = None
+    
+    def clear(self):
+        """Esvazia o cache da sessão (no mesmo objeto)."""
+        self.cached_data = {}
+        self.cached_matriz_stoch = {}
+        self.data_timestamp = None
+        self.last_config_fp = None
 
 class TradingDashboard:
     """
     Dashboard principal para trading.
     """
     
+    # Valores iniciais do session state
+    SESSION_DEFAULTS = {
+        'updating_data': False,
+        # Valores iniciais dos widgets da sidebar (vinculados via key=)
+        'user_auto_refresh_enabled': DASHBOARD_CONFIG.get('auto_refresh_enabled', True),
+        'user_refresh_interval_label': _DEFAULT_REFRESH_LABEL,
+        'user_intervals': list(DASHBOARD_CONFIG['default_intervals']),
+        'user_filter_timeframes': ['1h', '4h'],
+        'enable_above': False,
+        'all_above': 70,
+        'enable_below': False,
+        'all_below': 30,
+        'enable_extremos': False,
+        'extremos_range': (30, 70),
+        'enable_intervalo': False,
+        'intervalo_range': (30, 70),
+        'user_show_signals_only': False,
+        'user_delay_between_requests': 300,
+        'user_batch_size': 30,
+        'user_use_atr': True,
+        'user_atr_period': 14,
+        'user_brick_size': 200,
+        'user_use_renko_always': True,
+        'user_use_cache_fallback': True,
+    }
+    
     def __init__(self):
         """Inicializa o dashboard."""
-        self.data_manager = get_data_manager()
-        self.pairs_manager = get_pairs_manager()
+        ss = st.session_state
+        
+        self.data_manager = get_shared_data_manager()
+        self.pairs_manager = get_shared_pairs_manager()
         self.config = DASHBOARD_CONFIG
         
-        # Detecta o modo do dashboard
-        self.mode = get_dashboard_mode()
-        
-        # Inicializa session state para cache de dados
-        if 'cached_data' not in st.session_state:
-            st.session_state.cached_data = {}
-        if 'cached_matriz_stoch' not in st.session_state:
-            st.session_state.cached_matriz_stoch = {}
-        if 'data_timestamp' not in st.session_state:
-            st.session_state.data_timestamp = None
-        if 'last_config' not in st.session_state:
-            st.session_state.last_config = {}
-        if 'updating_data' not in st.session_state:
-            st.session_state.updating_data = False
+        # Detecta o modo do dashboard (guardado na sessão após a primeira execução)
+        if 'dashboard_mode' not in ss:
+            ss.dashboard_mode = get_dashboard_mode()
+        self.mode = ss.dashboard_mode
+        
+        # Cache de dados da sessão (um objeto por sessão, acessado por atributo)
+        if 'data_cache' not in ss:
+            ss.data_cache = SessionDataCache()
+        self.cache = ss.data_cache
+        
+        # Instante único desta execução, reutilizado por todos os blocos
+        self.now = time.monotonic()
+        self.now_wall = datetime.now()
+        
+        self.apply_session_defaults()
         
         # Configurar página
         page_title = self.config['title']
@@ -112,41 +911,66 @@ class TradingDashboard:
         )
         
         # Mostra o modo atual
-        self.show_mode_info()
+        self.show_mode_info(self.now)
+    
+    def apply_session_defaults(self):
+        """
+        Inicializa session state e widgets ausentes (dicts/listas copiados por sessão).
+        
+        Também é chamado no início do fragmento da sidebar, já que o Streamlit
+        descarta o estado de widgets que deixam de ser renderizados em um rerun
+        parcial (ex.: o slider de um filtro desativado).
+        """
+        st.session_state.update({
+            key: value.copy() if isinstance(value, (dict, list)) else value
+            for key, value in self.SESSION_DEFAULTS.items()
+            if key not in st.session_state
+        })
     
-    def needs_data_refresh(self, trading_pairs, intervals, brick_size, use_atr, atr_period, force_refresh):
+    def config_fingerprint(self, trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always):
+        """
+        Gera a impressão digital da configuração de dados.
+        
+        Comparar o hash da tupla é O(1) por rerun, independente do número de
+        pares; o tamanho da lista acompanha o hash como proteção contra colisões.
+        
+        Returns:
+            Tupla (hash da configuração, número de pares)
+        """
+        config_hash = hash((tuple(trading_pairs), tuple(intervals), brick_size, use_atr, atr_period, use_renko_always, self.mode))
+        return config_hash, len(trading_pairs)
+    
+    def needs_data_refresh(self, trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always, force_refresh):
         """Verifica se é necessário atualizar os dados."""
-        current_config = {
-            'trading_pairs': trading_pairs,
-            'intervals': intervals,
-            'brick_size': brick_size,
-            'use_atr': use_atr,
-            'atr_period': atr_period,
-            'mode': self.mode
-        }
+        cache = self.cache
         
         # Se força refresh, sempre atualizar
         if force_refresh:
             return True
         
-        # Se não há dados em cache, sempre atualizar
-        if not st.session_state.cached_data or not st.session_state.cached_matriz_stoch:
-            return True
-        
-        # Se configuração mudou, atualizar
-        if st.session_state.last_config != current_config:
-            return True
+        # Sessão vazia ou com outra configuração: tenta o cache em disco
+        config_fp = self.config_fingerprint(trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always)
+        if not cache.cached_data or not cache.cached_matriz_stoch or cache.last_config_fp != config_fp:
+            if not self.restore_disk_cache(trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always):
+                return True
         
         # Se passou mais de 10 minutos, atualizar
-        if st.session_state.data_timestamp:
-            time_diff = (datetime.now() - st.session_state.data_timestamp).total_seconds()
-            if time_diff > 600:  # 10 minutes
+        if cache.data_timestamp:
+            if self.now - cache.data_timestamp > 600:  # 10 minutes
                 return True
         
         return False
     
-    def show_mode_info(self):
-        """Mostra informações sobre o modo atual."""
+    def show_mode_info(self, now):
+        """
+        Mostra informações sobre o modo atual.
+        
+        Args:
+            now: Instante monotônico da execução atual
+        """
+        ss = st.session_state
+        cache = self.cache
+        
         if self.mode == "all_pairs":
             st.info("🌐 **Modo: TODOS OS PARES** - Carregando todos os pares disponíveis")
         elif self.mode == "test_mode":
@@ -155,355 +979,459 @@ class TradingDashboard:
             st.info("📈 **Modo: PADRÃO** - Usando pares selecionados")
         
         # Mostra informações do cache
-        if st.session_state.updating_data:
+        if ss.updating_data:
             st.warning("🔄 **Atualizando dados** - Interface permanece funcional com dados anteriores")
-        elif st.session_state.data_timestamp:
-            cache_age = (datetime.now() - st.session_state.data_timestamp).total_seconds() / 60
+        elif cache.data_timestamp:
+            cache_age_seconds = now - cache.data_timestamp
+            cache_age = cache_age_seconds / 60
             if cache_age < 1:
-                st.success(f"💾 **Cache:** Dados atualizados há {cache_age:.0f} segundos")
+                st.success(f"💾 **Cache:** Dados atualizados há {cache_age_seconds:.0f} segundos")
             else:
                 st.info(f"💾 **Cache:** Dados atualizados há {cache_age:.1f} minutos")
         else:
             st.warning("💾 **Cache:** Nenhum dado em cache")
     
-    def needs_data_refresh(self, trading_pairs, intervals, brick_size, use_atr, atr_period, force_refresh):
-        """Verifica se é necessário atualizar os dados."""
-        current_config = {
-            'trading_pairs': trading_pairs,
-            'intervals': intervals,
-            'brick_size': brick_size,
-            'use_atr': use_atr,
-            'atr_period': atr_period,
-            'mode': self.mode
-        }
+    def load_data(self, trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always, batch_size, delay_between_requests, use_cache_fallback, force_refresh=False):
+        """
+        Coleta dados e calcula a matriz StochRSI.
         
-        # Se força refresh, sempre atualizar
-        if force_refresh:
-            return True
+        Não há cache por configuração compartilhado entre sessões: o resultado
+        fica no cache da sessão (e no cache em disco), e o reaproveitamento
+        entre sessões acontece por célula em fetch_symbol_data e
+        compute_renko_cell.
         
-        # Se não há dados em cache, sempre atualizar
-        if not st.session_state.cached_data or not st.session_state.cached_matriz_stoch:
-            return True
+        Args:
+            trading_pairs: Lista de pares de trading
+            intervals: Lista de intervalos
+            brick_size: Tamanho do tijolo Renko
+            use_atr: Usar ATR para brick size dinâmico
+            atr_period: Período do ATR
+            use_renko_always: Sempre usar Renko
+            batch_size: Tamanho do lote
+            delay_between_requests: Delay entre requisições (segundos)
+            use_cache_fallback: Usar cache como fallback
+            force_refresh: Descarta o cache e busca dados novos
+            
+        Returns:
+            Tupla (all_data, matriz_stoch)
+        """
+        # Pares sem tijolo novo reaproveitam os candles desta sessão
+        reused = None
+        if not force_refresh:
+            reused = self.get_reusable_symbol_data(trading_pairs, intervals, brick_size, use_renko_always, use_atr, atr_period)
         
-        # Se configuração mudou, atualizar
-        if st.session_state.last_config != current_config:
-            return True
+        all_data = self.get_data_with_brick_size(
+            trading_pairs, intervals, brick_size, batch_size, delay_between_requests, use_cache_fallback, force_refresh, reused
+        )
+        matriz_stoch = self.process_data_matrix(all_data, intervals, brick_size, use_renko_always, use_atr, atr_period)
+        return all_data, matriz_stoch
+    
+    def refresh_data(self, trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always, batch_size, delay_between_requests, use_cache_fallback, force_refresh=False):
+        """
+        Atualiza os dados, grava no cache da sessão e coleta avisos de rate limiting.
         
-        # Se passou mais de 10 minutos, atualizar
-        if st.session_state.data_timestamp:
-            time_diff = (datetime.now() - st.session_state.data_timestamp).total_seconds()
-            if time_diff > 600:  # 10 minutes
-                return True
+        Args:
+            trading_pairs: Lista de pares de trading
+            intervals: Lista de intervalos
+            brick_size: Tamanho do tijolo Renko
+            use_atr: Usar ATR para brick size dinâmico
+            atr_period: Período do ATR
+            use_renko_always: Sempre usar Renko
+            batch_size: Tamanho do lote
+            delay_between_requests: Delay entre requisições (ms)
+            use_cache_fallback: Usar cache como fallback
+            force_refresh: Descarta o cache e busca dados novos
+            
+        Returns:
+            Tupla (all_data, matriz_stoch, avisos de rate limiting)
+        """
+        # Monitora logs para detectar rate limiting
+        with capture_rate_limit_warnings() as rate_limit_warnings:
+            # Coleta dados e calcula indicadores (caches por célula)
+            all_data, matriz_stoch = self.load_data(
+                trading_pairs, intervals, brick_size, use_atr, atr_period,
+                use_renko_always, batch_size, delay_between_requests / 1000, use_cache_fallback, force_refresh
+            )
         
-        return False
+        # Armazena no cache
+        self.cache_data(trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always, all_data, matriz_stoch)
+        return all_data, matriz_stoch, rate_limit_warnings
     
-    def cache_data(self, trading_pairs, intervals, brick_size, use_atr, atr_period, all_data, matriz_stoch):
+    def cache_data(self, trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always, all_data, matriz_stoch):
         """Armazena dados no cache da sessão."""
-        st.session_state.cached_data = all_data
-        st.session_state.cached_matriz_stoch = matriz_stoch
-        st.session_state.data_timestamp = datetime.now()
-        st.session_state.last_config = {
-            'trading_pairs': trading_pairs,
-            'intervals': intervals,
-            'brick_size': brick_size,
-            'use_atr': use_atr,
-            'atr_period': atr_period,
-            'mode': self.mode
-        }
+        cache = self.cache
+        cache.cached_data = all_data
+        cache.cached_matriz_stoch = matriz_stoch
+        cache.data_timestamp = time.monotonic()
+        cache.last_config_fp = self.config_fingerprint(trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always)
+        
+        # Cópia em disco para reinícios do servidor e outras sessões
+        disk_cache = get_disk_cache()
+        if disk_cache is not None:
+            try:
+                disk_cache.set(
+                    self.disk_cache_key(trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always),
+                    pack_cache_entry((time.time(), all_data, matriz_stoch)),
+                    expire=DISK_CACHE_TTL
+                )
+            except Exception as e:
+                logger.warning(f"Erro ao gravar cache em disco: {e}")
     
-    def get_cached_data(self):
-        """Recupera dados do cache da sessão."""
-        return st.session_state.cached_data, st.session_state.cached_matriz_stoch
+    def disk_cache_key(self, trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always):
+        """Chave da configuração no cache em disco."""
+        return ('stoch', tuple(sorted(trading_pairs)), tuple(intervals), brick_size, use_atr, atr_period, use_renko_always, self.mode)
     
-    def render_sidebar(self):
-        """Renderiza a barra lateral com controles."""
-        st.sidebar.header("⚙️ Configurações")
-        
-        # Pares de trading baseado no modo
-        st.sidebar.subheader("📊 Pares de Trading")
-        
-        trading_pairs = get_trading_pairs_for_mode(self.mode)
-        
-        if not trading_pairs:
-            st.sidebar.error("❌ Nenhum par carregado!")
-            return None, None, None, None, None, None, None, None, None, None, None
-        
-        mode_info = {
-            "all_pairs": f"🌐 TODOS OS PARES ({len(trading_pairs)})",
-            "test_mode": f"🧪 TESTE - 5 pares",
-            "default": f"📈 PADRÃO - {len(trading_pairs)} pares"
-        }
-        
-        st.sidebar.info(mode_info[self.mode])
-        st.sidebar.write(f"📊 {len(trading_pairs)} pares carregados")
-        
-        # Opção para alterar modo (somente no dashboard)
-        if st.sidebar.button("🔄 Alterar Modo"):
-            st.sidebar.markdown("""
-            **Para alterar o modo, use:**
-            - `python run_system.py` - Modo padrão
-            - `python run_system.py --all-pairs` - Todos os pares
-            - `python run_system.py --test` - Modo teste
-            """)
-        
-        # Botão para forçar refresh dos dados
-        st.sidebar.subheader("🔄 Atualização de Dados")
+    def restore_disk_cache(self, trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always):
+        """
+        Carrega na sessão os dados da configuração salvos no cache em disco.
         
-        # Informação sobre última atualização
-        current_time = datetime.now().strftime("%H:%M:%S")
-        st.sidebar.info(f"🕐 Última verificação: {current_time}")
+        A idade original dos dados é preservada, então a regra de 10 minutos
+        de needs_data_refresh continua valendo.
         
-        # Botão para forçar refresh
-        force_refresh = st.sidebar.button("🔄 Forçar Atualização dos Dados", 
-                                        help="Força busca de novos dados da API, ignorando cache válido")
+        Returns:
+            True se os dados foram restaurados
+        """
+        disk_cache = get_disk_cache()
+        if disk_cache is None:
+            return False
         
-        # Seção de Auto-Refresh
-        st.sidebar.subheader("⏰ Auto-Refresh")
+        try:
+            entry = disk_cache.get(self.disk_cache_key(trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always))
+        except Exception as e:
+            logger.warning(f"Erro ao ler cache em disco: {e}")
+            return False
         
-        # Toggle para ativar/desativar auto-refresh
-        auto_refresh_enabled = st.sidebar.checkbox(
-            "🔄 Ativar Atualização Automática",
-            value=self.config.get('auto_refresh_enabled', True),
-            help="Atualiza os dados automaticamente a cada 2 horas"
-        )
+        if entry is None:
+            return False
         
-        # Intervalo fixo de 2 horas
-        refresh_interval = 7200  # 2 horas em segundos
+        try:
+            saved_at, all_data, matriz_stoch = unpack_cache_entry(entry)
+        except Exception as e:
+            logger.warning(f"Entrada inválida no cache em disco: {e}")
+            return False
+        if not all_data or not matriz_stoch:
+            return False
+        
+        cache = self.cache
+        cache.cached_data = all_data
+        cache.cached_matriz_stoch = matriz_stoch
+        cache.data_timestamp = self.now - max(0.0, time.time() - saved_at)
+        cache.last_config_fp = self.config_fingerprint(trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always)
+        logger.info(f"Cache em disco restaurado: {len(matriz_stoch)} pares")
+        return True
+    
+    def get_cached_data(self):
+        """Recupera dados do cache da sessão."""
+        return self.cache.cached_data, self.cache.cached_matriz_stoch
+    
+    @st.fragment
+    def render_sidebar(self):
+        """
+        Renderiza a barra lateral com controles.
         
-        # Sistema de auto-refresh
-        if auto_refresh_enabled:
-            # Inicializa o timestamp se não existir
-            if 'last_refresh_time' not in st.session_state:
-                st.session_state.last_refresh_time = time.time()
-            
-            # Calcula tempo restante
-            current_time_seconds = time.time()
-            time_since_refresh = current_time_seconds - st.session_state.last_refresh_time
-            time_remaining = refresh_interval - time_since_refresh
-            
-            # Mostra contador regressivo
-            if time_remaining > 0:
-                hours = int(time_remaining // 3600)
-                minutes = int((time_remaining % 3600) // 60)
-                seconds = int(time_remaining % 60)
-                
-                if hours > 0:
-                    countdown_text = f"🕐 Próxima atualização em: {hours:02d}:{minutes:02d}:{seconds:02d}"
-                else:
-                    countdown_text = f"🕐 Próxima atualização em: {minutes:02d}:{seconds:02d}"
-                
-                st.sidebar.info(countdown_text)
-                
-                # Para evitar travamento, atualiza apenas nos últimos segundos
-                if time_remaining <= 3:
-                    time.sleep(1)
-                    st.rerun()
-            else:
-                # Hora de atualizar
-                st.session_state.last_refresh_time = current_time_seconds
-                force_refresh = True
-                st.sidebar.success("🔄 Atualizando dados automaticamente...")
-                st.rerun()
+        Executado como fragmento dentro de with st.sidebar: mexer nos
+        widgets reexecuta apenas a sidebar. Os parâmetros ficam em
+        st.session_state.sidebar_result e só são aplicados ao conteúdo
+        principal (applied_sidebar) ao clicar em "Aplicar" ou
+        "Forçar Atualização", que disparam um rerun completo.
+        """
+        ss = st.session_state
+        cache = self.cache
         
-        # Informação sobre funcionamento
-        if auto_refresh_enabled:
-            st.sidebar.success("✅ Auto-refresh ativo: a cada 2 horas")
-        else:
-            st.sidebar.info("⏸️ Auto-refresh desativado")
-        
-        # Informação sobre auto-refresh
-        st.sidebar.info("� Os filtros são aplicados instantaneamente usando cache")
-        st.sidebar.info("🔄 Use 'Forçar Atualização' para buscar dados mais recentes")
-        
-        # Seção de timeframes
-        st.sidebar.subheader("⏰ Timeframes")
-        intervals = st.sidebar.multiselect(
-            "Intervalos de tempo:",
-            self.config['available_intervals'],
-            default=self.config['default_intervals']
-        )
+        self.apply_session_defaults()
         
-        # Seção de filtros StochRSI
-        st.sidebar.subheader("🎯 Filtros StochRSI %K")
+        # Instante desta execução do fragmento (pode rodar sem rerun completo)
+        now = time.monotonic()
+        now_wall = datetime.now()
         
-        # Timeframes para aplicar filtros
-        st.sidebar.subheader("📊 Timeframes para Filtro")
-        filter_timeframes = st.sidebar.multiselect(
-            "Selecione os timeframes para aplicar os filtros:",
-            intervals,
-            default=["1h", "4h"] if all(tf in intervals for tf in ["1h", "4h"]) else intervals[:2],
-            help="Timeframes que serão usados nos filtros abaixo"
-        )
+        st.header("⚙️ Configurações")
         
-        # Filtro: Todos Acima
-        st.sidebar.subheader("📈 Filtro Geral - Todos Acima")
-        enable_above = st.sidebar.checkbox("Ativar filtro 'Todos acima'", key="enable_above")
-        if enable_above:
-            value_above = st.sidebar.slider("Valor mínimo para os selecionados", 0, 100, 70, key="all_above")
-        else:
-            value_above = None
+        # Pares de trading baseado no modo
+        st.subheader("📊 Pares de Trading")
         
-        # Filtro: Todos Abaixo
-        st.sidebar.subheader("📉 Filtro Geral - Todos Abaixo")
-        enable_below = st.sidebar.checkbox("Ativar filtro 'Todos abaixo'", key="enable_below")
-        if enable_below:
-            value_below = st.sidebar.slider("Valor máximo para os selecionados", 0, 100, 30, key="all_below")
-        else:
-            value_below = None
+        trading_pairs = get_trading_pairs_for_mode(self.mode)
         
-        # Filtro: Extremos
-        st.sidebar.subheader("🎯 Filtro Extremos (abaixo/acima)")
-        enable_extremos = st.sidebar.checkbox("Ativar filtro de extremos", key="enable_extremos")
-        if enable_extremos:
-            extremos_min, extremos_max = st.sidebar.slider(
-                "Defina os valores dos extremos (mínimo e máximo)",
-                0, 100, (30, 70), key="extremos_range"
-            )
-        else:
-            extremos_min = extremos_max = None
+        if not trading_pairs:
+            st.error("❌ Nenhum par carregado!")
+            ss.sidebar_result = None
+            ss.applied_sidebar = None
+            return
         
-        # Filtro: Intervalo Personalizado
-        st.sidebar.subheader("🟩 Filtro Intervalo Personalizado (meio)")
-        enable_intervalo = st.sidebar.checkbox("Ativar filtro de intervalo personalizado", key="enable_intervalo")
-        if enable_intervalo:
-            intervalo_min, intervalo_max = st.sidebar.slider(
-                "Defina o intervalo central (mínimo e máximo)",
-                0, 100, (30, 70), key="intervalo_range"
-            )
-        else:
-            intervalo_min = intervalo_max = None
-        
-        # Configurar filtros
-        stoch_filter = {
-            'filter_timeframes': filter_timeframes,
-            'enable_above': enable_above,
-            'value_above': value_above,
-            'enable_below': enable_below,
-            'value_below': value_below,
-            'enable_extremos': enable_extremos,
-            'extremos_min': extremos_min,
-            'extremos_max': extremos_max,
-            'enable_intervalo': enable_intervalo,
-            'intervalo_min': intervalo_min,
-            'intervalo_max': intervalo_max
+        mode_info = {
+            "all_pairs": f"🌐 TODOS OS PARES ({len(trading_pairs)})",
+            "test_mode": f"🧪 TESTE - 5 pares",
+            "default": f"📈 PADRÃO - {len(trading_pairs)} pares"
         }
         
-        # Mostrar apenas sinais
-        show_signals_only = st.sidebar.checkbox("Mostrar apenas sinais importantes", value=False)
-        
-        # Seção de parâmetros
-        st.sidebar.subheader("🔧 Parâmetros")
+        st.info(f"{mode_info[self.mode]}\n\n📊 {len(trading_pairs)} pares carregados")
         
-        # Informação sobre cálculo automático de dias
-        st.sidebar.info("📅 Dias de histórico calculados automaticamente para cada timeframe")
-        
-        # Controle de rate limiting
-        st.sidebar.subheader("⚠️ Rate Limiting")
-        delay_between_requests = st.sidebar.slider(
-            "Delay entre requisições (ms):",
-            min_value=50,  # Reduzido para aproveitar connection pool maior
-            max_value=2000,
-            value=300,  # Reduzido para ser mais eficiente
-            step=50,
-            help="Aumentar para evitar rate limiting da API (otimizado para connection pool de 50)"
-        )
+        # Opção para alterar modo (somente no dashboard)
+        if st.button("🔄 Alterar Modo"):
+            st.markdown("""
+            **Para alterar o modo, use:**
+            - `python run_system.py` - Modo padrão
+            - `python run_system.py --all-pairs` - Todos os pares
+            - `python run_system.py --test` - Modo teste
+            """)
         
-        batch_size = st.sidebar.slider(
-            "Tamanho do lote:",
-            min_value=5,
-            max_value=50,
-            value=30,  # Aumentado para aproveitar connection pool maior
-            step=5,
-            help="Número de pares processados por vez (otimizado para connection pool de 50)"
-        )
+        # Botão para forçar refresh dos dados
+        st.subheader("🔄 Atualização de Dados")
         
-        # Dicas de otimização
-        requests_per_minute = (60000 / delay_between_requests) * batch_size if delay_between_requests > 0 else 0
+        # Informação sobre última atualização
+        current_time = now_wall.strftime("%H:%M:%S")
+        st.info(f"🕐 Última verificação: {current_time}")
         
-        if batch_size > 40 and delay_between_requests < 200:
-            st.sidebar.warning("⚠️ Configuração de alto risco! Pode resultar em ban da API.")
-        elif batch_size <= 25 and delay_between_requests >= 250:
-            st.sidebar.success("✅ Configuração segura para evitar rate limiting.")
-        else:
-            st.sidebar.info("ℹ️ Configuração moderada. Monitore os avisos de rate limiting.")
+        # Botão para forçar refresh
+        force_refresh = st.button("🔄 Forçar Atualização dos Dados", 
+                                        help="Força busca de novos dados da API, ignorando cache válido")
         
-        st.sidebar.metric("📊 Taxa estimada", f"{requests_per_minute:.0f} req/min")
-        st.sidebar.info("🔧 Connection pool: 50 conexões ativas")
+        # Seção de Auto-Refresh
+        st.subheader("⏰ Auto-Refresh")
         
-        # Seção de configuração do Renko
-        st.sidebar.subheader("🧱 Configuração Renko")
+        # Toggle para ativar/desativar auto-refresh
+        auto_refresh_enabled = st.checkbox(
+            "🔄 Ativar Atualização Automática",
+            key="user_auto_refresh_enabled",
+            help="Atualiza os dados automaticamente no intervalo selecionado"
+        )
         
-        # Opção para usar ATR dinâmico
-        use_atr = st.sidebar.checkbox(
-            "Usar ATR dinâmico para brick size",
-            value=True,
-            help="Calcula o brick size automaticamente baseado no ATR (Average True Range)"
+        # Intervalo de atualização (padrão do DASHBOARD_CONFIG)
+        refresh_interval_label = st.selectbox(
+            "Intervalo de atualização:",
+            _REFRESH_LABELS,
+            key="user_refresh_interval_label",
+            disabled=not auto_refresh_enabled
         )
+        refresh_interval = REFRESH_OPTIONS[refresh_interval_label]
         
-        if use_atr:
-            atr_period = st.sidebar.slider(
+        # Sistema de auto-refresh
+        auto_refreshed = False
+        if auto_refresh_enabled:
+            # Prazo absoluto monotônico; reinicia quando o intervalo muda
+            if ss.get('refresh_interval_active') != refresh_interval:
+                ss.refresh_interval_active = refresh_interval
+                ss.next_refresh_deadline = now + refresh_interval
+            
+            # O fragmento do contador já pediu o refresh; aqui só aplica os
+            # parâmetros, sem um segundo rerun
+            auto_refreshed = ss.pop('auto_refresh_due', False)
+            if auto_refreshed:
+                st.success("🔄 Atualizando dados automaticamente...")
+            
+            # Contador no navegador; o fragmento só verifica o prazo periodicamente
+            render_countdown_display(ss.next_refresh_deadline - now, refresh_interval)
+            render_refresh_countdown(refresh_interval)
+        
+        # Informações sobre auto-refresh agrupadas em um único elemento
+        refresh_lines = [
+            f"✅ Auto-refresh ativo: a cada {refresh_interval_label}" if auto_refresh_enabled
+            else "⏸️ Auto-refresh desativado",
+            "⚡ Use 'Aplicar Configurações' para atualizar os resultados com os filtros atuais",
+            "🔄 Use 'Forçar Atualização' para buscar dados mais recentes",
+        ]
+        st.info("\n\n".join(refresh_lines))
+        
+        # Controles de configuração agrupados em um formulário: as mudanças ficam
+        # no navegador e geram um único rerun ao clicar em "Aplicar Configurações"
+        with st.form("config"):
+            # Seção de timeframes
+            st.subheader("⏰ Timeframes")
+            intervals = st.multiselect(
+                "Intervalos de tempo:",
+                self.config['available_intervals'],
+                key="user_intervals"
+            )
+            
+            # Seção de filtros StochRSI
+            st.subheader("🎯 Filtros StochRSI %K")
+            
+            # Timeframes para aplicar filtros
+            st.subheader("📊 Timeframes para Filtro")
+            # Mantém apenas timeframes ainda disponíveis (as opções dependem de intervals)
+            ss.user_filter_timeframes = [
+                tf for tf in ss.user_filter_timeframes if tf in intervals
+            ]
+            filter_timeframes = st.multiselect(
+                "Selecione os timeframes para aplicar os filtros:",
+                intervals,
+                key="user_filter_timeframes",
+                help="Timeframes que serão usados nos filtros abaixo"
+            )
+            
+            # Filtro: Todos Acima
+            st.subheader("📈 Filtro Geral - Todos Acima")
+            enable_above = st.checkbox("Ativar filtro 'Todos acima'", key="enable_above")
+            value_above = st.slider("Valor mínimo para os selecionados", 0, 100, key="all_above")
+            
+            # Filtro: Todos Abaixo
+            st.subheader("📉 Filtro Geral - Todos Abaixo")
+            enable_below = st.checkbox("Ativar filtro 'Todos abaixo'", key="enable_below")
+            value_below = st.slider("Valor máximo para os selecionados", 0, 100, key="all_below")
+            
+            # Filtro: Extremos
+            st.subheader("🎯 Filtro Extremos (abaixo/acima)")
+            enable_extremos = st.checkbox("Ativar filtro de extremos", key="enable_extremos")
+            extremos_min, extremos_max = st.slider(
+                "Defina os valores dos extremos (mínimo e máximo)",
+                0, 100, key="extremos_range"
+            )
+            
+            # Filtro: Intervalo Personalizado
+            st.subheader("🟩 Filtro Intervalo Personalizado (meio)")
+            enable_intervalo = st.checkbox("Ativar filtro de intervalo personalizado", key="enable_intervalo")
+            intervalo_min, intervalo_max = st.slider(
+                "Defina o intervalo central (mínimo e máximo)",
+                0, 100, key="intervalo_range"
+            )
+            
+            # Configurar filtros (valores só valem com o filtro ativado)
+            stoch_filter = {
+                'filter_timeframes': filter_timeframes,
+                'enable_above': enable_above,
+                'value_above': value_above if enable_above else None,
+                'enable_below': enable_below,
+                'value_below': value_below if enable_below else None,
+                'enable_extremos': enable_extremos,
+                'extremos_min': extremos_min if enable_extremos else None,
+                'extremos_max': extremos_max if enable_extremos else None,
+                'enable_intervalo': enable_intervalo,
+                'intervalo_min': intervalo_min if enable_intervalo else None,
+                'intervalo_max': intervalo_max if enable_intervalo else None
+            }
+            
+            # Mostrar apenas sinais
+            show_signals_only = st.checkbox("Mostrar apenas sinais importantes", key="user_show_signals_only")
+            
+            # Seção de parâmetros
+            st.subheader("🔧 Parâmetros")
+            
+            # Informação sobre cálculo automático de dias
+            st.info("📅 Dias de histórico calculados automaticamente para cada timeframe")
+            
+            # Controle de rate limiting
+            st.subheader("⚠️ Rate Limiting")
+            delay_between_requests = st.slider(
+                "Delay entre requisições (ms):",
+                min_value=50,  # Reduzido para aproveitar connection pool maior
+                max_value=2000,
+                step=50,
+                key="user_delay_between_requests",
+                help="Aumentar para evitar rate limiting da API (otimizado para connection pool de 50)"
+            )
+            
+            batch_size = st.slider(
+                "Tamanho do lote:",
+                min_value=5,
+                max_value=50,
+                step=5,
+                key="user_batch_size",
+                help="Número de pares processados por vez (otimizado para connection pool de 50)"
+            )
+            
+            # Dicas de otimização
+            requests_per_minute = (60000 / delay_between_requests) * batch_size if delay_between_requests > 0 else 0
+            
+            if batch_size > 40 and delay_between_requests < 200:
+                notice, advice = st.warning, "⚠️ Configuração de alto risco! Pode resultar em ban da API."
+            elif batch_size <= 25 and delay_between_requests >= 250:
+                notice, advice = st.success, "✅ Configuração segura para evitar rate limiting."
+            else:
+                notice, advice = st.info, "ℹ️ Configuração moderada. Monitore os avisos de rate limiting."
+            
+            st.metric("📊 Taxa estimada", f"{requests_per_minute:.0f} req/min")
+            notice(f"{advice}\n\n🔧 Connection pool: 50 conexões ativas")
+            
+            # Seção de configuração do Renko
+            st.subheader("🧱 Configuração Renko")
+            
+            # Opção para usar ATR dinâmico
+            use_atr = st.checkbox(
+                "Usar ATR dinâmico para brick size",
+                key="user_use_atr",
+                help="Calcula o brick size automaticamente baseado no ATR (Average True Range)"
+            )
+            
+            atr_period = st.slider(
                 "Período do ATR:",
                 min_value=7,
                 max_value=30,
-                value=14,
                 step=1,
-                help="Período para cálculo do ATR (padrão: 14 períodos)"
+                key="user_atr_period",
+                help="Período para cálculo do ATR (padrão: 14 períodos; usado com ATR dinâmico)"
             )
             
-            st.sidebar.info("📊 Brick size será calculado automaticamente baseado na volatilidade")
-            brick_size = None  # Será calculado dinamicamente
-        else:
-            brick_size = st.sidebar.slider(
+            brick_size = st.slider(
                 "Tamanho do tijolo Renko:",
                 min_value=50,
                 max_value=2000,
-                value=200,
                 step=50,
-                help="Tamanho do tijolo em pontos para cálculo do Renko"
+                key="user_brick_size",
+                help="Tamanho do tijolo em pontos (usado sem ATR dinâmico)"
+            )
+            
+            if use_atr:
+                st.info("📊 Brick size será calculado automaticamente baseado na volatilidade")
+                brick_size = None  # Será calculado dinamicamente
+            else:
+                atr_period = 14  # Valor padrão não usado
+            
+            # Opção para usar sempre Renko
+            use_renko_always = st.checkbox(
+                "Usar sempre Renko para todos os timeframes",
+                key="user_use_renko_always",
+                help="Quando ativado, usa Renko para todos os timeframes (recomendado)"
+            )
+            
+            apply_changes = st.form_submit_button(
+                "✅ Aplicar Configurações",
+                help="Atualiza os resultados com os filtros e parâmetros atuais"
             )
-            atr_period = 14  # Valor padrão não usado
         
-        # Opção para usar sempre Renko
-        use_renko_always = st.sidebar.checkbox(
-            "Usar sempre Renko para todos os timeframes",
-            value=True,
-            help="Quando ativado, usa Renko para todos os timeframes (recomendado)"
-        )
+        buttons_pressed = force_refresh or apply_changes
         
         # Cache controls
-        st.sidebar.subheader("💾 Cache de Sessão")
+        st.subheader("💾 Cache de Sessão")
         
         # Informações do cache
-        if st.session_state.updating_data:
-            st.sidebar.warning("🔄 Atualizando dados...")
-            st.sidebar.info("⚡ Interface continua funcional")
-        elif st.session_state.data_timestamp:
-            cache_age = (datetime.now() - st.session_state.data_timestamp).total_seconds() / 60
-            cached_pairs = len(st.session_state.cached_data) if st.session_state.cached_data else 0
-            st.sidebar.success(f"✅ Cache ativo: {cached_pairs} pares")
+        if ss.updating_data:
+            st.warning("🔄 Atualizando dados...\n\n⚡ Interface continua funcional")
+        elif cache.data_timestamp:
+            cache_age = (now - cache.data_timestamp) / 60
+            cached_pairs = len(cache.cached_data) if cache.cached_data else 0
+            cache_status = f"✅ Cache ativo: {cached_pairs} pares"
             
             if cache_age < 5:
-                st.sidebar.success(f"⚡ Dados atuais: {cache_age:.1f} min")
+                st.success(f"{cache_status}\n\n⚡ Dados atuais: {cache_age:.1f} min")
             elif cache_age < 30:
-                st.sidebar.info(f"⏰ Idade: {cache_age:.1f} min")
+                st.info(f"{cache_status}\n\n⏰ Idade: {cache_age:.1f} min")
             else:
-                st.sidebar.warning(f"⚠️ Dados antigos: {cache_age:.1f} min")
+                st.warning(f"{cache_status}\n\n⚠️ Dados antigos: {cache_age:.1f} min")
             
             # Botão para limpar cache da sessão
-            if st.sidebar.button("🗑️ Limpar Cache Sessão", help="Remove dados da sessão atual"):
-                st.session_state.cached_data = {}
-                st.session_state.cached_matriz_stoch = {}
-                st.session_state.data_timestamp = None
-                st.session_state.last_config = {}
-                st.session_state.updating_data = False
-                st.success("🗑️ Cache da sessão limpo!")
-                st.rerun()
+            if st.button("🗑️ Limpar Cache Sessão", help="Remove dados da sessão atual (e a cópia em disco desta configuração)"):
+                # Remove só a entrada da configuração aplicada; as demais
+                # configurações e sessões mantêm a cópia em disco
+                disk_cache = get_disk_cache()
+                applied = ss.get('applied_sidebar')
+                if disk_cache is not None and applied is not None:
+                    (applied_pairs, applied_intervals, applied_brick_size, _, _, applied_renko_always,
+                     _, _, _, applied_use_atr, applied_atr_period) = applied
+                    try:
+                        disk_cache.delete(self.disk_cache_key(
+                            applied_pairs, applied_intervals, applied_brick_size,
+                            applied_use_atr, applied_atr_period, applied_renko_always
+                        ))
+                    except Exception as e:
+                        logger.warning(f"Erro ao remover cache em disco: {e}")
+                cache.clear()
+                ss.updating_data = False
+                # Sem rerun: a próxima execução já encontra a sessão vazia
+                st.toast("🗑️ Cache da sessão limpo!")
         else:
-            st.sidebar.warning("⚠️ Nenhum cache ativo")
-            st.sidebar.info("💡 Dados serão carregados na primeira execução")
+            st.warning("⚠️ Nenhum cache ativo\n\n💡 Dados serão carregados na primeira execução")
         
-        st.sidebar.subheader("💾 Cache Arquivos")
-        col1, col2 = st.sidebar.columns(2)
+        st.subheader("💾 Cache Arquivos")
+        col1, col2 = st.columns(2)
         
         with col1:
             if st.button("Limpar Cache"):
@@ -518,25 +1446,42 @@ class TradingDashboard:
         # Informações do cache de arquivos
         cache_info = self.data_manager.get_cache_info()
         if cache_info.get('cache_enabled'):
-            st.sidebar.info(f"📁 Cache arquivos: {cache_info.get('valid_files', 0)}/{cache_info.get('total_files', 0)} válidos")
+            st.info(f"📁 Cache arquivos: {cache_info.get('valid_files', 0)}/{cache_info.get('total_files', 0)} válidos")
         
         # Opção para usar cache em caso de erro
-        use_cache_fallback = st.sidebar.checkbox(
+        use_cache_fallback = st.checkbox(
             "Usar cache como fallback",
-            value=True,
+            key="user_use_cache_fallback",
             help="Usa dados em cache (mesmo expirados) se API falhar"
         )
         
-        return trading_pairs, intervals, brick_size, stoch_filter, show_signals_only, use_renko_always, delay_between_requests, batch_size, use_cache_fallback, use_atr, atr_period, force_refresh
+        ss.sidebar_result = (
+            trading_pairs, intervals, brick_size, stoch_filter, show_signals_only, use_renko_always,
+            delay_between_requests, batch_size, use_cache_fallback, use_atr, atr_period
+        )
+        
+        # Primeira execução, pedido explícito ou auto-refresh: aplica os parâmetros atuais
+        if buttons_pressed or auto_refreshed or ss.get('applied_sidebar') is None:
+            ss.applied_sidebar = ss.sidebar_result
+        
+        if force_refresh:
+            ss.pending_force_refresh = True
+        
+        # Cliques nos botões reexecutam só o fragmento; o conteúdo principal
+        # precisa de um rerun completo para usar os novos parâmetros
+        if buttons_pressed:
+            st.rerun(scope="app")
     
     def render_main_content(self, trading_pairs, intervals, brick_size, stoch_filter, show_signals_only, use_renko_always, delay_between_requests, batch_size, use_cache_fallback, use_atr=True, atr_period=14, force_refresh=False):
         """Renderiza o conteúdo principal."""
+        ss = st.session_state
+        cache = self.cache
+        
         st.title("📊 Dashboard Crypto Filtering - Renko + StochRSI")
         st.markdown("Dev by aishend - Stochastic Renko Version ☕️")
         
         # Exibe informação sobre dados atuais
-        current_time = datetime.now()
-        st.info(f"🕐 **Dados atualizados até:** {current_time.strftime('%Y-%m-%d %H:%M:%S')} (momento atual)")
+        st.info(f"🕐 **Dados atualizados até:** {self.now_wall.strftime('%Y-%m-%d %H:%M:%S')} (momento atual)")
         
         if not trading_pairs:
             st.warning("⚠️ Nenhum par de trading carregado.")
@@ -562,10 +1507,10 @@ class TradingDashboard:
             st.metric("⚡ Delay (ms)", delay_between_requests)
         
         # Coleta dados com cache inteligente
-        need_refresh = self.needs_data_refresh(trading_pairs, intervals, brick_size, use_atr, atr_period, force_refresh)
+        need_refresh = self.needs_data_refresh(trading_pairs, intervals, brick_size, use_atr, atr_period, use_renko_always, force_refresh)
         
         # Primeiro mostra dados em cache se existirem (para o usuário não ficar sem ver nada)
-        has_cached_data = st.session_state.cached_data and st.session_state.cached_matriz_stoch
+        has_cached_data = cache.cached_data and cache.cached_matriz_stoch
         
         if has_cached_data and need_refresh:
             # Mostra dados anteriores enquanto carrega novos
@@ -573,12 +1518,11 @@ class TradingDashboard:
             
             # Aplica os filtros nos dados atuais primeiro para o usuário ver
             self.show_active_filters(stoch_filter)
-            matriz_original = matriz_stoch.copy()
-            matriz_stoch_filtered = self.apply_stoch_filter(matriz_stoch, stoch_filter, show_signals_only)
+            original_count = len(matriz_stoch)
+            matriz_stoch_filtered = self.get_filtered_matrix(matriz_stoch, stoch_filter, show_signals_only)
             
             # Mostra dados atuais enquanto atualiza
             if stoch_filter.get('filter_timeframes'):
-                original_count = len(matriz_original)
                 filtered_count = len(matriz_stoch_filtered)
                 removed_count = original_count - filtered_count
                 
@@ -598,46 +1542,22 @@ class TradingDashboard:
             col1, col2 = st.columns(2)
             with col1:
                 if st.button("🔄 Atualizar Dados Agora", type="primary"):
-                    # Marca que vai atualizar
-                    st.session_state.updating_data = True
-                    st.rerun()
+                    # Marca que vai atualizar; o bloco abaixo roda nesta mesma execução
+                    ss.updating_data = True
             with col2:
                 st.info("💡 Use o botão 'Forçar Atualização' na sidebar para atualizar automaticamente")
             
             # Se foi marcado para atualizar, faz a atualização
-            if st.session_state.updating_data:
+            if ss.updating_data:
                 with st.spinner("📡 Atualizando dados da API..."):
                     try:
-                        # Monitora logs para detectar rate limiting
-                        import logging
-                        rate_limit_warnings = []
-                        
-                        # Captura logs de rate limiting
-                        class RateLimitHandler(logging.Handler):
-                            def emit(self, record):
-                                if "Rate limit" in record.getMessage():
-                                    rate_limit_warnings.append(record.getMessage())
-                        
-                        handler = RateLimitHandler()
-                        binance_logger = logging.getLogger('src.api.binance_client')
-                        binance_logger.addHandler(handler)
-                        
-                        all_data_new = self.get_data_with_brick_size(
-                            trading_pairs, intervals, brick_size, batch_size, 
-                            delay_between_requests / 1000, use_cache_fallback, force_refresh
+                        all_data_new, _, rate_limit_warnings = self.refresh_data(
+                            trading_pairs, intervals, brick_size, use_atr, atr_period,
+                            use_renko_always, batch_size, delay_between_requests, use_cache_fallback, force_refresh
                         )
                         
-                        # Remove handler
-                        binance_logger.removeHandler(handler)
-                        
-                        # Processa dados e calcula indicadores
-                        matriz_stoch_new = self.process_data_matrix(all_data_new, intervals, brick_size, use_renko_always, use_atr, atr_period)
-                        
-                        # Armazena no cache
-                        self.cache_data(trading_pairs, intervals, brick_size, use_atr, atr_period, all_data_new, matriz_stoch_new)
-                        
                         # Marca que terminou de atualizar
-                        st.session_state.updating_data = False
+                        ss.updating_data = False
                         
                         # Mostra resultado da atualização
                         if rate_limit_warnings:
@@ -649,7 +1569,7 @@ class TradingDashboard:
                         st.rerun()
                         
                     except Exception as e:
-                        st.session_state.updating_data = False
+                        ss.updating_data = False
                         st.error(f"❌ Erro durante atualização: {e}")
                         logger.error(f"Erro na atualização: {e}")
             
@@ -659,34 +1579,11 @@ class TradingDashboard:
         elif need_refresh:
             with st.spinner("📡 Coletando novos dados da API..."):
                 try:
-                    # Monitora logs para detectar rate limiting
-                    import logging
-                    rate_limit_warnings = []
-                    
-                    # Captura logs de rate limiting
-                    class RateLimitHandler(logging.Handler):
-                        def emit(self, record):
-                            if "Rate limit" in record.getMessage():
-                                rate_limit_warnings.append(record.getMessage())
-                    
-                    handler = RateLimitHandler()
-                    binance_logger = logging.getLogger('src.api.binance_client')
-                    binance_logger.addHandler(handler)
-                    
-                    all_data = self.get_data_with_brick_size(
-                        trading_pairs, intervals, brick_size, batch_size, delay_between_requests / 1000, use_cache_fallback, force_refresh
+                    all_data, matriz_stoch, rate_limit_warnings = self.refresh_data(
+                        trading_pairs, intervals, brick_size, use_atr, atr_period,
+                        use_renko_always, batch_size, delay_between_requests, use_cache_fallback, force_refresh
                     )
                     
-                    # Remove handler
-                    binance_logger.removeHandler(handler)
-                    
-                    # Processa dados e calcula indicadores
-                    with st.spinner("🔍 Calculando indicadores StochRSI..."):
-                        matriz_stoch = self.process_data_matrix(all_data, intervals, brick_size, use_renko_always, use_atr, atr_period)
-                    
-                    # Armazena no cache
-                    self.cache_data(trading_pairs, intervals, brick_size, use_atr, atr_period, all_data, matriz_stoch)
-                    
                     # Mostra resultado
                     if rate_limit_warnings:
                         st.warning(f"⚠️ {len(rate_limit_warnings)} avisos de rate limiting detectados. Considere aumentar o delay entre requisições.")
@@ -718,13 +1615,12 @@ class TradingDashboard:
         # Mostra filtros ativos
         self.show_active_filters(stoch_filter)
         
-        # Aplica filtros
-        matriz_original = matriz_stoch.copy()
-        matriz_stoch = self.apply_stoch_filter(matriz_stoch, stoch_filter, show_signals_only)
+        # Aplica filtros (reaproveita o resultado se dados e filtros não mudaram)
+        original_count = len(matriz_stoch)
+        matriz_stoch = self.get_filtered_matrix(matriz_stoch, stoch_filter, show_signals_only)
         
         # Mostra estatísticas de filtragem
         if stoch_filter.get('filter_timeframes'):
-            original_count = len(matriz_original)
             filtered_count = len(matriz_stoch)
             removed_count = original_count - filtered_count
             
@@ -754,51 +1650,23 @@ class TradingDashboard:
             st.warning("⚠️ Nenhum resultado para exibir após aplicar filtros.")
             return
         
-        # Cria dados para a tabela
-        table_data = []
-        
-        for symbol in sorted(matriz_stoch.keys()):
-            row = [symbol]  # Primeira coluna é o par
-            
-            # Adiciona valores para cada timeframe
-            for interval in intervals:
-                data = matriz_stoch[symbol].get(interval)
-                
-                if data is None:
-                    row.append("N/A")
-                else:
-                    k_value = data['StochRSI_%K']
-                    
-                    # Determina cor baseada no valor
-                    if k_value < 20:
-                        row.append(f"🟢 {k_value:.1f}")  # Oversold
-                    elif k_value > 80:
-                        row.append(f"🔴 {k_value:.1f}")  # Overbought
-                    else:
-                        row.append(f"{k_value:.1f}")  # Normal
-            
-            table_data.append(row)
-        
-        # Cria DataFrame
-        columns = ["Par"] + intervals
-        df = pd.DataFrame(table_data, columns=columns)
+        # Chave pequena e hashável: só o %K de cada célula exibida
+        def k_row(intervals_data):
+            cells = map(intervals_data.get, intervals)
+            return tuple(None if data is None else data['StochRSI_%K'] for data in cells)
         
-        # Função para colorir células
-        def color_cells(val):
-            if isinstance(val, str):
-                if "🟢" in val:
-                    return "background-color: #90EE90; color: black; font-weight: bold;"
-                elif "🔴" in val:
-                    return "background-color: #FFB6C1; color: black; font-weight: bold;"
-                elif val == "N/A":
-                    return "background-color: #f0f0f0; color: #666;"
-            return ""
-        
-        # Aplica estilo
-        styled_df = df.style.map(color_cells)
+        k_rows = tuple((symbol, k_row(matriz_stoch[symbol])) for symbol in sorted(matriz_stoch.keys()))
+        df, cell_styles = build_stoch_table(k_rows, tuple(intervals))
         
-        # Exibe tabela
-        st.dataframe(styled_df, use_container_width=True, height=600)
+        if len(k_rows) > HTML_TABLE_MIN_ROWS:
+            # Tabela grande: HTML pronto, sem o payload de estilos do Styler
+            st.markdown(build_stoch_table_html(k_rows, tuple(intervals)), unsafe_allow_html=True)
+        else:
+            # Aplica estilo (uma única chamada com a tabela de CSS pronta)
+            styled_df = df.style.apply(lambda _: cell_styles, axis=None)
+            
+            # Exibe tabela
+            st.dataframe(styled_df, use_container_width=True, height=600)
         
         # Legenda
         st.markdown("""
@@ -850,12 +1718,21 @@ class TradingDashboard:
             st.info("ℹ️ Nenhum filtro ativo - mostrando todos os pares")
     
     def process_data_matrix(self, all_data, intervals, brick_size, use_renko_always=True, use_atr=True, atr_period=14):
-        """Processa dados em formato de matriz com Renko para todos os timeframes."""
-        matriz_stoch = {}
+        """
+        Processa dados em formato de matriz com Renko para todos os timeframes.
+        
+        O Renko é gerado por par/timeframe (com cache por conteúdo em
+        compute_renko_cell); o StochRSI é calculado em uma única chamada sobre
+        todas as séries concatenadas (stochrsi_panel).
+        """
+        matriz_stoch = {symbol: {} for symbol in all_data}
+        series_closes = {}
+        series_last_dates = {}
+        
+        # Caminho do Renko resolvido uma vez, não por célula
+        cell_params = renko_cell_params(brick_size, use_renko_always, use_atr, atr_period)
         
         for symbol in all_data:
-            matriz_stoch[symbol] = {}
-            
             for tf in intervals:
                 try:
                     df = all_data[symbol][tf]
@@ -864,67 +1741,60 @@ class TradingDashboard:
                         logger.warning(f"Dados vazios para {symbol} {tf}")
                         continue
                     
-                    # Usar sempre Renko se especificado
-                    if use_renko_always:
-                        # Usar ATR dinâmico ou brick size fixo
-                        if use_atr:
-                            renko_df = gerar_renko(df, brick_size=None, symbol=symbol, use_atr=True, atr_period=atr_period)
-                        else:
-                            renko_df = gerar_renko(df, brick_size=brick_size, symbol=symbol, use_atr=False, atr_period=atr_period)
-                        
-                        if renko_df.empty:
-                            logger.warning(f"Dados Renko vazios para {symbol} {tf}")
-                            continue
-                        closes = renko_df['close']
-                        dates = pd.to_datetime(renko_df['date'])
-                    else:
-                        # Fallback para dados originais apenas para timeframes muito baixos
-                        if tf == "1m":
-                            closes = df['close']
-                            dates = df.index
-                        else:
-                            renko_df = gerar_renko(df, brick_size)
-                            if renko_df.empty:
-                                logger.warning(f"Dados Renko vazios para {symbol} {tf}")
-                                continue
-                            closes = renko_df['close']
-                            dates = pd.to_datetime(renko_df['date'])
-                    
-                    # Calcula StochRSI
-                    stoch = stochrsi(closes)
-                    stoch = stoch.dropna()
-                    
-                    if stoch.empty:
-                        logger.warning(f"StochRSI vazio para {symbol} {tf}")
+                    cell = compute_renko_cell(frame_digest(df), symbol, tf, *cell_params, df)
+                    if cell is None:
+                        logger.warning(f"Dados Renko vazios para {symbol} {tf}")
                         continue
                     
-                    ultimo = stoch.iloc[-1]
-                    ultima_data = dates.iloc[-1] if len(dates) > 0 else None
-                    
-                    matriz_stoch[symbol][tf] = {
-                        "StochRSI_%K": round(ultimo['stochrsi_k'], 2),
-                        "StochRSI_%D": round(ultimo['stochrsi_d'], 2),
-                        "Signal": self.get_signal(ultimo['stochrsi_k'], ultimo['stochrsi_d']),
-                        "Datetime": ultima_data.strftime('%Y-%m-%d %H:%M') if ultima_data else "N/A",
-                        "Data_Points": len(closes)
-                    }
+                    series_closes[(symbol, tf)], series_last_dates[(symbol, tf)] = cell
                     
                 except Exception as e:
                     logger.error(f"Erro ao processar {symbol} {tf}: {e}")
                     continue
         
+        if not series_closes:
+            return matriz_stoch
+        
+        # Painel longo (symbol, tf, posição): StochRSI de todas as séries em uma passada
+        panel = pd.concat(series_closes, names=['symbol', 'tf', 'pos'])
+        stoch = stochrsi_panel(panel).dropna()
+        ultimos = stoch.groupby(level=['symbol', 'tf'], sort=False).last()
+        
+        k_values = ultimos['stochrsi_k'].to_numpy()
+        d_values = ultimos['stochrsi_d'].to_numpy()
+        signals = self.get_signals(k_values, d_values)
+        
+        for (symbol, tf), k_value, d_value, signal in zip(
+            ultimos.index, k_values.round(2), d_values.round(2), signals
+        ):
+            ultima_data = series_last_dates[(symbol, tf)]
+            
+            matriz_stoch[symbol][tf] = {
+                "StochRSI_%K": float(k_value),
+                "StochRSI_%D": float(d_value),
+                "Signal": signal,
+                "Datetime": ultima_data.strftime('%Y-%m-%d %H:%M') if ultima_data else "N/A",
+                "Data_Points": len(series_closes[(symbol, tf)])
+            }
+        
+        # Séries sem StochRSI válido (dados insuficientes)
+        for symbol, tf in series_closes.keys() - set(ultimos.index):
+            logger.warning(f"StochRSI vazio para {symbol} {tf}")
+        
         return matriz_stoch
     
-    def get_signal(self, k_value, d_value):
-        """Determina sinal baseado nos valores K e D."""
-        if k_value < 20 and d_value < 20:
-            return "🟢 Oversold"
-        elif k_value > 80 and d_value > 80:
-            return "🔴 Overbought"
-        elif k_value > d_value:
-            return "⬆️ Bullish"
-        else:
-            return "⬇️ Bearish"
+    def get_signals(self, k_values, d_values):
+        """
+        Determina os sinais baseados nos valores K e D (vetorizado).
+        
+        Args:
+            k_values: Array com os valores de %K
+            d_values: Array com os valores de %D
+            
+        Returns:
+            Array com um sinal por par de valores
+        """
+        return np.array(SIGNAL_LABELS, dtype=object)[signal_codes(k_values, d_values)]
     
     def display_results(self, resultados):
         """Exibe resultados em tabela."""
@@ -952,20 +1822,22 @@ class TradingDashboard:
         styled_df = df_resultados.style.map(style_signal, subset=['Signal'])        
         st.dataframe(styled_df, use_container_width=True)
         
-        # Estatísticas resumidas
+        # Estatísticas resumidas: uma contagem por sinal distinto, em uma passada
+        signal_counts = df_resultados['Signal'].value_counts()
+        
+        def count_signal(name):
+            return int(sum(count for signal, count in signal_counts.items() if name in signal))
+        
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            oversold_count = sum(1 for r in resultados if "Oversold" in r['Signal'])
-            st.metric("🟢 Oversold", oversold_count)
+            st.metric("🟢 Oversold", count_signal("Oversold"))
         
         with col2:
-            overbought_count = sum(1 for r in resultados if "Overbought" in r['Signal'])
-            st.metric("🔴 Overbought", overbought_count)
+            st.metric("🔴 Overbought", count_signal("Overbought"))
         
         with col3:
-            bullish_count = sum(1 for r in resultados if "Bullish" in r['Signal'])
-            st.metric("⬆️ Bullish", bullish_count)
+            st.metric("⬆️ Bullish", count_signal("Bullish"))
     
     def render_detailed_analysis(self, all_data, intervals, brick_size, use_renko_always=True):
         """Renderiza análise detalhada."""
@@ -998,12 +1870,12 @@ class TradingDashboard:
                     
                     # Mostra dados Renko se usar_renko_always ou não for 1m
                     if use_renko_always or interval != "1m":
-                        renko_df = gerar_renko(df, brick_size)
+                        renko_df = compute_renko_frame(frame_digest(df), brick_size, df)
                         if not renko_df.empty:
                             st.write(f"**Dados Renko (últimos 10 tijolos):**")
                             st.dataframe(renko_df.tail(10))
     
-    def get_data_with_brick_size(self, trading_pairs, intervals, brick_size, batch_size, delay_between_requests, use_cache_fallback, force_refresh=False):
+    def get_data_with_brick_size(self, trading_pairs, intervals, brick_size, batch_size, delay_between_requests, use_cache_fallback, force_refresh=False, reused=None):
         """
         Obtém dados considerando brick_size para cálculo otimizado.
         
@@ -1015,123 +1887,235 @@ class TradingDashboard:
             delay_between_requests: Delay entre requisições
             use_cache_fallback: Usar cache como fallback
             force_refresh: Forçar busca nova da API
+            reused: Dict símbolo -> {intervalo: DataFrame} que não precisa ser buscado
             
         Returns:
             Dict com dados coletados
         """
-        all_data = {}
+        all_data = {symbol: {} for symbol in trading_pairs}
+        
+        candle_opens = {interval: int(candle_open_time(interval)) for interval in intervals}
+        script_ctx = get_script_run_ctx()
+        
+        reused = reused or {}
+        all_data.update(reused)
+        
+        # Ritmo global compartilhado pelas threads: até batch_size requisições
+        # a cada delay_between_requests (mesma taxa estimada na sidebar)
+        workers = min(batch_size or 1, 30)
+        pacer = None
+        if delay_between_requests > 0:
+            pacer = TokenBucketLimiter(TokenBucket(capacity=workers, rate=workers / delay_between_requests))
+        
+        # Busca pares/intervalos em paralelo; o RateLimiter do cliente Binance
+        # continua controlando a taxa global de requisições
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_task = {
+                executor.submit(
+                    self.fetch_pair_interval, symbol, interval, brick_size,
+                    candle_opens[interval], pacer, script_ctx, force_refresh
+                ): (symbol, interval)
+                for symbol in trading_pairs
+                if symbol not in reused
+                for interval in intervals
+            }
+            
+            for future in as_completed(future_to_task):
+                symbol, interval = future_to_task[future]
+                all_data[symbol][interval] = future.result()
+        
+        return all_data
+    
+    def get_reusable_symbol_data(self, trading_pairs, intervals, brick_size, use_renko_always, use_atr, atr_period):
+        """
+        Seleciona pares cujos candles da sessão podem ser reaproveitados.
+        
+        Um único snapshot de preços (todos os pares em uma requisição) serve de
+        detector de mudança: se em nenhum timeframe o preço atual formaria um
+        tijolo Renko novo a partir do último tijolo em cache
+        (renko_price_in_band) e os candles estão no máximo um candle
+        atrasados, a busca de OHLCV do par é dispensada.
+        
+        Vale apenas para Renko em todos os timeframes com brick fixo: com ATR
+        um candle novo muda o tamanho do tijolo, e no modo misto os candles
+        crus mudam a cada negócio.
+        
+        Args:
+            trading_pairs: Lista de pares de trading
+            intervals: Lista de intervalos
+            brick_size: Tamanho do tijolo Renko
+            use_renko_always: Sempre usar Renko
+            use_atr: Usar ATR para brick size dinâmico
+            atr_period: Período do ATR
+            
+        Returns:
+            Dict símbolo -> {intervalo: DataFrame} reaproveitáveis
+        """
+        cached_data = self.cache.cached_data
+        if not cached_data or not intervals:
+            return {}
         
-        # Coleta dados para cada par individualmente para poder passar brick_size
+        # Brick via ATR muda a cada candle novo e candles crus (modo misto)
+        # mudam a cada negócio: só o brick fixo permite reaproveitar
+        if not use_renko_always or use_atr:
+            return {}
+        
+        snapshot = self.data_manager.fetch_all_tickers_snapshot()
+        if not snapshot:
+            return {}
+        
+        cell_params = renko_cell_params(brick_size, use_renko_always, use_atr, atr_period)
+        candle_opens = {tf: candle_open_time(tf) for tf in intervals}
+        
+        reusable = {}
         for symbol in trading_pairs:
-            all_data[symbol] = {}
-            for interval in intervals:
-                try:
-                    # Usa o método atualizado que considera brick_size e busca dados atuais
-                    # Se force_refresh é True, força busca nova mesmo com cache válido
-                    data = self.data_manager.get_symbol_data(
-                        symbol, 
-                        interval, 
-                        brick_size=brick_size,
-                        extend_to_current=True,  # Sempre busca dados até o momento atual
-                        force_cache=False if force_refresh else None  # Se force_refresh, não usa cache
-                    )
-                    all_data[symbol][interval] = data
-                    
-                    if not data.empty:
-                        # Mostra informação sobre o último candle
-                        last_time = data.index[-1]
-                        current_time = datetime.now()
-                        
-                        # Calcula diferença em minutos
-                        if hasattr(last_time, 'to_pydatetime'):
-                            last_time = last_time.to_pydatetime()
-                        
-                        diff_minutes = (current_time - last_time).total_seconds() / 60
-                        
-                        logger.info(f"Dados obtidos para {symbol} {interval}: {len(data)} registros")
-                        logger.info(f"Último candle: {last_time} (há {diff_minutes:.1f} minutos)")
-                        
-                        # Aviso se dados estão muito antigos
-                        if diff_minutes > 60:  # Mais de 1 hora
-                            logger.warning(f"Dados podem estar desatualizados para {symbol} {interval}")
-                    else:
-                        logger.warning(f"Nenhum dado obtido para {symbol} {interval}")
-                        
-                except Exception as e:
-                    logger.error(f"Erro ao obter dados para {symbol} {interval}: {e}")
-                    all_data[symbol][interval] = pd.DataFrame()
-                    
-                # Delay entre requisições
-                if delay_between_requests > 0:
-                    time.sleep(delay_between_requests)
+            price = snapshot.get(symbol)
+            frames = cached_data.get(symbol, {})
+            
+            if price is None or any(frames.get(tf) is None or frames[tf].empty for tf in intervals):
+                continue
+            
+            # No máximo um candle atrasado em cada intervalo
+            if any(
+                pd.Timestamp(frames[tf].index[-1]).timestamp() < candle_opens[tf] - get_timeframe_minutes(tf) * 60
+                for tf in intervals
+            ):
+                continue
+            
+            # Tijolos da sessão (acerto no cache de compute_renko_cell)
+            cells = [
+                compute_renko_cell(frame_digest(frames[tf]), symbol, tf, *cell_params, frames[tf])
+                for tf in intervals
+            ]
+            if all(cell is not None and renko_price_in_band(cell[0], price) for cell in cells):
+                reusable[symbol] = {tf: frames[tf] for tf in intervals}
         
-        return all_data
+        if reusable:
+            logger.info(f"Snapshot de preços: {len(reusable)} pares sem tijolo novo reaproveitados do cache")
+        
+        return reusable
+    
+    def fetch_pair_interval(self, symbol, interval, brick_size, candle_open, pacer=None, script_ctx=None, force_refresh=False):
+        """
+        Busca dados de um par/intervalo (executado nas threads de coleta).
+        
+        Args:
+            symbol: Par de trading
+            interval: Intervalo de tempo
+            brick_size: Tamanho do tijolo Renko
+            candle_open: Epoch de abertura do candle atual
+            pacer: Limitador de ritmo compartilhado entre as threads (opcional)
+            script_ctx: Contexto do script Streamlit para a thread (opcional)
+            force_refresh: Buscar da API sem passar pelo cache compartilhado
+            
+        Returns:
+            DataFrame com dados OHLCV (vazio em caso de erro)
+        """
+        # Permite usar o cache do Streamlit a partir da thread de coleta
+        if script_ctx is not None:
+            add_script_run_ctx(threading.current_thread(), script_ctx)
+        
+        try:
+            # Cache alinhado ao candle atual; busca dados até o momento atual.
+            # A atualização forçada busca só este par/intervalo, sem limpar o
+            # cache das outras sessões. A cópia rasa impede que o chamador
+            # troque colunas do objeto em cache
+            if force_refresh:
+                data = load_symbol_data(symbol, interval, brick_size, pacer=pacer)
+            else:
+                data = fetch_symbol_data(symbol, interval, brick_size, candle_open, _pacer=pacer)
+            data = data.copy(deep=False)
+            
+            # Mostra informação sobre o último candle
+            last_time = data.index[-1]
+            current_time = datetime.now()
+            
+            # Calcula diferença em minutos
+            if hasattr(last_time, 'to_pydatetime'):
+                last_time = last_time.to_pydatetime()
+            
+            diff_minutes = (current_time - last_time).total_seconds() / 60
+            
+            logger.info(f"Dados obtidos para {symbol} {interval}: {len(data)} registros")
+            logger.info(f"Último candle: {last_time} (há {diff_minutes:.1f} minutos)")
+            
+            # Aviso se dados estão muito antigos
+            if diff_minutes > 60:  # Mais de 1 hora
+                logger.warning(f"Dados podem estar desatualizados para {symbol} {interval}")
+                
+        except ValueError as e:
+            logger.warning(str(e))
+            data = pd.DataFrame()
+        except Exception as e:
+            logger.error(f"Erro ao obter dados para {symbol} {interval}: {e}")
+            data = pd.DataFrame()
+        
+        return data
 
     # ...existing code...
     
+    def get_filtered_matrix(self, matriz_stoch, stoch_filter, show_signals_only):
+        """
+        Aplica os filtros StochRSI reaproveitando o último resultado.
+        
+        Reruns que não alteram os dados em cache nem os filtros (ex.: cliques
+        em outros controles) devolvem a matriz filtrada anterior sem refazer
+        a filtragem.
+        
+        Args:
+            matriz_stoch: Matriz StochRSI completa
+            stoch_filter: Configuração dos filtros
+            show_signals_only: Mostrar apenas sinais importantes
+            
+        Returns:
+            Matriz StochRSI filtrada
+        """
+        ss = st.session_state
+        cache = self.cache
+        
+        state_key = (
+            cache.data_timestamp,
+            tuple(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in sorted(stoch_filter.items())
+            ),
+            show_signals_only
+        )
+        
+        if ss.get('_last_filter_key') == state_key:
+            return ss['_last_filter_output']
+        
+        filtered_matriz = self.apply_stoch_filter(matriz_stoch, stoch_filter, show_signals_only)
+        ss['_last_filter_key'] = state_key
+        ss['_last_filter_output'] = filtered_matriz
+        return filtered_matriz
+    
     def apply_stoch_filter(self, matriz_stoch, stoch_filter, show_signals_only):
         """Aplica filtros baseados no StochRSI %K seguindo o exemplo fornecido."""
         if not stoch_filter.get('filter_timeframes'):
             return matriz_stoch
         
-        filtered_matriz = {}
-        filter_timeframes = stoch_filter['filter_timeframes']
+        ss = st.session_state
+        cache = self.cache
         
-        for symbol, intervals_data in matriz_stoch.items():
-            include_symbol = True
-            
-            # Coleta valores StochRSI para os timeframes selecionados
-            stoch_values = []
-            for tf in filter_timeframes:
-                if tf in intervals_data and intervals_data[tf] is not None:
-                    stoch_values.append(intervals_data[tf]['StochRSI_%K'])
-                else:
-                    include_symbol = False
-                    break
-            
-            # Aplica filtros se há dados suficientes
-            if include_symbol and stoch_values:
-                # Filtro: Todos Acima
-                if stoch_filter['enable_above'] and stoch_filter['value_above'] is not None:
-                    if not all(v >= stoch_filter['value_above'] for v in stoch_values):
-                        include_symbol = False
-                
-                # Filtro: Todos Abaixo
-                if stoch_filter['enable_below'] and stoch_filter['value_below'] is not None:
-                    if not all(v <= stoch_filter['value_below'] for v in stoch_values):
-                        include_symbol = False
-                
-                # Filtro: Extremos (todos devem estar abaixo do min OU acima do max)
-                if stoch_filter['enable_extremos'] and stoch_filter['extremos_min'] is not None:
-                    extremos_min = stoch_filter['extremos_min']
-                    extremos_max = stoch_filter['extremos_max']
-                    if not all((v <= extremos_min or v >= extremos_max) for v in stoch_values):
-                        include_symbol = False
-                
-                # Filtro: Intervalo Personalizado (todos devem estar dentro do intervalo)
-                if stoch_filter['enable_intervalo'] and stoch_filter['intervalo_min'] is not None:
-                    intervalo_min = stoch_filter['intervalo_min']
-                    intervalo_max = stoch_filter['intervalo_max']
-                    if not all((intervalo_min <= v <= intervalo_max) for v in stoch_values):
-                        include_symbol = False
-            
-            # Filtro adicional para mostrar apenas sinais importantes
-            if show_signals_only and include_symbol:
-                has_important_signal = False
-                for tf_data in intervals_data.values():
-                    if tf_data is not None:
-                        signal = tf_data['Signal']
-                        if "Oversold" in signal or "Overbought" in signal:
-                            has_important_signal = True
-                            break
-                if not has_important_signal:
-                    include_symbol = False
-            
-            # Inclui o símbolo se passou em todos os filtros
-            if include_symbol:
-                filtered_matriz[symbol] = intervals_data
+        # Matriz compacta, reaproveitada enquanto a matriz em cache não mudar
+        cells_key = (cache.data_timestamp, id(matriz_stoch))
+        if ss.get('_stoch_cells_key') != cells_key:
+            ss['_stoch_cells'] = build_stoch_cells(matriz_stoch)
+            ss['_stoch_cells_key'] = cells_key
+        timeframes, cells = ss['_stoch_cells']
         
-        return filtered_matriz
+        # Colunas dos timeframes de filtro; timeframe ausente usa a coluna vazia
+        columns = [timeframes.get(tf, -1) for tf in stoch_filter['filter_timeframes']]
+        passed = stoch_filter_mask(cells['k'][:, columns], stoch_filter)
+        
+        # Filtro adicional para mostrar apenas sinais importantes
+        if show_signals_only:
+            signals = cells['signal']
+            passed &= ((signals == SIGNAL_OVERSOLD) | (signals == SIGNAL_OVERBOUGHT)).any(axis=1)
+        
+        symbols = list(matriz_stoch)
+        return {symbols[row]: matriz_stoch[symbols[row]] for row in np.flatnonzero(passed)}
     
     def display_matrix_results(self, matriz_stoch, intervals):
         """Exibe resultados em formato de matriz."""
@@ -1146,9 +2130,10 @@ class TradingDashboard:
         
         for symbol in sorted(matriz_stoch.keys()):
             row = {"Par": symbol}
+            intervals_data = matriz_stoch[symbol]
             
             for interval in intervals:
-                data = matriz_stoch[symbol].get(interval)
+                data = intervals_data.get(interval)
                 
                 if data is None:
                     row[interval] = "N/A"
@@ -1208,28 +2193,20 @@ class TradingDashboard:
         
         st.subheader("📊 Estatísticas Resumidas")
         
-        # Conta sinais por tipo
-        oversold_count = 0
-        overbought_count = 0
-        normal_count = 0
-        na_count = 0
-        total_signals = 0
-        
-        for symbol, intervals_data in matriz_stoch.items():
-            for interval, data in intervals_data.items():
-                total_signals += 1
-                
-                if data is None:
-                    na_count += 1
-                else:
-                    k_value = data['StochRSI_%K']
-                    
-                    if k_value < 20:
-                        oversold_count += 1
-                    elif k_value > 80:
-                        overbought_count += 1
-                    else:
-                        normal_count += 1
+        # Conta sinais por tipo em uma passada vetorizada (NaN = célula sem dados)
+        k_values = np.fromiter(
+            (
+                np.nan if data is None else data['StochRSI_%K']
+                for intervals_data in matriz_stoch.values()
+                for data in intervals_data.values()
+            ),
+            dtype=np.float64
+        )
+        total_signals = k_values.size
+        na_count = int(np.count_nonzero(np.isnan(k_values)))
+        oversold_count = int(np.count_nonzero(k_values < 20))
+        overbought_count = int(np.count_nonzero(k_values > 80))
+        normal_count = total_signals - na_count - oversold_count - overbought_count
         
         # Exibe métricas
         col1, col2, col3, col4, col5 = st.columns(5)
@@ -1291,20 +2268,65 @@ class TradingDashboard:
                     
                     # Mostra dados Renko se usar sempre Renko ou não for 1m
                     if use_renko_always or interval != "1m":
-                        renko_df = gerar_renko(df, brick_size)
+                        renko_df = compute_renko_frame(frame_digest(df), brick_size, df)
                         if not renko_df.empty:
                             st.write(f"**Dados Renko (últimos 10 tijolos):**")
                             st.dataframe(renko_df.tail(10))
     
+    def compute_test_chart_data(self, all_data, test_pairs, intervals, brick_size, use_atr, atr_period):
+        """
+        Calcula Renko e StochRSI de todos os pares/intervalos de teste em paralelo.
+        
+        As células são independentes e o kernel Renko (numba, nogil) libera o
+        GIL, então as threads rodam de fato em paralelo; a renderização do
+        Streamlit continua sequencial em display_test_charts.
+        
+        Args:
+            all_data: Dados de todos os pares
+            test_pairs: Pares de teste
+            intervals: Lista de intervalos
+            brick_size: Tamanho do tijolo Renko
+            use_atr: Usar ATR para brick size dinâmico
+            atr_period: Período do ATR
+            
+        Returns:
+            Dicionário (par, intervalo) -> (DataFrame Renko, DataFrame StochRSI)
+        """
+        tasks = [
+            (symbol, interval, all_data[symbol][interval])
+            for symbol in test_pairs
+            if symbol in all_data
+            for interval in intervals
+            if interval in all_data[symbol] and not all_data[symbol][interval].empty
+        ]
+        if not tasks:
+            return {}
+        
+        script_ctx = get_script_run_ctx()
+        fixed_brick = None if use_atr else brick_size
+        
+        def compute(symbol, df):
+            # Permite usar o cache do Streamlit a partir da thread de cálculo
+            if script_ctx is not None:
+                add_script_run_ctx(threading.current_thread(), script_ctx)
+            return compute_renko_stoch(frame_digest(df), symbol, fixed_brick, use_atr, atr_period, df)
+        
+        workers = min(len(tasks), os.cpu_count() or 1, 8)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                (symbol, interval): executor.submit(compute, symbol, df)
+                for symbol, interval, df in tasks
+            }
+            return {key: future.result() for key, future in futures.items()}
+    
     def display_test_charts(self, all_data, intervals, brick_size, use_atr, atr_period):
         """Exibe gráficos detalhados no modo teste."""
-        import plotly.graph_objects as go
-        import plotly.express as px
-        from plotly.subplots import make_subplots
-        
         # Pega os pares de teste
         test_pairs = get_trading_pairs_for_mode("test_mode")
         
+        # Calcula todos os Renko/StochRSI antes de desenhar as abas
+        chart_data = self.compute_test_chart_data(all_data, test_pairs, intervals, brick_size, use_atr, atr_period)
+        
         # Cria abas para cada par
         tabs = st.tabs([f"📊 {pair}" for pair in test_pairs])
         
@@ -1329,26 +2351,25 @@ class TradingDashboard:
                             st.warning(f"⚠️ DataFrame vazio para {symbol} {interval}")
                             continue
                         
-                        # Gera dados Renko
-                        renko_df = gerar_renko(
-                            df, 
-                            brick_size=brick_size if not use_atr else None,
-                            symbol=symbol,
-                            use_atr=use_atr,
-                            atr_period=atr_period
-                        )
+                        # Renko e StochRSI já calculados em paralelo
+                        renko_df, stoch_df = chart_data[(symbol, interval)]
                         
                         if renko_df.empty:
                             st.warning(f"⚠️ Erro ao gerar Renko para {symbol} {interval}")
                             continue
                         
-                        # Calcula StochRSI - verifica qual coluna usar
-                        close_col = 'Close' if 'Close' in renko_df.columns else 'close'
-                        if close_col in renko_df.columns:
-                            stoch_df = stochrsi(renko_df[close_col])
-                        else:
-                            st.error(f"❌ Coluna 'close' não encontrada no DataFrame Renko: {list(renko_df.columns)}")
-                            continue
+                        # Nomes das colunas OHLC resolvidos uma vez por DataFrame
+                        candle_cols = ohlc_columns(df)
+                        renko_cols = ohlc_columns(renko_df)
+                        
+                        # Janelas exibidas (últimas barras/tijolos), convertidas para numpy uma única vez
+                        df_plot = df.tail(CHART_MAX_CANDLES)
+                        renko_plot = renko_df.tail(CHART_MAX_BRICKS)
+                        stoch_plot = stoch_df.tail(CHART_MAX_BRICKS)
+                        candle_x = df_plot.index.to_numpy()
+                        renko_x = renko_plot.index.to_numpy()
+                        candle_ohlc = OHLCColumns(*(df_plot[name].to_numpy() for name in candle_cols)) if candle_cols is not None else None
+                        renko_ohlc = OHLCColumns(*(renko_plot[name].to_numpy() for name in renko_cols)) if renko_cols is not None else None
                         
                         # Layout em duas colunas
                         col1, col2 = st.columns(2)
@@ -1359,22 +2380,13 @@ class TradingDashboard:
                             # Gráfico de candlestick dos dados originais
                             fig_candle = go.Figure()
                             
-                            # Limita a 200 últimas barras para melhor visualização
-                            df_plot = df.tail(200)
-                            
-                            # Verifica se as colunas existem (podem ser maiúsculas ou minúsculas)
-                            open_col = 'Open' if 'Open' in df_plot.columns else 'open'
-                            high_col = 'High' if 'High' in df_plot.columns else 'high'
-                            low_col = 'Low' if 'Low' in df_plot.columns else 'low'
-                            close_col = 'Close' if 'Close' in df_plot.columns else 'close'
-                            
-                            if all(col in df_plot.columns for col in [open_col, high_col, low_col, close_col]):
+                            if candle_ohlc is not None:
                                 fig_candle.add_trace(go.Candlestick(
-                                    x=df_plot.index,
-                                    open=df_plot[open_col],
-                                    high=df_plot[high_col],
-                                    low=df_plot[low_col],
-                                    close=df_plot[close_col],
+                                    x=candle_x,
+                                    open=candle_ohlc.open,
+                                    high=candle_ohlc.high,
+                                    low=candle_ohlc.low,
+                                    close=candle_ohlc.close,
                                     name=f"{symbol} Candlestick"
                                 ))
                                 
@@ -1397,26 +2409,13 @@ class TradingDashboard:
                             # Gráfico Renko
                             fig_renko = go.Figure()
                             
-                            # Limita a 100 últimos tijolos
-                            renko_plot = renko_df.tail(100)
-                            
-                            # Verifica se as colunas existem no DataFrame Renko
-                            open_col = 'Open' if 'Open' in renko_plot.columns else 'open'
-                            high_col = 'High' if 'High' in renko_plot.columns else 'high'
-                            low_col = 'Low' if 'Low' in renko_plot.columns else 'low'
-                            close_col = 'Close' if 'Close' in renko_plot.columns else 'close'
-                            
-                            if all(col in renko_plot.columns for col in [open_col, high_col, low_col, close_col]):
-                                # Cores para tijolos (verde para alta, vermelho para baixa)
-                                colors = ['green' if close >= open else 'red' 
-                                         for open, close in zip(renko_plot[open_col], renko_plot[close_col])]
-                                
+                            if renko_ohlc is not None:
                                 fig_renko.add_trace(go.Candlestick(
-                                    x=renko_plot.index,
-                                    open=renko_plot[open_col],
-                                    high=renko_plot[high_col],
-                                    low=renko_plot[low_col],
-                                    close=renko_plot[close_col],
+                                    x=renko_x,
+                                    open=renko_ohlc.open,
+                                    high=renko_ohlc.high,
+                                    low=renko_ohlc.low,
+                                    close=renko_ohlc.close,
                                     name=f"{symbol} Renko"
                                 ))
                                 
@@ -1436,44 +2435,32 @@ class TradingDashboard:
                         if not stoch_df.empty:
                             st.write(f"**🎯 StochRSI - {symbol} {interval}**")
                             
-                            fig_stoch = make_subplots(
-                                rows=2, cols=1,
-                                subplot_titles=('Preço Renko', 'StochRSI'),
-                                vertical_spacing=0.25,  # Aumentado significativamente
-                                row_heights=[0.6, 0.4],  # Mais espaço para o StochRSI
-                                specs=[[{"secondary_y": False}], [{"secondary_y": False}]]
-                            )
+                            # Cópia do modelo com subplots, linhas de referência e eixos prontos
+                            fig_stoch = go.Figure(stoch_figure_template())
                             
                             # Subplot 1: Preço Renko
-                            renko_plot = renko_df.tail(100)
-                            
-                            # Verifica colunas novamente para o StochRSI
-                            open_col = 'Open' if 'Open' in renko_plot.columns else 'open'
-                            high_col = 'High' if 'High' in renko_plot.columns else 'high'
-                            low_col = 'Low' if 'Low' in renko_plot.columns else 'low'
-                            close_col = 'Close' if 'Close' in renko_plot.columns else 'close'
-                            
-                            if all(col in renko_plot.columns for col in [open_col, high_col, low_col, close_col]):
+                            if renko_ohlc is not None:
                                 # Apenas o gráfico Candlestick no subplot superior
                                 fig_stoch.add_trace(
                                     go.Candlestick(
-                                        x=renko_plot.index,
-                                        open=renko_plot[open_col],
-                                        high=renko_plot[high_col],
-                                        low=renko_plot[low_col],
-                                        close=renko_plot[close_col],
+                                        x=renko_x,
+                                        open=renko_ohlc.open,
+                                        high=renko_ohlc.high,
+                                        low=renko_ohlc.low,
+                                        close=renko_ohlc.close,
                                         name="Renko",
                                         showlegend=False
                                     ),
                                     row=1, col=1
                                 )
                             
-                            # Subplot 2: StochRSI
-                            stoch_plot = stoch_df.tail(100)
+                            # Subplot 2: StochRSI (linhas WebGL)
+                            k_plot = stoch_plot['stochrsi_k']
+                            d_plot = stoch_plot['stochrsi_d']
                             fig_stoch.add_trace(
-                                go.Scatter(
-                                    x=stoch_plot.index,
-                                    y=stoch_plot['stochrsi_k'],
+                                go.Scattergl(
+                                    x=k_plot.index.to_numpy(),
+                                    y=k_plot.to_numpy(),
                                     mode='lines',
                                     name='%K',
                                     line=dict(color='orange', width=2)
@@ -1482,9 +2469,9 @@ class TradingDashboard:
                             )
                             
                             fig_stoch.add_trace(
-                                go.Scatter(
-                                    x=stoch_plot.index,
-                                    y=stoch_plot['stochrsi_d'],
+                                go.Scattergl(
+                                    x=d_plot.index.to_numpy(),
+                                    y=d_plot.to_numpy(),
                                     mode='lines',
                                     name='%D',
                                     line=dict(color='red', width=2)
@@ -1492,37 +2479,14 @@ class TradingDashboard:
                                 row=2, col=1
                             )
                             
-                            # Linhas de referência no StochRSI
-                            fig_stoch.add_hline(y=80, line_dash="dash", line_color="red", row=2, col=1)
-                            fig_stoch.add_hline(y=20, line_dash="dash", line_color="green", row=2, col=1)
-                            fig_stoch.add_hline(y=50, line_dash="dot", line_color="gray", row=2, col=1)
-                            
-                            fig_stoch.update_layout(
-                                title=f"{symbol} {interval} - Análise Completa",
-                                height=750,  # Aumentado para dar mais espaço
-                                showlegend=True,
-                                margin=dict(l=40, r=40, t=80, b=60)  # Margens maiores
-                            )
-                            
-                            # Configurações específicas para cada subplot
-                            fig_stoch.update_yaxes(title_text="Preço (USD)", row=1, col=1)
-                            fig_stoch.update_yaxes(title_text="StochRSI (%)", row=2, col=1, range=[0, 100])
-                            fig_stoch.update_xaxes(title_text="", row=1, col=1, showticklabels=False)
-                            fig_stoch.update_xaxes(title_text="Tempo", row=2, col=1)
-                            
-                            # Remove grid excessivo
-                            fig_stoch.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
-                            fig_stoch.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
-                            
-                            # Ajusta os títulos dos subplots para não ocupar tanto espaço
-                            fig_stoch.update_annotations(font_size=12)
+                            fig_stoch.update_layout(title=f"{symbol} {interval} - Análise Completa")
                             
                             st.plotly_chart(fig_stoch, use_container_width=True)
                             
                             # Métricas atuais
-                            if len(stoch_df) > 0:
-                                last_k = stoch_df['stochrsi_k'].iloc[-1]
-                                last_d = stoch_df['stochrsi_d'].iloc[-1]
+                            if stoch_df.shape[0]:
+                                last_k = stoch_df['stochrsi_k'].iat[-1]
+                                last_d = stoch_df['stochrsi_d'].iat[-1]
                                 
                                 col1, col2, col3, col4 = st.columns(4)
                                 with col1:
@@ -1546,11 +2510,19 @@ class TradingDashboard:
     def run(self):
         """Executa o dashboard."""
         try:
-            # Renderiza sidebar
-            trading_pairs, intervals, brick_size, stoch_filter, show_signals_only, use_renko_always, delay_between_requests, batch_size, use_cache_fallback, use_atr, atr_period, force_refresh = self.render_sidebar()
+            # Renderiza sidebar (fragmento: widgets não reexecutam o conteúdo principal)
+            with st.sidebar:
+                self.render_sidebar()
+            
+            applied = st.session_state.get('applied_sidebar')
+            if applied is None:
+                return
+            
+            # Refresh pedido pelo botão ou pelo auto-refresh
+            force_refresh = st.session_state.pop('pending_force_refresh', False)
             
-            # Renderiza conteúdo principal
-            self.render_main_content(trading_pairs, intervals, brick_size, stoch_filter, show_signals_only, use_renko_always, delay_between_requests, batch_size, use_cache_fallback, use_atr, atr_period, force_refresh)
+            # Renderiza conteúdo principal com os parâmetros aplicados
+            self.render_main_content(*applied, force_refresh=force_refresh)
             
         except Exception as e:
             st.error(f"❌ Erro no dashboard: {e}")
@@ -17,6 +17,7 @@ import os
 import logging
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
@@ -56,6 +57,7 @@ def run_analysis():
         from src.indicators.renko import gerar_renko
         from src.indicators.stoch_rsi import stochrsi
         import pandas as pd
+        import numpy as np
         from datetime import datetime
         
         data_manager = get_data_manager()
@@ -64,16 +66,13 @@ def run_analysis():
         print(f"📊 Analisando {len(TRADING_PAIRS)} pares...")
         print(f"⏰ Timeframes: {', '.join(timeframes)}")
         
-        results = {}
-        
-        for i, symbol in enumerate(TRADING_PAIRS, 1):
-            print(f"\n[{i}/{len(TRADING_PAIRS)}] Analisando {symbol}...")
-            
-            symbol_results = {}
+        def analyze_symbol(symbol):
+            """Coleta e gera Renko + StochRSI de todos os timeframes de um par (uma linha por timeframe)."""
+            records = []
             
             for timeframe in timeframes:
                 try:
-                    # Coleta dados
+                    # Coleta dados (cache do DataManager como fallback em caso de erro)
                     df = data_manager.get_symbol_data(symbol, timeframe)
                     
                     if df.empty:
@@ -101,33 +100,64 @@ def run_analysis():
                     stoch = stochrsi(renko_df[close_col])
                     
                     # Verifica sinais
-                    if len(stoch) > 0:
+                    if stoch.shape[0]:
                         # stochrsi retorna um DataFrame com colunas 'stochrsi_k' e 'stochrsi_d'
                         # Vamos usar a coluna 'stochrsi_k' para o sinal
                         if 'stochrsi_k' in stoch.columns:
-                            last_stoch = stoch['stochrsi_k'].iloc[-1]
+                            last_stoch = stoch['stochrsi_k'].iat[-1]
                         else:
                             # Fallback para o caso de retorno diferente
-                            last_stoch = stoch.iloc[-1, 0] if len(stoch.columns) > 0 else 0
-                        
-                        signal = "neutro"
-                        if pd.notna(last_stoch) and last_stoch > 80:
-                            signal = "sobrecompra"
-                        elif pd.notna(last_stoch) and last_stoch < 20:
-                            signal = "sobrevenda"
+                            last_stoch = stoch.iat[-1, 0] if len(stoch.columns) > 0 else 0
                         
-                        symbol_results[timeframe] = {
-                            'renko_bricks': len(renko_df),
-                            'stoch_rsi': last_stoch,
-                            'signal': signal,
-                            'last_price': df[price_col].iloc[-1] if price_col in df.columns else 0
-                        }
+                        records.append((
+                            symbol,
+                            timeframe,
+                            len(renko_df),
+                            last_stoch,
+                            df[price_col].iat[-1] if price_col in df.columns else 0
+                        ))
                     
                 except Exception as e:
-                    print(f"   ❌ Erro em {timeframe}: {e}")
+                    print(f"   ❌ Erro em {symbol} {timeframe}: {e}")
                     continue
             
-            results[symbol] = symbol_results
+            return records
+        
+        # Coleta e análise em pipeline: cada par é calculado assim que seus dados
+        # chegam e o resultado aparece na hora. Até 10 pares simultâneos; o
+        # RateLimiter do cliente controla a taxa global e os kernels
+        # Renko/StochRSI (numba, nogil) liberam o GIL durante o cálculo
+        records = []
+        workers = max(1, min(len(TRADING_PAIRS), 10))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_symbol = {executor.submit(analyze_symbol, symbol): symbol for symbol in TRADING_PAIRS}
+            
+            for i, future in enumerate(as_completed(future_to_symbol), 1):
+                symbol = future_to_symbol[future]
+                symbol_records = future.result()
+                records.extend(symbol_records)
+                
+                summary = ", ".join(f"{tf} %K {k:.1f}" for _, tf, _, k, _ in symbol_records) or "sem dados"
+                print(f"[{i}/{len(TRADING_PAIRS)}] {symbol}: {summary}")
+        
+        results_df = pd.DataFrame.from_records(
+            records,
+            columns=['symbol', 'timeframe', 'renko_bricks', 'stoch_rsi', 'last_price']
+        )
+        
+        # Sinais de todas as linhas de uma vez (NaN cai em neutro)
+        stoch_values = results_df['stoch_rsi'].to_numpy(dtype=np.float64)
+        results_df.insert(3, 'signal', np.select(
+            [stoch_values > 80, stoch_values < 20],
+            ['sobrecompra', 'sobrevenda'],
+            default='neutro'
+        ))
+        
+        # JSON no formato {symbol: {timeframe: {...}}}, incluindo pares sem resultado
+        results = {symbol: {} for symbol in TRADING_PAIRS}
+        for symbol, group in results_df.groupby('symbol', sort=False):
+            results[symbol] = group.drop(columns='symbol').set_index('timeframe').to_dict('index')
         
         # Salva resultados
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -141,7 +171,7 @@ def run_analysis():
         print(f"📄 Resultados salvos em: {filename}")
         
         # Mostra resumo
-        total_analyzed = len([s for s in results.values() if s])
+        total_analyzed = results_df['symbol'].nunique()
         print(f"📊 Resumo: {total_analyzed}/{len(TRADING_PAIRS)} pares analisados")
         
     except Exception as e:
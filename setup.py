@@ -92,63 +92,12 @@ BASE_URL = "https://fapi.binance.com"
         
         print("✅ Arquivo api_config.py criado com sucesso!")
         
-        # Atualiza também o settings.py
-        update_settings_file()
-        
         return True
         
     except Exception as e:
         print(f"❌ Erro ao criar arquivo: {e}")
         return False
 
-def update_settings_file():
-    """Atualiza o arquivo settings.py para usar api_config.py."""
-    try:
-        settings_path = 'config/settings.py'
-        
-        # Lê o arquivo atual
-        with open(settings_path, 'r') as f:
-            content = f.read()
-        
-        # Adiciona importação do api_config se não existir
-        if 'from api_config import' not in content:
-            import_line = '''
-# Importa credenciais do arquivo api_config.py se existir
-try:
-    from api_config import BINANCE_KEY as API_KEY, BINANCE_SECRET as API_SECRET
-    api_key_from_file = API_KEY
-    api_secret_from_file = API_SECRET
-except ImportError:
-    api_key_from_file = None
-    api_secret_from_file = None
-'''
-            
-            # Substitui a configuração do BINANCE_CONFIG
-            old_config = '''# Configurações da API Binance
-BINANCE_CONFIG = {
-    'KEY': os.environ.get('BINANCE_KEY', 'COLOQUE_SUA_BINANCE_API_KEY_AQUI'),
-    'SECRET': os.environ.get('BINANCE_SECRET', 'COLOQUE_SUA_BINANCE_API_SECRET_AQUI'),'''
-            
-            new_config = '''# Configurações da API Binance
-BINANCE_CONFIG = {
-    'KEY': os.environ.get('BINANCE_KEY', api_key_from_file or 'COLOQUE_SUA_BINANCE_API_KEY_AQUI'),
-    'SECRET': os.environ.get('BINANCE_SECRET', api_secret_from_file or 'COLOQUE_SUA_BINANCE_API_SECRET_AQUI'),'''
-            
-            # Adiciona a importação no início
-            content = import_line + content
-            
-            # Substitui a configuração
-            content = content.replace(old_config, new_config)
-            
-            # Salva o arquivo
-            with open(settings_path, 'w') as f:
-                f.write(content)
-            
-            print("✅ Arquivo settings.py atualizado!")
-            
-    except Exception as e:
-        print(f"⚠️  Aviso: Não foi possível atualizar settings.py: {e}")
-
 def install_dependencies():
     """Instala dependências."""
     print("\n📦 Instalação de Dependências")
@@ -5,10 +5,15 @@ import nest_asyncio
 import pandas as pd
 import time
 import threading
+from collections import deque
 from datetime import datetime, timedelta
 from binance import Client, ThreadedWebsocketManager
 from typing import Dict, Optional, Callable
 
+from config.binance_safe_config import RATE_LIMIT, WEBSOCKET, compute_reconnect_delay, get_config
+from config.settings import get_binance_credentials
+from .rate_limit import create_binance_limiter
+
 # Aplica nest_asyncio para permitir loops aninhados
 nest_asyncio.apply()
 
@@ -19,7 +24,7 @@ logging.basicConfig(level=logging.INFO)
 class RateLimiter:
     def __init__(self, max_requests_per_minute=1500):  # REDUZIDO para 1500 (super seguro)
         self.max_requests = max_requests_per_minute
-        self.requests = []
+        self.requests = deque()  # Timestamps monotônicos, do mais antigo ao mais recente
         self.lock = threading.Lock()
         self.last_ban_time = None
         self.ban_duration = 60  # 1 minuto inicial
@@ -27,13 +32,17 @@ class RateLimiter:
         self.window_start = datetime.now()
         self.blocked_count = 0
         self.emergency_mode = False
+        # Token bucket (rajada por segundo + média por minuto) no lugar do delay fixo
+        self.token_bucket = create_binance_limiter()
     
     def _clean_old_requests(self):
-        """Remove requisições antigas (mais de 1 minuto)"""
-        now = datetime.now()
-        self.requests = [req_time for req_time in self.requests if (now - req_time).total_seconds() < 60]
+        """Remove requisições antigas (mais de 1 minuto) do início da janela"""
+        cutoff = time.monotonic() - 60
+        while self.requests and self.requests[0] <= cutoff:
+            self.requests.popleft()
         
         # Reseta contador se janela expirou
+        now = datetime.now()
         if (now - self.window_start).total_seconds() >= 60:
             self.request_count = len(self.requests)
             self.window_start = now
@@ -75,7 +84,7 @@ class RateLimiter:
                 logging.error("🚨 MODO EMERGÊNCIA ATIVO - Bloqueando TODAS as requisições por 5 minutos")
                 time.sleep(300)  # 5 minutos
                 self.emergency_mode = False
-                self.requests = []
+                self.requests.clear()
                 self.request_count = 0
                 self.window_start = datetime.now()
             
@@ -85,29 +94,22 @@ class RateLimiter:
             # BLOQUEIA COMPLETAMENTE se atingir limite COM MARGEM
             safety_limit = self.max_requests - 100  # Margem de 100 requests
             while len(self.requests) >= safety_limit:
-                oldest_request = min(self.requests) if self.requests else now
-                wait_time = 60 - (now - oldest_request).total_seconds() + 5  # +5 segundos de segurança
+                wait_time = 60 - (time.monotonic() - self.requests[0]) + 5  # +5 segundos de segurança
                 
                 if wait_time > 0:
                     self.blocked_count += 1
                     logging.error(f"🛑 LIMITE ULTRA-PREVENTIVO ATINGIDO ({len(self.requests)}/{self.max_requests})")
                     logging.error(f"🛑 Aguardando {wait_time:.1f} segundos... (bloqueio #{self.blocked_count})")
                     time.sleep(wait_time)
-                    now = datetime.now()
                     self._clean_old_requests()
                 else:
                     break
             
-            # Delay mínimo entre requisições (aumentado)
-            if self.requests:
-                last_request = max(self.requests)
-                min_delay = 0.3  # 300ms entre requisições (aumentado)
-                elapsed = (now - last_request).total_seconds()
-                if elapsed < min_delay:
-                    time.sleep(min_delay - elapsed)
+            # Aguarda token disponível (permite rajadas até o limite por segundo)
+            self.token_bucket.acquire()
             
             # Registra a requisição ANTES de fazê-la
-            self.requests.append(datetime.now())
+            self.requests.append(time.monotonic())
             self.request_count += 1
             
             # Log de monitoramento mais frequente
@@ -119,14 +121,49 @@ class RateLimiter:
                 logging.error(f"🚨 ATIVANDO MODO EMERGÊNCIA - Muito próximo do limite!")
                 self.emergency_mode = True
     
-    def register_ban(self):
-        """Registra que ocorreu um ban para ajustar comportamento"""
+    def register_success(self, used_weight: Optional[int] = None):
+        """
+        Registra resposta bem-sucedida (aumento aditivo da taxa).
+        
+        Com o peso usado no minuto informado pela Binance, pausa as requisições
+        até a virada da janela quando ele passa de weight_pause_ratio do limite.
+        
+        Args:
+            used_weight: Valor de X-MBX-USED-WEIGHT-1M da resposta (opcional)
+        """
+        self.token_bucket.controller.on_success()
+        
+        weight_threshold = RATE_LIMIT.weight_limit_per_minute * RATE_LIMIT.weight_pause_ratio
+        if used_weight is not None and used_weight >= weight_threshold:
+            # A Binance conta o peso por minuto do relógio
+            cooldown = 60 - time.time() % 60
+            self.token_bucket.pause(cooldown)
+            logging.warning(f"⚠️ Peso usado {used_weight}/{RATE_LIMIT.weight_limit_per_minute} - pausando {cooldown:.1f}s até a próxima janela")
+    
+    def register_ban(self, ip_ban: bool = False, retry_after: Optional[float] = None):
+        """
+        Registra que ocorreu um rate limit/ban para ajustar comportamento.
+        
+        A taxa é reduzida pela metade (AIMD) em ambos os casos. No 429 a espera
+        é o backoff exponencial com jitter; no ban de IP (418/-1003) é pelo
+        menos ban_cooldown_seconds. Um Retry-After enviado pela Binance
+        sempre é respeitado.
+        
+        Args:
+            ip_ban: True para HTTP 418 / erro -1003 (IP banido)
+            retry_after: Valor do cabeçalho Retry-After em segundos (opcional)
+        """
         with self.lock:
             self.last_ban_time = datetime.now()
-            self.ban_duration = min(self.ban_duration * 2, 600)  # Aumenta até 10 minutos
+            backoff = self.token_bucket.controller.on_throttle()
+            if ip_ban:
+                backoff = max(RATE_LIMIT.ban_cooldown_seconds, backoff)
+            if retry_after is not None:
+                backoff = max(retry_after, backoff)
+            self.ban_duration = backoff
             logging.error(f"🚨 BAN REGISTRADO! Próxima duração: {self.ban_duration} segundos")
             logging.error(f"🚨 Requests na janela: {len(self.requests)}")
-            self.requests = []  # Limpa todas as requisições
+            self.requests.clear()  # Limpa todas as requisições
             self.request_count = 0
     
     def get_stats(self):
@@ -145,6 +182,25 @@ class RateLimiter:
                                if self.last_ban_time else 0
             }
 
+def retry_after_seconds(error) -> Optional[float]:
+    """
+    Lê o cabeçalho Retry-After da resposta HTTP de uma exceção da Binance.
+    
+    Args:
+        error: Exceção capturada (BinanceAPIException guarda a resposta)
+        
+    Returns:
+        Segundos de espera pedidos pela Binance, ou None se ausente/inválido
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        value = headers.get('Retry-After')
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
 def handle_binance_error(error, symbol=None, operation="unknown"):
     """
     Manipula erros da API Binance de forma centralizada.
@@ -159,12 +215,15 @@ def handle_binance_error(error, symbol=None, operation="unknown"):
     """
     error_msg = str(error).lower()
     symbol_info = f" para {symbol}" if symbol else ""
+    status_code = getattr(error, 'status_code', None)
     
-    # Erro -1003: Rate limit / IP banido
-    if "1003" in error_msg or "too many requests" in error_msg or "ip banned" in error_msg:
+    # Erro -1003 / HTTP 429 / HTTP 418: Rate limit / IP banido
+    if (status_code in (418, 429) or "1003" in error_msg or
+            "too many requests" in error_msg or "ip banned" in error_msg):
         logging.error(f"🚨 RATE LIMIT/BAN detectado em {operation}{symbol_info}")
-        rate_limiter.register_ban()
-        return False, 300, "rate_limit"  # Não retry, 5 minutos de espera
+        ip_ban = status_code == 418 or "1003" in error_msg or "ip banned" in error_msg
+        rate_limiter.register_ban(ip_ban=ip_ban, retry_after=retry_after_seconds(error))
+        return False, rate_limiter.ban_duration, "rate_limit"  # Não retry, aguarda ban/backoff
     
     # Erro -1121: Símbolo inválido
     elif "1121" in error_msg or "invalid symbol" in error_msg:
@@ -194,45 +253,22 @@ def handle_binance_error(error, symbol=None, operation="unknown"):
 # Instância global do rate limiter
 rate_limiter = RateLimiter()
 
-# Lógica para carregar KEY e SECRET de variáveis de ambiente ou do config.py
-KEY = os.environ.get('BINANCE_KEY')
-SECRET = os.environ.get('BINANCE_SECRET')
+# Cliente REST criado sob demanda por get_binance_client()
+_client = None
+_client_lock = threading.Lock()
 
-if not KEY or not SECRET:
-    try:
-        # Tenta importar das configurações do sistema
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-        from config.settings import BINANCE_CONFIG
-        KEY = BINANCE_CONFIG['KEY']
-        SECRET = BINANCE_CONFIG['SECRET']
-    except (ImportError, KeyError) as e:
-        try:
-            # Tenta importar do arquivo config.py local
-            config_path = os.path.join(os.path.dirname(__file__), 'config.py')
-            if os.path.exists(config_path):
-                # Adiciona o diretório ao sys.path temporariamente
-                import sys
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("local_config", config_path)
-                local_config = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(local_config)
-                KEY = local_config.KEY
-                SECRET = local_config.SECRET
-            else:
-                raise ImportError("Config file not found")
-        except (ImportError, AttributeError):
-            # Cria o arquivo config.py se não existir
-            config_path = os.path.join(os.path.dirname(__file__), 'config.py')
-            if not os.path.exists(config_path):
-                with open(config_path, 'w') as f:
-                    f.write('KEY = "COLOQUE_SUA_BINANCE_API_KEY_AQUI"\n')
-                    f.write('SECRET = "COLOQUE_SUA_BINANCE_API_SECRET_AQUI"\n')
-                print(f"Arquivo config.py criado em {config_path}. Coloque sua KEY e SECRET nele.")
-            raise ImportError(f'Você precisa definir as variáveis de ambiente BINANCE_KEY e BINANCE_SECRET ou preencher o arquivo {config_path} com KEY e SECRET.')
-# Inicializa o cliente Binance
-client = Client(KEY, SECRET)
+def last_used_weight() -> Optional[int]:
+    """
+    Lê o peso usado no minuto (X-MBX-USED-WEIGHT-1M) da última resposta REST.
+    
+    Returns:
+        Peso usado pelo IP no minuto atual, ou None se indisponível
+    """
+    response = getattr(_client, 'response', None)
+    if response is None:
+        return None
+    value = response.headers.get('X-MBX-USED-WEIGHT-1M')
+    return int(value) if value is not None else None
 
 # Dicionário global para armazenar dados de kline em tempo real
 realtime_data = {}
@@ -272,13 +308,15 @@ def get_futures_klines(symbol: str, interval: str, lookback: str, end_time: Opti
                 end_time = int(datetime.now().timestamp() * 1000)
                 
             # Usando o método correto futures_klines com endTime para dados atuais
-            raw_data = client.futures_klines(
+            raw_data = get_binance_client().futures_klines(
                 symbol=symbol,
                 interval=interval,
                 startTime=int(lookback_time),
                 endTime=int(end_time)
             )
             
+            rate_limiter.register_success(last_used_weight())
+            
             if not raw_data:
                 logging.warning(f"Nenhum dado retornado pela API para {symbol} {interval}")
                 return pd.DataFrame()
@@ -360,55 +398,26 @@ def extend_klines_to_current(symbol: str, interval: str, existing_data: pd.DataF
         time_diff = current_time - last_timestamp
         intervals_behind = time_diff // interval_duration
         
-        # Se estamos há mais de 1 intervalo atrás, busca desde o último candle
-        if intervals_behind >= 1:
-            start_time = last_timestamp + interval_duration  # Próximo candle após o último
-            
-            logging.info(f"Dados {intervals_behind} intervalos atrás para {symbol} {interval}")
-            logging.info(f"Último candle: {pd.to_datetime(last_timestamp, unit='ms')}")
-            logging.info(f"Buscando desde: {pd.to_datetime(start_time, unit='ms')}")
-            logging.info(f"Até agora: {pd.to_datetime(current_time, unit='ms')}")
-            
-            # Busca dados desde o último candle até agora
-            new_data = get_futures_klines(symbol, interval, start_time, current_time)
-            
-            if new_data.empty:
-                logging.warning(f"Nenhum candle novo encontrado para {symbol} {interval}")
-                return existing_data
-            
-            # Mescla dados evitando duplicatas
-            combined_data = pd.concat([existing_data, new_data])
-            combined_data = combined_data[~combined_data.index.duplicated(keep='last')]
-            combined_data = combined_data.sort_index()
-            
-            logging.info(f"✅ Dados estendidos para {symbol} {interval}: {len(new_data)} novos candles adicionados")
-            logging.info(f"Novo último candle: {combined_data.index[-1]}")
-            return combined_data
-        else:
-            # Se estamos atualizados (menos de 1 intervalo atrás), mas vamos verificar mesmo assim
-            # para casos onde pode haver candles parciais ou delay
-            start_time = last_timestamp
-            
-            logging.info(f"Verificando updates para {symbol} {interval} (dados relativamente atuais)")
-            new_data = get_futures_klines(symbol, interval, start_time, current_time)
-            
-            if not new_data.empty:
-                # Remove o primeiro candle se for igual ao último existente
-                if not new_data.empty and len(new_data) > 0:
-                    if new_data.index[0] == existing_data.index[-1]:
-                        new_data = new_data.iloc[1:]
-                
-                if not new_data.empty:
-                    combined_data = pd.concat([existing_data, new_data])
-                    combined_data = combined_data[~combined_data.index.duplicated(keep='last')]
-                    combined_data = combined_data.sort_index()
-                    
-                    logging.info(f"✅ Pequena atualização para {symbol} {interval}: {len(new_data)} candles")
-                    return combined_data
-            
-            logging.info(f"Dados já atualizados para {symbol} {interval}")
+        # Busca a partir do último candle salvo (inclusive): ele pode ter sido
+        # gravado ainda aberto, e a versão fechada substitui a antiga
+        logging.info(f"Dados {intervals_behind} intervalos atrás para {symbol} {interval}")
+        logging.info(f"Buscando desde o último candle: {pd.to_datetime(last_timestamp, unit='ms')}")
+        
+        new_data = get_futures_klines(symbol, interval, last_timestamp, current_time)
+        
+        if new_data.empty:
+            logging.warning(f"Nenhum candle novo encontrado para {symbol} {interval}")
             return existing_data
         
+        # Mescla dados evitando duplicatas (o candle refeito prevalece)
+        combined_data = pd.concat([existing_data, new_data])
+        combined_data = combined_data[~combined_data.index.duplicated(keep='last')]
+        combined_data = combined_data.sort_index()
+        
+        logging.info(f"✅ Dados estendidos para {symbol} {interval}: {len(combined_data) - len(existing_data)} novos candles adicionados")
+        logging.info(f"Novo último candle: {combined_data.index[-1]}")
+        return combined_data
+        
     except Exception as e:
         logging.error(f"Erro ao estender dados para {symbol} {interval}: {e}")
         return existing_data
@@ -453,7 +462,7 @@ def start_realtime_kline_socket(symbol: str, interval: str):
     """
     logging.warning("Usando método legado. Recomendado usar websocket_manager.add_kline_stream()")
     
-    twm = ThreadedWebsocketManager(api_key=KEY, api_secret=SECRET)
+    twm = ThreadedWebsocketManager(*get_binance_credentials())
     twm.start()
     stream = f"{symbol.lower()}@kline_{interval}"
     conn_key = twm.start_futures_multiplex_socket(process_kline_message, streams=[stream])
@@ -488,7 +497,7 @@ def start_realtime_user_socket():
     Returns:
         Tupla contendo o objeto ThreadedWebsocketManager e a chave de conexão
     """
-    twm = ThreadedWebsocketManager(api_key=KEY, api_secret=SECRET)
+    twm = ThreadedWebsocketManager(*get_binance_credentials())
     twm.start()
     conn_key = twm.start_futures_user_socket(callback=process_user_message)
     logging.info("Websocket de usuário iniciado")
@@ -497,12 +506,29 @@ def start_realtime_user_socket():
 
 def get_binance_client():
     """
-    Retorna o cliente Binance configurado.
+    Retorna o cliente Binance configurado, criando-o no primeiro uso.
+    
+    As credenciais vêm de get_binance_credentials(); importar o módulo não
+    exige credenciais nem acesso à rede.
     
     Returns:
         Client: Instância do cliente Binance
-    """
-    return client
+        
+    Raises:
+        RuntimeError: Se BINANCE_KEY/BINANCE_SECRET não estiverem configuradas
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                key, secret = get_binance_credentials()
+                if not key or not secret:
+                    raise RuntimeError(
+                        "Defina as variáveis de ambiente BINANCE_KEY e BINANCE_SECRET "
+                        "ou execute setup.py para criar api_config.py"
+                    )
+                _client = Client(key, secret)
+    return _client
 
 
 def get_realtime_data(symbol: str = None):
@@ -566,7 +592,7 @@ class WebSocketManager:
     def start(self):
         """Inicia o gerenciador de WebSocket"""
         if not self.is_running:
-            self.twm = ThreadedWebsocketManager(api_key=KEY, api_secret=SECRET)
+            self.twm = ThreadedWebsocketManager(*get_binance_credentials())
             self.twm.start()
             self.is_running = True
             logging.info("WebSocket Manager iniciado")
@@ -592,38 +618,76 @@ class WebSocketManager:
             interval: Intervalo (ex: '1m', '5m', '1h')
             callback: Função callback personalizada (opcional)
         """
+        self.add_kline_streams([(symbol, interval)], callback)
+    
+    def add_kline_streams(self, symbols_intervals: list, callback: Callable = None):
+        """
+        Adiciona vários streams de kline usando conexões combinadas.
+        
+        Cada conexão (/stream?streams=a/b/c) agrupa até
+        max_symbols_per_stream streams, evitando um socket por par.
+        
+        Args:
+            symbols_intervals: Lista de tuplas (symbol, interval)
+            callback: Função callback personalizada (opcional)
+        """
         if not self.is_running:
             self.start()
         
-        stream_key = f"{symbol}@{interval}"
+        # Usa callback personalizado ou o padrão
+        callback_func = callback if callback else self._default_kline_callback
         
-        if stream_key not in self.active_connections:
-            stream = f"{symbol.lower()}@kline_{interval}"
-            
-            # Usa callback personalizado ou o padrão
-            callback_func = callback if callback else self._default_kline_callback
+        pending = [
+            (symbol, interval) for symbol, interval in symbols_intervals
+            if f"{symbol}@{interval}" not in self.active_connections
+        ]
+        batch_size = get_config('data', 'max_symbols_per_stream')
+        
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            streams = [f"{symbol.lower()}@kline_{interval}" for symbol, interval in batch]
             
             try:
                 conn_key = self.twm.start_futures_multiplex_socket(
                     callback_func, 
-                    streams=[stream]
+                    streams=streams
                 )
-                self.active_connections[stream_key] = conn_key
-                self.callbacks[stream_key] = callback_func
-                logging.info(f"Stream {stream} adicionado com sucesso")
+                for symbol, interval in batch:
+                    stream_key = f"{symbol}@{interval}"
+                    self.active_connections[stream_key] = conn_key
+                    self.callbacks[stream_key] = callback_func
+                logging.info(f"Conexão combinada com {len(streams)} streams adicionada com sucesso")
             except Exception as e:
-                logging.error(f"Erro ao adicionar stream {stream}: {e}")
+                logging.error(f"Erro ao adicionar streams {streams[0]}...({len(streams)}): {e}")
     
     def remove_kline_stream(self, symbol: str, interval: str):
-        """Remove um stream de kline do gerenciador"""
+        """
+        Remove um stream de kline do gerenciador.
+        
+        Como a conexão é compartilhada, os demais streams do mesmo socket
+        combinado são reabertos em uma nova conexão.
+        """
         stream_key = f"{symbol}@{interval}"
         
         if stream_key in self.active_connections:
             try:
-                self.twm.stop_socket(self.active_connections[stream_key])
-                del self.active_connections[stream_key]
+                conn_key = self.active_connections.pop(stream_key)
                 del self.callbacks[stream_key]
+                
+                siblings = [key for key, conn in self.active_connections.items() if conn == conn_key]
+                siblings_by_callback = {}
+                for key in siblings:
+                    del self.active_connections[key]
+                    sibling_symbol, sibling_interval = key.split('@')
+                    siblings_by_callback.setdefault(self.callbacks.pop(key), []).append(
+                        (sibling_symbol, sibling_interval)
+                    )
+                
+                self.twm.stop_socket(conn_key)
                 logging.info(f"Stream {stream_key} removido")
+                
+                for callback_func, pairs in siblings_by_callback.items():
+                    self.add_kline_streams(pairs, callback_func)
             except Exception as e:
                 logging.error(f"Erro ao remover stream {stream_key}: {e}")
     
@@ -673,9 +737,7 @@ def start_multiple_kline_streams(symbols_intervals: list, callback: Callable = N
             ('SOLUSDT', '5m')
         ])
     """
-    for symbol, interval in symbols_intervals:
-        websocket_manager.add_kline_stream(symbol, interval, callback)
-        time.sleep(0.1)  # Pequeno delay para evitar sobrecarga
+    websocket_manager.add_kline_streams(symbols_intervals, callback)
 
 
 def stop_all_streams():
@@ -826,9 +888,18 @@ def restart_websocket_manager():
     """
     logging.info("Reiniciando WebSocket Manager...")
     websocket_manager.stop()
-    time.sleep(2)
-    websocket_manager.start()
-    logging.info("WebSocket Manager reiniciado")
+    
+    # Backoff com jitter evita reconexões sincronizadas entre instâncias
+    for attempt in range(WEBSOCKET.max_reconnect_attempts):
+        time.sleep(compute_reconnect_delay(attempt))
+        try:
+            websocket_manager.start()
+            logging.info("WebSocket Manager reiniciado")
+            return
+        except Exception as e:
+            logging.warning(f"Falha ao reiniciar WebSocket (tentativa {attempt + 1}/{WEBSOCKET.max_reconnect_attempts}): {e}")
+    
+    logging.error("Não foi possível reiniciar o WebSocket Manager")
 
 
 # Função para inicialização automática
@@ -868,7 +939,7 @@ def validate_symbol(symbol: str) -> bool:
         # Usa rate limiter para esta verificação
         rate_limiter.wait_if_needed()
         
-        exchange_info = client.futures_exchange_info()
+        exchange_info = get_binance_client().futures_exchange_info()
         valid_symbols = [s['symbol'] for s in exchange_info['symbols'] if s['status'] == 'TRADING']
         
         is_valid = symbol in valid_symbols
@@ -997,9 +1068,10 @@ def emergency_reset():
         clear_realtime_account_data()
         
         # Reseta rate limiter
-        rate_limiter.requests = []
+        rate_limiter.requests.clear()
         rate_limiter.last_ban_time = None
         rate_limiter.ban_duration = 60
+        rate_limiter.token_bucket.controller.reset()
         
         logging.info("Reset de emergência concluído")
         
@@ -1134,7 +1206,7 @@ def test_connection():
     """
     try:
         # Usa endpoint que não consome rate limit
-        server_time = client.get_server_time()
+        server_time = get_binance_client().get_server_time()
         logging.info(f"✅ Conexão OK - Server time: {server_time['serverTime']}")
         return True
     except Exception as e:
@@ -1165,6 +1237,7 @@ def safe_rest_request(func, *args, **kwargs):
     
     try:
         result = func(*args, **kwargs)
+        rate_limiter.register_success(last_used_weight())
         logging.debug(f"✅ {operation_name} executado com sucesso")
         return result
     except Exception as e:
@@ -1204,7 +1277,7 @@ def get_futures_klines_ultra_safe(symbol: str, interval: str, lookback) -> pd.Da
     
     # Fazer requisição usando o wrapper seguro
     raw_data = safe_rest_request(
-        client.futures_klines,
+        get_binance_client().futures_klines,
         symbol=symbol,
         interval=interval,
         startTime=int(lookback_time)
@@ -1,2 +0,0 @@
-KEY         = "IiPTCvu1AAziLvdusHHkCus5NCpwU0mQ0vMcZnRLwZeFNCA3ODdEIgHYLrDsPYij"
-SECRET      = "sUdrgJMQ15FceuPSLjc5NkKY951iWTUvBJmOGUgmhPln05f3jHHEBfnKPuRLnEbe"
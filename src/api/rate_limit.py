@@ -0,0 +1,186 @@
+"""
+Rate Limiting
+=============
+
+Token bucket para requisições REST da Binance, configurado a partir de
+RATE_LIMIT_CONFIG. Permite rajadas até o limite por segundo e suaviza o
+fluxo para o limite por minuto.
+"""
+
+import time
+import random
+import threading
+
+from config.binance_safe_config import RATE_LIMIT
+
+
+class TokenBucket:
+    """
+    Balde de tokens com reposição contínua.
+
+    Não é thread-safe por si só; o acesso é serializado por TokenBucketLimiter.
+    """
+
+    __slots__ = ('capacity', 'rate', 'tokens', 'last')
+
+    def __init__(self, capacity: float, rate: float):
+        """
+        Inicializa o balde cheio.
+
+        Args:
+            capacity: Número máximo de tokens (tamanho da rajada)
+            rate: Tokens repostos por segundo
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    def refill(self, now: float):
+        """Repõe os tokens acumulados desde a última leitura."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+    def wait_time(self, n: int = 1) -> float:
+        """Retorna quantos segundos faltam para haver n tokens (0 se já houver)."""
+        if self.tokens >= n:
+            return 0.0
+        return (n - self.tokens) / self.rate
+
+    def consume(self, n: int = 1):
+        """Retira n tokens do balde."""
+        self.tokens -= n
+
+
+class TokenBucketLimiter:
+    """
+    Combina vários baldes: uma requisição só passa quando todos concedem token.
+    """
+
+    def __init__(self, *buckets: TokenBucket):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.controller = None
+        self.paused_until = 0.0
+
+    def pause(self, seconds: float):
+        """
+        Suspende novas concessões por alguns segundos (ex.: peso do minuto esgotando).
+
+        Args:
+            seconds: Duração da pausa a partir de agora
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def acquire(self, n: int = 1):
+        """
+        Bloqueia até que todos os baldes tenham n tokens e os consome.
+
+        Args:
+            n: Número de tokens (peso da requisição)
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                wait = max(0.0, self.paused_until - now)
+                for bucket in self.buckets:
+                    bucket.refill(now)
+                    wait = max(wait, bucket.wait_time(n))
+
+                if wait <= 0:
+                    for bucket in self.buckets:
+                        bucket.consume(n)
+                    return
+
+            time.sleep(wait)
+
+
+class AIMDController:
+    """
+    Controle AIMD (aumento aditivo / redução multiplicativa) da taxa de um balde.
+
+    Cada sucesso aumenta a taxa aos poucos até o teto; cada 429/418 corta a
+    taxa pela metade e devolve um backoff exponencial com jitter.
+    """
+
+    def __init__(self, bucket: TokenBucket, max_rate: float, increase: float = 0.5,
+                 decrease: float = 0.5, min_rate: float = 1.0,
+                 backoff_base: float = 1.0, backoff_max: float = 600.0):
+        """
+        Args:
+            bucket: Balde cuja taxa de reposição é ajustada
+            max_rate: Taxa máxima (requisições por segundo)
+            increase: Incremento aditivo por sucesso
+            decrease: Fator multiplicativo aplicado em rate limit
+            min_rate: Taxa mínima permitida
+            backoff_base: Espera base em segundos para o backoff
+            backoff_max: Espera máxima em segundos
+        """
+        self.bucket = bucket
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.min_rate = min_rate
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.current_rate = max_rate
+        self.attempt = 0
+        self.lock = threading.Lock()
+
+    def on_success(self):
+        """Registra resposta bem-sucedida: aumento aditivo da taxa."""
+        with self.lock:
+            self.attempt = 0
+            if self.current_rate < self.max_rate:
+                self.current_rate = min(self.max_rate, self.current_rate + self.increase)
+                self.bucket.rate = self.current_rate
+
+    def on_throttle(self) -> float:
+        """
+        Registra rate limit (429/418): redução multiplicativa da taxa.
+
+        Returns:
+            Segundos de espera (backoff exponencial com jitter)
+        """
+        with self.lock:
+            self.current_rate = max(self.min_rate, self.current_rate * self.decrease)
+            self.bucket.rate = self.current_rate
+
+            delay = self.backoff_base * (2 ** self.attempt) * random.uniform(0.75, 1.25)
+            self.attempt += 1
+            return min(delay, self.backoff_max)
+
+    def reset(self):
+        """Restaura a taxa máxima e zera o contador de backoff."""
+        with self.lock:
+            self.current_rate = self.max_rate
+            self.bucket.rate = self.max_rate
+            self.attempt = 0
+
+
+def create_binance_limiter() -> TokenBucketLimiter:
+    """
+    Cria o limitador padrão da Binance a partir de RATE_LIMIT_CONFIG.
+
+    Returns:
+        TokenBucketLimiter com balde por segundo (rajada, controlado por AIMD)
+        e por minuto (média)
+    """
+    per_second = RATE_LIMIT.max_requests_per_second
+    per_minute = RATE_LIMIT.max_requests_per_minute
+
+    burst_bucket = TokenBucket(capacity=per_second, rate=per_second)
+    limiter = TokenBucketLimiter(
+        burst_bucket,
+        TokenBucket(capacity=per_minute, rate=per_minute / 60)
+    )
+    limiter.controller = AIMDController(
+        burst_bucket,
+        max_rate=per_second,
+        increase=RATE_LIMIT.aimd_increase,
+        decrease=RATE_LIMIT.aimd_decrease,
+        backoff_base=RATE_LIMIT.backoff_base_seconds,
+        backoff_max=RATE_LIMIT.backoff_max_seconds
+    )
+    return limiter
@@ -15,8 +15,9 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
-from src.api.binance_client import get_binance_client, get_futures_klines, extend_klines_to_current
+from src.api.binance_client import get_binance_client, get_futures_klines, extend_klines_to_current, safe_rest_request
 from src.utils.data_requirements import get_optimized_days_for_renko_stochrsi
+from src.utils.timeframe_utils import candle_open_time
 from config.settings import DATA_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -67,24 +68,6 @@ class DataManager:
             '1w': 700,   # 700 dias para 1 semana
         }
         
-        # Mapeamento de timeframes para período de cache
-        self.cache_validity = {
-            '1m': 30,    # 30 segundos para 1 minuto
-            '3m': 60,    # 1 minuto para 3 minutos
-            '5m': 120,   # 2 minutos para 5 minutos
-            '15m': 300,  # 5 minutos para 15 minutos
-            '30m': 600,  # 10 minutos para 30 minutos
-            '1h': 1800,  # 30 minutos para 1 hora
-            '2h': 3600,  # 1 hora para 2 horas
-            '4h': 7200,  # 2 horas para 4 horas
-            '6h': 10800, # 3 horas para 6 horas
-            '8h': 14400, # 4 horas para 8 horas
-            '12h': 21600, # 6 horas para 12 horas
-            '1d': 43200,  # 12 horas para 1 dia
-            '3d': 86400,  # 24 horas para 3 dias
-            '1w': 172800, # 48 horas para 1 semana
-        }
-        
         # Lock para operações thread-safe
         self.cache_lock = threading.Lock()
         
@@ -126,14 +109,17 @@ class DataManager:
         return os.path.join(self.cache_dir, f"{symbol}_{interval}_{days}d_b{brick_size}.pkl")
     
     def _is_cache_valid(self, cache_file: str, interval: str) -> bool:
-        """Verifica se o cache ainda é válido baseado no timeframe."""
+        """
+        Verifica se o cache ainda é válido baseado no timeframe.
+        
+        O cache vale até o fechamento do candle em que foi gravado: enquanto
+        nenhum candle novo fechar, não há dados novos a buscar.
+        """
         try:
             if not os.path.exists(cache_file):
                 return False
             
-            file_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
-            cache_duration = self.cache_validity.get(interval, self.cache_duration)
-            return (datetime.now() - file_time).seconds < cache_duration
+            return os.path.getmtime(cache_file) >= candle_open_time(interval)
             
         except (OSError, PermissionError) as e:
             logger.debug(f"Erro ao verificar cache {cache_file}: {e}")
@@ -380,8 +366,8 @@ class DataManager:
                         logger.info(f"Estendendo dados para {symbol} {interval} até o momento atual")
                         extended_data = extend_klines_to_current(symbol, interval, cached_data)
                         
-                        # Salva dados estendidos no cache
-                        if not extended_data.empty and len(extended_data) > len(cached_data):
+                        # Salva no cache sempre que a extensão trouxe candles (novos ou o último refeito)
+                        if extended_data is not cached_data and not extended_data.empty:
                             self._save_to_cache(extended_data, cache_file)
                             logger.info(f"Cache atualizado para {symbol} {interval} com {len(extended_data) - len(cached_data)} novos candles")
                         
@@ -400,8 +386,8 @@ class DataManager:
                         logger.info(f"Estendendo dados úteis para {symbol} {interval} até o momento atual")
                         extended_data = extend_klines_to_current(symbol, interval, cached_data)
                         
-                        # Salva dados estendidos no cache
-                        if not extended_data.empty and len(extended_data) > len(cached_data):
+                        # Salva no cache sempre que a extensão trouxe candles (novos ou o último refeito)
+                        if extended_data is not cached_data and not extended_data.empty:
                             self._save_to_cache(extended_data, cache_file)
                             logger.info(f"Cache útil atualizado para {symbol} {interval} com {len(extended_data) - len(cached_data)} novos candles")
                         
@@ -637,6 +623,23 @@ class DataManager:
         exchange_info = self.client.futures_exchange_info()
         return [symbol['symbol'] for symbol in exchange_info['symbols'] if symbol['status'] == 'TRADING']
     
+    def fetch_all_tickers_snapshot(self) -> Dict[str, float]:
+        """
+        Obtém o último preço de todos os pares de futuros em uma única requisição.
+        
+        Returns:
+            Dicionário símbolo -> último preço (vazio em caso de erro)
+        """
+        tickers = safe_rest_request(self.client.futures_symbol_ticker)
+        if not tickers:
+            return {}
+        
+        try:
+            return {ticker['symbol']: float(ticker['price']) for ticker in tickers}
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Erro ao processar snapshot de preços: {e}")
+            return {}
+    
     def clear_cache(self):
         """Limpa todo o cache."""
         if not self.cache_enabled:
@@ -0,0 +1,20 @@
+"""
+Compilação JIT opcional
+=======================
+
+Exporta o decorador njit do numba quando disponível. Sem numba, o decorador
+devolve a função original e os kernels rodam como Python puro, com o mesmo
+resultado.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Substituto de numba.njit: aceita @njit e @njit(...) sem compilar."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -10,8 +10,27 @@ import numpy as np
 import logging
 from typing import Optional
 
+from ._njit import njit
+
 logger = logging.getLogger(__name__)
 
+@njit(cache=True, nogil=True)
+def _wilder_atr(true_range, period, seed, out):
+    """
+    Aplica a suavização de Wilder (fórmula do TradingView) sobre o True Range.
+    
+    Args:
+        true_range: Valores de True Range (float64)
+        period: Período do ATR
+        seed: ATR inicial (média simples dos primeiros 'period' valores)
+        out: Saída - ATR (float64, NaN antes de period-1)
+    """
+    out[:] = np.nan
+    out[period - 1] = seed
+    for i in range(period, true_range.size):
+        # ATR = (ATR_anterior * (n-1) + TR_atual) / n
+        out[i] = (out[i - 1] * (period - 1) + true_range[i]) / period
+
 def calculate_true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
     """
     Calcula o True Range para cada período.
@@ -39,8 +58,8 @@ def calculate_true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> p
         tr2 = np.abs(high - close_prev)  # |high - close_anterior|
         tr3 = np.abs(low - close_prev)   # |low - close_anterior|
         
-        # True Range = máximo dos três componentes
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        # True Range = máximo dos três componentes (NaN ignorado, como em max(axis=1))
+        true_range = np.fmax(np.fmax(tr1, tr2), tr3)
         
         return true_range
         
@@ -71,23 +90,17 @@ def calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int
             logger.warning("True Range vazio - não é possível calcular ATR")
             return pd.Series(dtype=float)
         
-        # Inicializa a série ATR
-        atr = pd.Series(index=true_range.index, dtype=float)
-        
         # Calcula ATR usando a fórmula do TradingView
         # Primeiro valor = média simples dos primeiros 'period' valores de TR
-        if len(true_range) >= period:
-            atr.iloc[period-1] = true_range.iloc[:period].mean()
-            
-            # Valores subsequentes usando a fórmula exponencial
-            for i in range(period, len(true_range)):
-                prev_atr = atr.iloc[i-1]
-                current_tr = true_range.iloc[i]
-                
-                # ATR = (ATR_anterior * (n-1) + TR_atual) / n
-                atr.iloc[i] = (prev_atr * (period - 1) + current_tr) / period
+        if len(true_range) < period:
+            return pd.Series(index=true_range.index, dtype=float)
         
-        return atr
+        # Valores subsequentes: recorrência de Wilder em um kernel compilado
+        tr_values = np.ascontiguousarray(true_range.to_numpy(), dtype=np.float64)
+        atr_values = np.empty(tr_values.size, dtype=np.float64)
+        _wilder_atr(tr_values, period, float(true_range.iloc[:period].mean()), atr_values)
+        
+        return pd.Series(atr_values, index=true_range.index)
         
     except Exception as e:
         logger.error(f"Erro ao calcular ATR: {e}")
@@ -203,7 +216,8 @@ def calculate_dynamic_brick_size(df: pd.DataFrame, symbol: str, period: int = 14
             return 100.0  # Valor padrão de fallback
         
         # Pega o último valor válido do ATR
-        last_atr = atr.dropna().iloc[-1] if not atr.dropna().empty else 100.0
+        valid_atr = atr.dropna()
+        last_atr = valid_atr.iat[-1] if not valid_atr.empty else 100.0
         
         # Obtém o tick size mínimo do ativo
         tick_size = get_tick_size(symbol)
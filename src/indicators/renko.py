@@ -6,15 +6,164 @@ Implementação do indicador Renko para análise técnica com cálculo dinâmico
 """
 
 import pandas as pd
+import numpy as np
 import logging
 from typing import Optional
-from stocktrends import Renko
 
 from config.settings import INDICATOR_CONFIG
 from .atr import get_atr_brick_size, calculate_dynamic_brick_size
+from ._njit import njit, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+@njit(cache=True, nogil=True)
+def _renko_walk(close, brick_size, rows, opens, closes, uptrends, write):
+    """
+    Percorre os fechamentos gerando tijolos Renko por fechamento do período.
+    
+    Replica o algoritmo period_close_bricks do stocktrends: o primeiro tijolo
+    parte do fechamento inicial arredondado para baixo ao múltiplo do brick;
+    continuar a tendência exige 1 tijolo e reverter exige 2. Com write=False
+    apenas conta os tijolos, para que os arrays de saída sejam pré-alocados.
+    
+    Args:
+        close: Fechamentos (float64)
+        brick_size: Tamanho do tijolo
+        rows: Saída - índice do candle que gerou cada tijolo
+        opens: Saída - abertura de cada tijolo
+        closes: Saída - fechamento de cada tijolo
+        uptrends: Saída - tendência de cada tijolo
+        write: Se False, só conta os tijolos
+    
+    Returns:
+        Número de tijolos
+    """
+    last = (close[0] // brick_size) * brick_size
+    uptrend = True
+    count = 1
+    
+    if write:
+        rows[0] = 0
+        opens[0] = last - brick_size
+        closes[0] = last
+        uptrends[0] = True
+    
+    for i in range(close.size):
+        bricks = int((close[i] - last) / brick_size)
+        
+        if uptrend and bricks >= 1:
+            step = brick_size
+            new_bricks = bricks
+        elif uptrend and bricks <= -2:
+            # Reversão para baixa: o primeiro tijolo é descontado
+            uptrend = False
+            last -= brick_size
+            step = -brick_size
+            new_bricks = -bricks - 1
+        elif not uptrend and bricks <= -1:
+            step = -brick_size
+            new_bricks = -bricks
+        elif not uptrend and bricks >= 2:
+            # Reversão para alta: o primeiro tijolo é descontado
+            uptrend = True
+            last += brick_size
+            step = brick_size
+            new_bricks = bricks - 1
+        else:
+            continue
+        
+        for _ in range(new_bricks):
+            if write:
+                rows[count] = i
+                opens[count] = last
+                closes[count] = last + step
+                uptrends[count] = uptrend
+            last += step
+            count += 1
+    
+    return count
+
+def _warm_up_renko_walk():
+    """
+    Compila o kernel Renko (ou carrega do cache do numba) na importação.
+    
+    Usa os mesmos tipos de _renko_frame, então o primeiro gráfico ou matriz
+    do dashboard não paga a compilação JIT.
+    """
+    no_rows = np.empty(0, dtype=np.int64)
+    no_values = np.empty(0, dtype=np.float64)
+    no_trends = np.empty(0, dtype=np.bool_)
+    _renko_walk(np.zeros(2, dtype=np.float64), 1.0, no_rows, no_values, no_values, no_trends, False)
+
+if NUMBA_AVAILABLE:
+    try:
+        _warm_up_renko_walk()
+    except Exception as e:
+        logger.warning(f"Falha ao pré-compilar o kernel Renko: {e}")
+
+def _renko_frame(dates: pd.Series, close: pd.Series, brick_size: float) -> pd.DataFrame:
+    """
+    Monta o DataFrame Renko (date, open, high, low, close, uptrend).
+    
+    Args:
+        dates: Datas dos candles (Series ou Index), em ordem cronológica
+        close: Fechamentos dos candles
+        brick_size: Tamanho do tijolo
+    
+    Returns:
+        DataFrame com um tijolo por linha
+    """
+    close_values = np.ascontiguousarray(close.to_numpy(), dtype=np.float64)
+    brick_size = float(brick_size)
+    
+    # Primeira passada conta os tijolos; a segunda preenche os arrays pré-alocados
+    no_rows = np.empty(0, dtype=np.int64)
+    no_values = np.empty(0, dtype=np.float64)
+    no_trends = np.empty(0, dtype=np.bool_)
+    count = _renko_walk(close_values, brick_size, no_rows, no_values, no_values, no_trends, False)
+    
+    rows = np.empty(count, dtype=np.int64)
+    opens = np.empty(count, dtype=np.float64)
+    closes = np.empty(count, dtype=np.float64)
+    uptrends = np.empty(count, dtype=np.bool_)
+    _renko_walk(close_values, brick_size, rows, opens, closes, uptrends, True)
+    
+    return pd.DataFrame({
+        'date': dates.to_numpy()[rows],
+        'open': opens,
+        'high': np.maximum(opens, closes),
+        'low': np.minimum(opens, closes),
+        'close': closes,
+        'uptrend': uptrends
+    })
+
+def _clean_close(ohlc_data: pd.DataFrame) -> Optional[pd.Series]:
+    """
+    Retorna os fechamentos quando o OHLC já está no formato do cliente Binance.
+    
+    O formato é: índice datetime em ordem crescente e colunas OHLC float sem
+    NaN. Nesse caso a cópia, renomeação, conversão e ordenação de
+    generate_renko_data não alteram nada e podem ser puladas.
+    
+    Args:
+        ohlc_data: DataFrame com dados OHLC
+    
+    Returns:
+        Série de fechamentos indexada pela data, ou None se for preciso normalizar
+    """
+    index = ohlc_data.index
+    if not isinstance(index, pd.DatetimeIndex) or not index.is_monotonic_increasing:
+        return None
+    
+    for names in (('open', 'high', 'low', 'close'), ('Open', 'High', 'Low', 'Close')):
+        if all(name in ohlc_data.columns for name in names):
+            ohlc = ohlc_data[list(names)]
+            if (ohlc.dtypes == np.float64).all() and not ohlc.isna().to_numpy().any():
+                return ohlc[names[-1]]
+            return None
+    
+    return None
+
 class RenkoIndicator:
     """
     Classe para gerar gráficos Renko.
@@ -74,7 +223,14 @@ class RenkoIndicator:
                     self.brick_size = calculated_brick_size
                     logger.info(f"Brick size atualizado via ATR para {self.symbol}: {self.brick_size}")
             
-            # Prepara dados para stocktrends
+            # Caminho direto para dados já normalizados (saída do cliente Binance)
+            close = _clean_close(ohlc_data)
+            if close is not None:
+                renko_data = _renko_frame(close.index, close, self.brick_size)
+                logger.info(f"Dados Renko gerados: {len(renko_data)} tijolos com tamanho {self.brick_size} (ATR: {self.use_atr})")
+                return renko_data
+            
+            # Prepara dados para o gerador de tijolos
             renko_df = ohlc_data.copy()
             renko_df = renko_df.reset_index()
             
@@ -190,12 +346,8 @@ class RenkoIndicator:
             # Ordena por data
             renko_df = renko_df.sort_values('date')
             
-            # Cria objeto Renko
-            renko = Renko(renko_df)
-            renko.brick_size = self.brick_size
-            
-            # Gera dados Renko
-            renko_data = renko.get_ohlc_data()
+            # Gera dados Renko (kernel compilado com numba, quando disponível)
+            renko_data = _renko_frame(renko_df['date'], renko_df['close'], self.brick_size)
             
             logger.info(f"Dados Renko gerados: {len(renko_data)} tijolos com tamanho {self.brick_size} (ATR: {self.use_atr})")
             return renko_data
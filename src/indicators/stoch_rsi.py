@@ -11,9 +11,123 @@ import logging
 from typing import Optional, Tuple
 
 from config.settings import INDICATOR_CONFIG
+from ._njit import njit, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+@njit(cache=True, nogil=True)
+def _stochrsi_kernel(close, rsi_period, stoch_period, k_period, d_period, k_out, d_out):
+    """
+    Calcula RSI, Stochastic do RSI, %K e %D em um único kernel.
+    
+    Reproduz calculate_rsi + calculate_stochrsi: médias simples de ganhos e
+    perdas (diferença inicial e NaN contam como zero), min/max móveis do RSI
+    e médias móveis de %K e %D. Toda janela com NaN resulta em NaN, como nos
+    rolling do pandas. As janelas das médias são somadas por inteiro a cada
+    posição, sem soma acumulada, para que perdas nulas deem RSI exatamente
+    100; o min/max usa filas monotônicas de índices (O(n) no total).
+    
+    Args:
+        close: Fechamentos (float64)
+        rsi_period: Período do RSI
+        stoch_period: Período do Stochastic
+        k_period: Suavização do %K
+        d_period: Suavização do %D
+        k_out: Saída - %K (float64, mesmo tamanho de close)
+        d_out: Saída - %D (float64, mesmo tamanho de close)
+    """
+    n = close.size
+    rsi = np.full(n, np.nan)
+    stoch = np.full(n, np.nan)
+    k_out[:] = np.nan
+    d_out[:] = np.nan
+    
+    # RSI com médias simples de ganhos e perdas
+    for i in range(rsi_period - 1, n):
+        gain = 0.0
+        loss = 0.0
+        for j in range(i - rsi_period + 1, i + 1):
+            if j > 0:
+                delta = close[j] - close[j - 1]
+                if delta > 0:
+                    gain += delta
+                elif delta < 0:
+                    loss -= delta
+        avg_gain = gain / rsi_period
+        avg_loss = loss / rsi_period
+        if avg_loss == 0:
+            rsi[i] = np.nan if avg_gain == 0 else 100.0
+        else:
+            rsi[i] = 100 - (100 / (1 + avg_gain / avg_loss))
+    
+    # Stochastic do RSI (0 quando o RSI não variou na janela). Min e max
+    # móveis por filas monotônicas em buffers circulares: cada índice entra e
+    # sai uma vez; posições com NaN não entram e invalidam suas janelas
+    min_idx = np.empty(stoch_period, dtype=np.int64)
+    max_idx = np.empty(stoch_period, dtype=np.int64)
+    min_head = 0
+    min_tail = 0
+    max_head = 0
+    max_tail = 0
+    last_nan = -1
+    for i in range(n):
+        start = i - stoch_period + 1
+        
+        # Descarta índices que saíram da janela (antes de inserir: cabe no buffer)
+        while min_head < min_tail and min_idx[min_head % stoch_period] < start:
+            min_head += 1
+        while max_head < max_tail and max_idx[max_head % stoch_period] < start:
+            max_head += 1
+        
+        value = rsi[i]
+        if np.isnan(value):
+            last_nan = i
+        else:
+            while min_head < min_tail and rsi[min_idx[(min_tail - 1) % stoch_period]] >= value:
+                min_tail -= 1
+            min_idx[min_tail % stoch_period] = i
+            min_tail += 1
+            
+            while max_head < max_tail and rsi[max_idx[(max_tail - 1) % stoch_period]] <= value:
+                max_tail -= 1
+            max_idx[max_tail % stoch_period] = i
+            max_tail += 1
+        
+        if start >= 0 and last_nan < start:
+            low = rsi[min_idx[min_head % stoch_period]]
+            high = rsi[max_idx[max_head % stoch_period]]
+            range_rsi = high - low
+            stoch[i] = (value - low) / range_rsi if range_rsi != 0 else 0.0
+    
+    # %K e %D: médias móveis simples
+    for i in range(k_period - 1, n):
+        total = 0.0
+        for j in range(i - k_period + 1, i + 1):
+            total += stoch[j]
+        k_out[i] = total / k_period * 100
+    
+    for i in range(d_period - 1, n):
+        total = 0.0
+        for j in range(i - d_period + 1, i + 1):
+            total += k_out[j]
+        d_out[i] = total / d_period
+
+def _warm_up_stochrsi_kernel():
+    """
+    Compila o kernel StochRSI (ou carrega do cache do numba) na importação.
+    
+    Usa os mesmos tipos de calculate_stochrsi, então a primeira matriz do
+    dashboard não paga a compilação JIT.
+    """
+    close = np.linspace(1.0, 2.0, 8)
+    _stochrsi_kernel(close, 2, 2, 2, 2, np.empty(8), np.empty(8))
+
+if NUMBA_AVAILABLE:
+    try:
+        _warm_up_stochrsi_kernel()
+    except Exception as e:
+        logger.warning(f"Falha ao pré-compilar o kernel StochRSI: {e}")
+
 class StochRSIIndicator:
     """
     Classe para calcular o indicador StochRSI.
@@ -99,27 +213,17 @@ class StochRSIIndicator:
                 logger.warning(f"Considere aumentar o período de coleta de dados ou usar brick_size menor no Renko")
                 return pd.DataFrame(index=prices.index, columns=['stochrsi_k', 'stochrsi_d'])
             
-            # Calcula RSI
-            rsi_values = self.calculate_rsi(prices)
-            
-            # Calcula Stochastic do RSI
-            min_rsi = rsi_values.rolling(window=self.stoch_period).min()
-            max_rsi = rsi_values.rolling(window=self.stoch_period).max()
-            
-            # Evita divisão por zero
-            range_rsi = max_rsi - min_rsi
-            stoch_rsi = np.where(range_rsi != 0, 
-                               (rsi_values - min_rsi) / range_rsi, 
-                               0)
-            
-            # Suaviza %K e %D
-            k_values = pd.Series(stoch_rsi, index=prices.index).rolling(window=self.k_period).mean() * 100
-            d_values = k_values.rolling(window=self.d_period).mean()
+            # RSI, Stochastic e suavizações em uma única passada compilada
+            close = np.ascontiguousarray(prices.to_numpy(dtype=np.float64))
+            k_values = np.empty(close.size, dtype=np.float64)
+            d_values = np.empty(close.size, dtype=np.float64)
+            _stochrsi_kernel(close, self.rsi_period, self.stoch_period,
+                             self.k_period, self.d_period, k_values, d_values)
             
             result = pd.DataFrame({
                 'stochrsi_k': k_values,
                 'stochrsi_d': d_values
-            })
+            }, index=prices.index)
             
             logger.info(f"StochRSI calculado para {len(result)} períodos")
             return result
@@ -222,3 +326,73 @@ def stochrsi(series: pd.Series, rsi_window: int = 14, stoch_window: int = 14,
         d_period=smooth_d
     )
     return indicator.calculate_stochrsi(series)
+
+def stochrsi_panel(closes: pd.Series, rsi_window: int = 14, stoch_window: int = 14,
+                   smooth_k: int = 3, smooth_d: int = 3) -> pd.DataFrame:
+    """
+    Calcula o StochRSI de várias séries de uma vez (formato longo).
+    
+    As séries ficam concatenadas e cada janela móvel roda uma única vez sobre o
+    array inteiro; todos os níveis do índice, exceto o último, identificam a
+    série (ex.: symbol, tf). As primeiras linhas de cada grupo, cujas janelas cruzariam a
+    fronteira com o grupo anterior, viram NaN, então o resultado equivale a
+    chamar stochrsi() em cada grupo separadamente.
+    
+    Args:
+        closes: Série de preços com MultiIndex (séries contíguas, posição no último nível)
+        rsi_window: Período do RSI
+        stoch_window: Período do Stochastic
+        smooth_k: Suavização do %K
+        smooth_d: Suavização do %D
+    
+    Returns:
+        DataFrame com %K e %D do StochRSI no mesmo índice de closes
+    """
+    try:
+        series_levels = list(range(closes.index.nlevels - 1))
+        grouped = closes.groupby(level=series_levels, sort=False)
+        position = grouped.cumcount().to_numpy()
+        group_size = grouped.transform('size').to_numpy()
+        
+        def rolling(values: pd.Series, window: int, method: str, offset: int) -> pd.Series:
+            # offset: primeira posição válida do insumo dentro do grupo
+            result = getattr(values.rolling(window=window), method)()
+            return result.where(position >= offset + window - 1)
+        
+        # Primeira diferença de cada grupo é zerada, como em calculate_rsi
+        delta = closes.diff().where(position > 0)
+        gains = delta.where(delta > 0, 0)
+        losses = -delta.where(delta < 0, 0)
+        
+        avg_gains = rolling(gains, rsi_window, 'mean', 0)
+        avg_losses = rolling(losses, rsi_window, 'mean', 0)
+        rsi_values = 100 - (100 / (1 + avg_gains / avg_losses))
+        
+        rsi_offset = rsi_window - 1
+        min_rsi = rolling(rsi_values, stoch_window, 'min', rsi_offset)
+        max_rsi = rolling(rsi_values, stoch_window, 'max', rsi_offset)
+        
+        # Evita divisão por zero
+        range_rsi = max_rsi - min_rsi
+        stoch_rsi = pd.Series(
+            np.where(range_rsi != 0, (rsi_values - min_rsi) / range_rsi, 0),
+            index=closes.index
+        )
+        
+        stoch_offset = rsi_offset + stoch_window - 1
+        k_values = rolling(stoch_rsi, smooth_k, 'mean', stoch_offset) * 100
+        d_values = rolling(k_values, smooth_d, 'mean', stoch_offset + smooth_k - 1)
+        
+        result = pd.DataFrame({
+            'stochrsi_k': k_values,
+            'stochrsi_d': d_values
+        })
+        
+        # Mesmo critério de dados mínimos de calculate_stochrsi, por grupo
+        min_data_required = rsi_window + stoch_window + smooth_k + smooth_d
+        result.loc[group_size < min_data_required] = np.nan
+        return result
+        
+    except Exception as e:
+        logger.error(f"Erro ao calcular StochRSI em lote: {e}")
+        return pd.DataFrame(index=closes.index, columns=['stochrsi_k', 'stochrsi_d'])
@@ -7,8 +7,9 @@ Utilitários para trabalhar com timeframes e fallback automático.
 
 import pandas as pd
 import logging
+import time
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,37 @@ def get_timeframe_minutes(timeframe: str) -> int:
     """
     return TIMEFRAME_MINUTES.get(timeframe, 60)  # Default para 1h
 
+# Segunda-feira 1970-01-05 00:00 UTC: candles semanais da Binance abrem às segundas
+WEEK_ANCHOR_SECONDS = 4 * 86400
+
+def candle_open_time(interval: str, now: Optional[float] = None) -> float:
+    """
+    Retorna o timestamp (epoch, segundos) de abertura do candle atual.
+    
+    Intervalos fixos são alinhados ao epoch; o semanal abre na segunda-feira
+    00:00 UTC e o mensal no dia 1 do mês, 00:00 UTC, como na Binance.
+    
+    Args:
+        interval: Intervalo de tempo (ex: '15m', '1h', '1d')
+        now: Timestamp de referência (opcional, padrão: agora)
+    
+    Returns:
+        Início do candle em andamento, alinhado ao intervalo
+    """
+    if now is None:
+        now = time.time()
+    
+    if interval == '1M':
+        month_start = datetime.fromtimestamp(now, tz=timezone.utc).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        return month_start.timestamp()
+    
+    seconds = get_timeframe_minutes(interval) * 60
+    if interval == '1w':
+        return now - ((now - WEEK_ANCHOR_SECONDS) % seconds)
+    return now - (now % seconds)
+
 def get_next_timeframe(current_timeframe: str) -> Optional[str]:
     """
     Retorna o próximo timeframe maior na sequência de fallback.
@@ -0,0 +1,12 @@
+"""
+Configuração do pytest
+======================
+
+Coloca a raiz do projeto no sys.path, como fazem os scripts do sistema, para
+que os testes importem src, config e dashboard diretamente.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -0,0 +1,76 @@
+"""
+Testes do ATR (True Range + suavização de Wilder) contra a implementação
+pandas original com laço em .iloc.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.indicators.atr import _wilder_atr, calculate_atr, calculate_true_range
+
+
+def reference_true_range(high, low, close):
+    close_prev = close.shift(1)
+    tr1 = high - low
+    tr2 = np.abs(high - close_prev)
+    tr3 = np.abs(low - close_prev)
+    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+
+def reference_atr(high, low, close, period=14):
+    """ATR como era calculado antes do kernel compilado."""
+    true_range = reference_true_range(high, low, close)
+    atr = pd.Series(index=true_range.index, dtype=float)
+    if len(true_range) >= period:
+        atr.iloc[period - 1] = true_range.iloc[:period].mean()
+        for i in range(period, len(true_range)):
+            atr.iloc[i] = (atr.iloc[i - 1] * (period - 1) + true_range.iloc[i]) / period
+    return atr
+
+
+def random_ohlc(seed, n=300):
+    rng = np.random.default_rng(seed)
+    close = pd.Series(30000 + np.cumsum(rng.normal(0, 100, n)))
+    high = close + rng.uniform(0, 80, n)
+    low = close - rng.uniform(0, 80, n)
+    return high, low, close
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_true_range_matches_reference(seed):
+    high, low, close = random_ohlc(seed)
+
+    pd.testing.assert_series_equal(
+        calculate_true_range(high, low, close), reference_true_range(high, low, close), check_names=False
+    )
+
+
+@pytest.mark.parametrize('seed', range(3))
+@pytest.mark.parametrize('period', [1, 5, 14, 50])
+def test_atr_matches_reference(seed, period):
+    high, low, close = random_ohlc(seed)
+
+    result = calculate_atr(high, low, close, period)
+    expected = reference_atr(high, low, close, period)
+
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+def test_wilder_kernel_recurrence():
+    true_range = np.array([2.0, 4.0, 6.0, 8.0, 10.0])
+    out = np.empty(5)
+
+    _wilder_atr(true_range, 3, 4.0, out)
+
+    assert np.isnan(out[:2]).all()
+    np.testing.assert_allclose(out[2:], [4.0, (4.0 * 2 + 8.0) / 3, ((4.0 * 2 + 8.0) / 3 * 2 + 10.0) / 3])
+
+
+def test_short_series_has_no_atr():
+    high, low, close = random_ohlc(0, n=10)
+
+    result = calculate_atr(high, low, close, 14)
+
+    assert len(result) == 10
+    assert result.isna().all()
@@ -0,0 +1,154 @@
+"""
+Testes dos sinais e filtros vetorizados do dashboard contra a lógica original
+por célula (get_signal / apply_stoch_filter), e da faixa sem tijolo novo usada
+no reaproveitamento por snapshot de preços.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.dashboard import (
+    SIGNAL_LABELS, build_stoch_cells, renko_price_in_band, signal_codes, stoch_filter_mask
+)
+from src.indicators.renko import _renko_frame
+
+
+def reference_signal(k_value, d_value):
+    if k_value < 20 and d_value < 20:
+        return "🟢 Oversold"
+    elif k_value > 80 and d_value > 80:
+        return "🔴 Overbought"
+    elif k_value > d_value:
+        return "⬆️ Bullish"
+    else:
+        return "⬇️ Bearish"
+
+
+def reference_filter(matriz_stoch, stoch_filter):
+    """apply_stoch_filter original (sem show_signals_only): pares aprovados."""
+    passed = []
+    for symbol, intervals_data in matriz_stoch.items():
+        values = []
+        for tf in stoch_filter['filter_timeframes']:
+            if intervals_data.get(tf) is None:
+                break
+            values.append(intervals_data[tf]['StochRSI_%K'])
+        else:
+            if stoch_filter['enable_above'] and not all(v >= stoch_filter['value_above'] for v in values):
+                continue
+            if stoch_filter['enable_below'] and not all(v <= stoch_filter['value_below'] for v in values):
+                continue
+            if stoch_filter['enable_extremos'] and not all(
+                v <= stoch_filter['extremos_min'] or v >= stoch_filter['extremos_max'] for v in values
+            ):
+                continue
+            if stoch_filter['enable_intervalo'] and not all(
+                stoch_filter['intervalo_min'] <= v <= stoch_filter['intervalo_max'] for v in values
+            ):
+                continue
+            passed.append(symbol)
+    return passed
+
+
+def test_signal_codes_match_reference():
+    grid = [0.0, 10.0, 19.99, 20.0, 20.01, 50.0, 79.99, 80.0, 80.01, 95.0, 100.0]
+    k_values, d_values = map(np.array, zip(*itertools.product(grid, grid)))
+
+    codes = signal_codes(k_values, d_values)
+
+    assert codes.dtype == np.uint8
+    assert [SIGNAL_LABELS[code] for code in codes] == [
+        reference_signal(k, d) for k, d in zip(k_values, d_values)
+    ]
+
+
+def random_matrix(seed, n_pairs=200, intervals=('15m', '1h', '4h', '1d')):
+    rng = np.random.default_rng(seed)
+    matriz_stoch = {}
+    for row in range(n_pairs):
+        cells = {}
+        for tf in intervals:
+            if rng.random() < 0.05:
+                continue  # célula ausente
+            k_value = round(float(rng.choice([rng.uniform(0, 100), rng.integers(0, 101)])), 2)
+            d_value = round(float(rng.uniform(0, 100)), 2)
+            cells[tf] = {
+                "StochRSI_%K": k_value,
+                "StochRSI_%D": d_value,
+                "Signal": reference_signal(k_value, d_value),
+                "Data_Points": 100
+            }
+        matriz_stoch[f"PAIR{row}USDT"] = cells
+    return matriz_stoch
+
+
+FILTERS = [
+    dict(enable_above=True, value_above=50),
+    dict(enable_below=True, value_below=30),
+    dict(enable_extremos=True, extremos_min=20, extremos_max=80),
+    dict(enable_intervalo=True, intervalo_min=25, intervalo_max=75),
+    dict(enable_above=True, value_above=20, enable_below=True, value_below=90),
+    dict(enable_extremos=True, extremos_min=30, extremos_max=70, enable_intervalo=True, intervalo_min=0, intervalo_max=40),
+    dict(),
+]
+
+
+@pytest.mark.parametrize('seed', range(3))
+@pytest.mark.parametrize('enabled', FILTERS)
+@pytest.mark.parametrize('filter_timeframes', [['1h'], ['15m', '4h'], ['15m', '1h', '4h', '1d'], ['1h', '3d']])
+def test_stoch_filter_mask_matches_reference(seed, enabled, filter_timeframes):
+    matriz_stoch = random_matrix(seed)
+    stoch_filter = {
+        'enable_above': False, 'value_above': None,
+        'enable_below': False, 'value_below': None,
+        'enable_extremos': False, 'extremos_min': None, 'extremos_max': None,
+        'enable_intervalo': False, 'intervalo_min': None, 'intervalo_max': None,
+        'filter_timeframes': filter_timeframes,
+        **enabled
+    }
+
+    # Mesma seleção de colunas de apply_stoch_filter
+    timeframes, cells = build_stoch_cells(matriz_stoch)
+    columns = [timeframes.get(tf, -1) for tf in filter_timeframes]
+    passed = stoch_filter_mask(cells['k'][:, columns], stoch_filter)
+
+    symbols = list(matriz_stoch)
+    assert [symbols[row] for row in np.flatnonzero(passed)] == reference_filter(matriz_stoch, stoch_filter)
+
+
+def test_price_band_follows_renko_reversal_rule():
+    up = pd.Series([100.0, 110.0, 120.0])
+    assert renko_price_in_band(up, 129.9)
+    assert not renko_price_in_band(up, 130.0)
+    assert renko_price_in_band(up, 100.1)
+    assert not renko_price_in_band(up, 100.0)
+
+    down = pd.Series([120.0, 110.0, 100.0])
+    assert renko_price_in_band(down, 90.1)
+    assert not renko_price_in_band(down, 90.0)
+    assert renko_price_in_band(down, 119.9)
+    assert not renko_price_in_band(down, 120.0)
+
+    # Reversão: o fechamento anda dois tijolos, mas o brick continua 10
+    reversal = pd.Series([100.0, 110.0, 120.0, 100.0])
+    assert renko_price_in_band(reversal, 90.1)
+    assert not renko_price_in_band(reversal, 90.0)
+    assert not renko_price_in_band(reversal, 120.0)
+
+    assert not renko_price_in_band(pd.Series([100.0]), 100.0)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_price_band_agrees_with_renko_kernel(seed):
+    # Dentro da faixa <=> fechar no preço atual não gera tijolo novo
+    rng = np.random.default_rng(seed)
+    close = pd.Series(1000 + np.cumsum(rng.normal(0, 8, 200)))
+    bricks = _renko_frame(close.index, close, 10.0)
+
+    for price in close.iloc[-1] + rng.uniform(-40, 40, 200):
+        extended = pd.concat([close, pd.Series([price])], ignore_index=True)
+        unchanged = len(_renko_frame(extended.index, extended, 10.0)) == len(bricks)
+        assert renko_price_in_band(bricks['close'], price) == unchanged
@@ -0,0 +1,148 @@
+"""
+Testes do token bucket e do controle AIMD (src/api/rate_limit.py).
+
+O relógio é substituído por um relógio falso, então os testes não dormem.
+"""
+
+import pytest
+
+from src.api import rate_limit
+from src.api.rate_limit import AIMDController, TokenBucket, TokenBucketLimiter
+
+
+class FakeClock:
+    """Relógio monotônico controlado pelo teste; sleep apenas avança o tempo."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, 'time', fake)
+    return fake
+
+
+def test_bucket_starts_full_and_refills_up_to_capacity(clock):
+    bucket = TokenBucket(capacity=5, rate=2)
+    assert bucket.tokens == 5
+    assert bucket.wait_time(5) == 0.0
+
+    bucket.consume(5)
+    assert bucket.wait_time(1) == pytest.approx(0.5)
+
+    clock.now += 1.0
+    bucket.refill(clock.now)
+    assert bucket.tokens == pytest.approx(2.0)
+
+    clock.now += 100.0
+    bucket.refill(clock.now)
+    assert bucket.tokens == 5
+
+
+def test_limiter_consumes_from_every_bucket(clock):
+    burst = TokenBucket(capacity=3, rate=3)
+    minute = TokenBucket(capacity=10, rate=10 / 60)
+    limiter = TokenBucketLimiter(burst, minute)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    assert clock.sleeps == []
+    assert burst.tokens == pytest.approx(0.0)
+    assert minute.tokens == pytest.approx(7.0)
+
+
+def test_limiter_waits_for_the_slowest_bucket(clock):
+    burst = TokenBucket(capacity=1, rate=10)
+    minute = TokenBucket(capacity=1, rate=1 / 60)
+    limiter = TokenBucketLimiter(burst, minute)
+
+    limiter.acquire()
+    limiter.acquire()
+
+    # O balde por minuto leva 60 s para repor um token
+    assert sum(clock.sleeps) == pytest.approx(60.0)
+
+
+def test_limiter_pause_blocks_until_deadline(clock):
+    limiter = TokenBucketLimiter(TokenBucket(capacity=10, rate=10))
+    limiter.pause(30.0)
+    limiter.pause(5.0)  # Pausa menor não encurta a atual
+
+    limiter.acquire()
+
+    assert sum(clock.sleeps) == pytest.approx(30.0)
+
+
+def test_aimd_throttle_halves_rate_with_floor(clock):
+    bucket = TokenBucket(capacity=16, rate=16)
+    controller = AIMDController(bucket, max_rate=16, decrease=0.5, min_rate=1.0)
+
+    rates = []
+    for _ in range(6):
+        controller.on_throttle()
+        rates.append(bucket.rate)
+
+    assert rates == [8.0, 4.0, 2.0, 1.0, 1.0, 1.0]
+    assert controller.current_rate == 1.0
+
+
+def test_aimd_backoff_is_exponential_with_jitter_and_capped(clock):
+    controller = AIMDController(TokenBucket(capacity=1, rate=1), max_rate=1,
+                                backoff_base=1.0, backoff_max=20.0)
+
+    for attempt in range(8):
+        delay = controller.on_throttle()
+        expected = 2 ** attempt
+        if expected * 0.75 >= 20.0:
+            assert delay == 20.0
+        else:
+            assert expected * 0.75 <= delay <= min(expected * 1.25, 20.0)
+
+
+def test_aimd_success_increases_rate_additively_and_resets_backoff(clock):
+    bucket = TokenBucket(capacity=10, rate=10)
+    controller = AIMDController(bucket, max_rate=10, increase=2.0, decrease=0.5)
+
+    controller.on_throttle()
+    controller.on_throttle()
+    assert bucket.rate == 2.5
+    assert controller.attempt == 2
+
+    controller.on_success()
+    assert bucket.rate == 4.5
+    assert controller.attempt == 0
+
+    for _ in range(10):
+        controller.on_success()
+    assert bucket.rate == 10
+
+
+def test_aimd_reset_restores_max_rate(clock):
+    bucket = TokenBucket(capacity=10, rate=10)
+    controller = AIMDController(bucket, max_rate=10)
+    controller.on_throttle()
+
+    controller.reset()
+
+    assert bucket.rate == 10
+    assert controller.attempt == 0
+
+
+def test_binance_limiter_uses_config(clock):
+    limiter = rate_limit.create_binance_limiter()
+    per_second, per_minute = limiter.buckets
+
+    assert per_second.capacity == rate_limit.RATE_LIMIT.max_requests_per_second
+    assert per_minute.rate == pytest.approx(rate_limit.RATE_LIMIT.max_requests_per_minute / 60)
+    assert limiter.controller.bucket is per_second
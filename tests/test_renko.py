@@ -0,0 +1,102 @@
+"""
+Testes do kernel Renko contra a referência period_close_bricks do stocktrends.
+
+A referência abaixo reproduz, linha a linha, o algoritmo do stocktrends que o
+RenkoIndicator usava antes do kernel compilado.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.indicators.renko import RenkoIndicator, _renko_frame, gerar_renko
+
+
+def period_close_bricks(dates, closes, brick_size):
+    """Renko.period_close_bricks do stocktrends, sem o DataFrame intermediário."""
+    first = closes[0] // brick_size * brick_size
+    bricks = [(dates[0], first - brick_size, first, first - brick_size, first, True)]
+
+    for date, close in zip(dates, closes):
+        _, _, _, _, close_p1, uptrend = bricks[-1]
+        count = int((close - close_p1) / brick_size)
+        data = []
+
+        if uptrend and count >= 1:
+            for _ in range(count):
+                data.append((date, close_p1, close_p1 + brick_size, close_p1, close_p1 + brick_size, uptrend))
+                close_p1 += brick_size
+        elif uptrend and count <= -2:
+            uptrend = not uptrend
+            count += 1
+            close_p1 -= brick_size
+            for _ in range(abs(count)):
+                data.append((date, close_p1, close_p1, close_p1 - brick_size, close_p1 - brick_size, uptrend))
+                close_p1 -= brick_size
+        elif not uptrend and count <= -1:
+            for _ in range(abs(count)):
+                data.append((date, close_p1, close_p1, close_p1 - brick_size, close_p1 - brick_size, uptrend))
+                close_p1 -= brick_size
+        elif not uptrend and count >= 2:
+            uptrend = not uptrend
+            count -= 1
+            close_p1 += brick_size
+            for _ in range(abs(count)):
+                data.append((date, close_p1, close_p1 + brick_size, close_p1, close_p1 + brick_size, uptrend))
+                close_p1 += brick_size
+        else:
+            continue
+
+        bricks.extend(data)
+
+    return pd.DataFrame(bricks, columns=['date', 'open', 'high', 'low', 'close', 'uptrend'])
+
+
+def random_walk(seed, n=500, start=30000.0, scale=150.0):
+    rng = np.random.default_rng(seed)
+    close = start + np.cumsum(rng.normal(0, scale, n))
+    dates = pd.date_range('2026-01-01', periods=n, freq='15min')
+    return pd.Series(close, index=dates)
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('brick_size', [50.0, 100.0, 333.0])
+def test_renko_frame_matches_stocktrends(seed, brick_size):
+    close = random_walk(seed)
+
+    result = _renko_frame(close.index, close, brick_size)
+    expected = period_close_bricks(close.index.to_numpy(), close.to_numpy(), brick_size)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_renko_frame_handles_gaps_and_reversals():
+    close = pd.Series(
+        [1000.0, 1250.0, 1240.0, 1010.0, 890.0, 1300.0, 1299.0, 700.0],
+        index=pd.date_range('2026-01-01', periods=8, freq='1h')
+    )
+
+    result = _renko_frame(close.index, close, 100.0)
+    expected = period_close_bricks(close.index.to_numpy(), close.to_numpy(), 100.0)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_gerar_renko_fixed_brick_matches_reference():
+    close = random_walk(7)
+    ohlc = pd.DataFrame({
+        'Open': close.shift(1).fillna(close.iloc[0]),
+        'High': close + 10,
+        'Low': close - 10,
+        'Close': close,
+    })
+
+    result = gerar_renko(ohlc, brick_size=200, use_atr=False)
+    expected = period_close_bricks(close.index.to_numpy(), close.to_numpy(), 200.0)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize('brick_size, expected', [(50, 100), (500, 500), (50000, 10000)])
+def test_fixed_brick_size_is_clamped(brick_size, expected):
+    assert RenkoIndicator(brick_size, use_atr=False).brick_size == expected
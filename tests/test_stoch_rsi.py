@@ -0,0 +1,125 @@
+"""
+Testes do kernel StochRSI e do cálculo em lote contra a implementação pandas
+original (calculate_rsi + calculate_stochrsi com rolling).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.indicators.stoch_rsi import _stochrsi_kernel, stochrsi, stochrsi_panel
+
+
+def reference_stochrsi(prices, rsi_period=14, stoch_period=14, k_period=3, d_period=3):
+    """StochRSI como era calculado com pandas antes do kernel compilado."""
+    delta = prices.diff()
+    gains = delta.where(delta > 0, 0)
+    losses = -delta.where(delta < 0, 0)
+
+    avg_gains = gains.rolling(window=rsi_period).mean()
+    avg_losses = losses.rolling(window=rsi_period).mean()
+    rsi = 100 - (100 / (1 + avg_gains / avg_losses))
+
+    min_rsi = rsi.rolling(window=stoch_period).min()
+    max_rsi = rsi.rolling(window=stoch_period).max()
+    range_rsi = max_rsi - min_rsi
+    stoch_rsi = pd.Series(np.where(range_rsi != 0, (rsi - min_rsi) / range_rsi, 0), index=prices.index)
+
+    k_values = stoch_rsi.rolling(window=k_period).mean() * 100
+    d_values = k_values.rolling(window=d_period).mean()
+    return pd.DataFrame({'stochrsi_k': k_values, 'stochrsi_d': d_values})
+
+
+def random_walk(seed, n=400):
+    rng = np.random.default_rng(seed)
+    return pd.Series(100 + np.cumsum(rng.normal(0, 1, n)))
+
+
+def run_kernel(close, rsi_period, stoch_period, k_period, d_period):
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    k_values = np.empty(close.size)
+    d_values = np.empty(close.size)
+    _stochrsi_kernel(close, rsi_period, stoch_period, k_period, d_period, k_values, d_values)
+    return k_values, d_values
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_stochrsi_matches_pandas_reference(seed):
+    prices = random_walk(seed)
+
+    result = stochrsi(prices)
+    expected = reference_stochrsi(prices)
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-9, atol=1e-7)
+
+
+@pytest.mark.parametrize('periods', [(2, 3, 1, 1), (5, 2, 4, 2), (14, 14, 3, 3), (7, 21, 5, 5)])
+def test_kernel_matches_reference_for_other_periods(periods):
+    prices = random_walk(11, n=200)
+
+    k_values, d_values = run_kernel(prices.to_numpy(), *periods)
+    expected = reference_stochrsi(prices, *periods)
+
+    np.testing.assert_allclose(k_values, expected['stochrsi_k'], rtol=1e-9, atol=1e-7)
+    np.testing.assert_allclose(d_values, expected['stochrsi_d'], rtol=1e-9, atol=1e-7)
+
+
+def test_kernel_without_losses_gives_rsi_100():
+    # Sem perdas: RSI exatamente 100, amplitude zero e %K/%D zerados
+    prices = pd.Series(np.arange(1.0, 61.0))
+
+    k_values, d_values = run_kernel(prices.to_numpy(), 14, 14, 3, 3)
+    expected = reference_stochrsi(prices)
+
+    np.testing.assert_array_equal(k_values, expected['stochrsi_k'])
+    np.testing.assert_array_equal(d_values, expected['stochrsi_d'])
+    assert k_values[-1] == 0.0
+
+
+def test_kernel_propagates_undefined_rsi_windows():
+    # Trecho sem variação: RSI indefinido (0/0) e NaN em todas as janelas que o tocam
+    prices = random_walk(3, n=120)
+    prices.iloc[40:70] = prices.iloc[40]
+
+    k_values, d_values = run_kernel(prices.to_numpy(), 14, 14, 3, 3)
+    expected = reference_stochrsi(prices)
+
+    np.testing.assert_allclose(k_values, expected['stochrsi_k'], rtol=1e-9, atol=1e-7)
+    np.testing.assert_allclose(d_values, expected['stochrsi_d'], rtol=1e-9, atol=1e-7)
+    assert np.isnan(k_values[70:75]).all()
+
+
+def test_kernel_treats_missing_closes_as_no_change():
+    prices = random_walk(5, n=150)
+    prices.iloc[[30, 31, 90]] = np.nan
+
+    k_values, d_values = run_kernel(prices.to_numpy(), 14, 14, 3, 3)
+    expected = reference_stochrsi(prices)
+
+    np.testing.assert_allclose(k_values, expected['stochrsi_k'], rtol=1e-9, atol=1e-7)
+    np.testing.assert_allclose(d_values, expected['stochrsi_d'], rtol=1e-9, atol=1e-7)
+
+
+def test_short_series_returns_empty_columns():
+    result = stochrsi(random_walk(0, n=20))
+
+    assert list(result.columns) == ['stochrsi_k', 'stochrsi_d']
+    assert result.isna().all().all()
+
+
+def test_panel_matches_per_series_stochrsi():
+    series = {
+        ('BTCUSDT', '1h'): random_walk(1, n=300),
+        ('ETHUSDT', '1h'): random_walk(2, n=120),
+        ('ETHUSDT', '4h'): random_walk(3, n=25),   # abaixo do mínimo: tudo NaN
+        ('SOLUSDT', '15m'): random_walk(4, n=60),
+    }
+    panel = pd.concat(series, names=['symbol', 'tf', 'pos'])
+
+    result = stochrsi_panel(panel)
+
+    for key, prices in series.items():
+        expected = stochrsi(prices).astype(float)
+        got = result.xs(key, level=['symbol', 'tf'])
+        np.testing.assert_allclose(got['stochrsi_k'], expected['stochrsi_k'], rtol=1e-9, atol=1e-7)
+        np.testing.assert_allclose(got['stochrsi_d'], expected['stochrsi_d'], rtol=1e-9, atol=1e-7)
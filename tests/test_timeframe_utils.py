@@ -0,0 +1,72 @@
+"""
+Testes do alinhamento de candles e da validade do cache de klines.
+"""
+
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from src.data.data_manager import DataManager
+from src.utils.timeframe_utils import candle_open_time
+
+
+def utc(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.mark.parametrize('interval, now, expected', [
+    ('1m', utc(2026, 10, 16, 15, 30, 42), utc(2026, 10, 16, 15, 30)),
+    ('15m', utc(2026, 10, 16, 15, 44, 59), utc(2026, 10, 16, 15, 30)),
+    ('1h', utc(2026, 10, 16, 15, 0), utc(2026, 10, 16, 15, 0)),
+    ('4h', utc(2026, 10, 16, 15, 30), utc(2026, 10, 16, 12, 0)),
+    ('1d', utc(2026, 10, 16, 23, 59, 59), utc(2026, 10, 16)),
+])
+def test_candle_open_time_fixed_intervals(interval, now, expected):
+    assert candle_open_time(interval, now) == expected
+
+
+@pytest.mark.parametrize('now, expected', [
+    (utc(2026, 10, 16, 15, 30), utc(2026, 10, 12)),   # sexta -> segunda anterior
+    (utc(2026, 10, 12), utc(2026, 10, 12)),           # exatamente na abertura
+    (utc(2026, 10, 11, 23, 59), utc(2026, 10, 5)),    # domingo ainda é a semana anterior
+    (utc(1970, 1, 5, 12), utc(1970, 1, 5)),
+])
+def test_candle_open_time_weekly_opens_on_monday(now, expected):
+    opened = candle_open_time('1w', now)
+
+    assert opened == expected
+    assert datetime.fromtimestamp(opened, tz=timezone.utc).weekday() == 0
+
+
+@pytest.mark.parametrize('now, expected', [
+    (utc(2026, 10, 16, 15, 30), utc(2026, 10, 1)),
+    (utc(2026, 3, 1), utc(2026, 3, 1)),
+    (utc(2026, 2, 28, 23, 59, 59), utc(2026, 2, 1)),
+    (utc(2026, 12, 31, 23), utc(2026, 12, 1)),
+])
+def test_candle_open_time_monthly_opens_on_first_day(now, expected):
+    assert candle_open_time('1M', now) == expected
+
+
+def cache_validity(cache_file, interval):
+    # _is_cache_valid não usa o cliente; evita o __init__ que o cria
+    manager = object.__new__(DataManager)
+    return manager._is_cache_valid(str(cache_file), interval)
+
+
+def test_cache_is_invalid_when_file_is_missing(tmp_path):
+    assert not cache_validity(tmp_path / 'missing.pkl', '1h')
+
+
+@pytest.mark.parametrize('interval', ['1m', '1h', '1d', '1w', '1M'])
+def test_cache_is_valid_only_within_current_candle(tmp_path, interval):
+    cache_file = tmp_path / f'BTCUSDT_{interval}.pkl'
+    cache_file.write_bytes(b'')
+    opened = candle_open_time(interval)
+
+    os.utime(cache_file, (opened + 1, opened + 1))
+    assert cache_validity(cache_file, interval)
+
+    os.utime(cache_file, (opened - 1, opened - 1))
+    assert not cache_validity(cache_file, interval)